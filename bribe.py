@@ -38,18 +38,25 @@ class Types:
     ).layout(("epoch", "bribe_id"))
 
     EPOCH_BRIBES_VALUE = sp.TRecord(
-        provider=sp.TAddress,
-        bribe=sp.TRecord(
-            type=TOKEN_VARIANT,
-            value=sp.TNat,
-        ).layout(("type", "value")),
-    ).layout(("provider", "bribe"))
+        type=TOKEN_VARIANT,
+        value=sp.TNat,
+    ).layout(("type", "value"))
+
+    EPOCH_TOKEN_BRIBE_KEY = sp.TRecord(
+        epoch=sp.TNat,
+        type=TOKEN_VARIANT,
+    ).layout(("epoch", "type"))
 
     CLAIM_LEDGER_KEY = sp.TRecord(
         token_id=sp.TNat,
         bribe_id=sp.TNat,
     ).layout(("token_id", "bribe_id"))
 
+    BRIBE_PROVIDERS_KEY = sp.TRecord(
+        bribe_id=sp.TNat,
+        provider=sp.TAddress,
+    ).layout(("bribe_id", "provider"))
+
     # param types
 
     ADD_BRIBE_PARAMS = sp.TRecord(
@@ -58,6 +65,13 @@ class Types:
         value=sp.TNat,
     ).layout(("epoch", ("type", "value")))
 
+    ADD_BRIBES_PARAMS = sp.TRecord(
+        start_epoch=sp.TNat,
+        end_epoch=sp.TNat,
+        type=TOKEN_VARIANT,
+        value=sp.TNat,
+    ).layout(("start_epoch", ("end_epoch", ("type", "value"))))
+
     CLAIM_PARAMS = sp.TRecord(
         token_id=sp.TNat,
         owner=sp.TAddress,
@@ -66,6 +80,25 @@ class Types:
         vote_share=sp.TNat,
     ).layout(("token_id", ("owner", ("epoch", ("bribe_id", "vote_share")))))
 
+    CLAIM_MANY_PARAMS = sp.TRecord(
+        token_id=sp.TNat,
+        owner=sp.TAddress,
+        claims=sp.TList(
+            sp.TRecord(
+                epoch=sp.TNat,
+                bribe_id=sp.TNat,
+                vote_share=sp.TNat,
+            ).layout(("epoch", ("bribe_id", "vote_share")))
+        ),
+    ).layout(("token_id", ("owner", "claims")))
+
+    CLAIM_EPOCH_PARAMS = sp.TRecord(
+        token_id=sp.TNat,
+        owner=sp.TAddress,
+        epoch=sp.TNat,
+        vote_share=sp.TNat,
+    ).layout(("token_id", ("owner", ("epoch", "vote_share"))))
+
 
 ###########
 # Contract
@@ -87,12 +120,42 @@ class Bribe(sp.Contract):
             tkey=Types.CLAIM_LEDGER_KEY,
             tvalue=sp.TUnit,
         ),
+        epoch_bribe_ids=sp.big_map(
+            l={},
+            tkey=sp.TNat,
+            tvalue=sp.TSet(sp.TNat),
+        ),
+        epoch_token_bribe=sp.big_map(
+            l={},
+            tkey=Types.EPOCH_TOKEN_BRIBE_KEY,
+            tvalue=sp.TNat,
+        ),
+        bribe_providers=sp.big_map(
+            l={},
+            tkey=Types.BRIBE_PROVIDERS_KEY,
+            tvalue=sp.TNat,
+        ),
+        returned_bribes=sp.big_map(
+            l={},
+            tkey=sp.TNat,
+            tvalue=sp.TUnit,
+        ),
+        claimed_shares=sp.big_map(
+            l={},
+            tkey=sp.TNat,
+            tvalue=sp.TNat,
+        ),
     ):
         self.init(
             uid=uid,
             voter=voter,
             epoch_bribes=epoch_bribes,
             claim_ledger=claim_ledger,
+            epoch_bribe_ids=epoch_bribe_ids,
+            epoch_token_bribe=epoch_token_bribe,
+            bribe_providers=bribe_providers,
+            returned_bribes=returned_bribes,
+            claimed_shares=claimed_shares,
         )
 
         self.init_type(
@@ -101,38 +164,48 @@ class Bribe(sp.Contract):
                 voter=sp.TAddress,
                 epoch_bribes=sp.TBigMap(Types.EPOCH_BRIBES_KEY, Types.EPOCH_BRIBES_VALUE),
                 claim_ledger=sp.TBigMap(Types.CLAIM_LEDGER_KEY, sp.TUnit),
+                epoch_bribe_ids=sp.TBigMap(sp.TNat, sp.TSet(sp.TNat)),
+                epoch_token_bribe=sp.TBigMap(Types.EPOCH_TOKEN_BRIBE_KEY, sp.TNat),
+                bribe_providers=sp.TBigMap(Types.BRIBE_PROVIDERS_KEY, sp.TNat),
+                returned_bribes=sp.TBigMap(sp.TNat, sp.TUnit),
+                claimed_shares=sp.TBigMap(sp.TNat, sp.TNat),
             )
         )
 
-    @sp.entry_point
-    def add_bribe(self, params):
+    @sp.private_lambda(with_storage="read-write", wrap_call=True)
+    def insert_bribe(self, params):
         sp.set_type(params, Types.ADD_BRIBE_PARAMS)
 
-        # Get current epoch from Voter
-        epoch_ = sp.compute(
-            sp.view(
-                "get_current_epoch",
-                self.data.voter,
-                sp.unit,
-                sp.TPair(sp.TNat, sp.TTimestamp),
-            ).open_some(Errors.INVALID_VIEW)
-        )
-
-        # Sanity checks
-        sp.verify(
-            (params.epoch > sp.fst(epoch_)) | ((params.epoch == sp.fst(epoch_)) & (sp.now < sp.snd(epoch_))),
-            Errors.EPOCH_IN_THE_PAST,
-        )
-
-        # Insert bribe in storage
-        self.data.uid += 1
-        self.data.epoch_bribes[sp.record(epoch=params.epoch, bribe_id=self.data.uid)] = sp.record(
-            provider=sp.sender,
-            bribe=sp.record(
+        # Bribes of the same token in an epoch are pooled under a single bribe id
+        token_key = sp.compute(sp.record(epoch=params.epoch, type=params.type))
+        bribe_id = sp.local("bribe_id", 0)
+
+        with sp.if_(self.data.epoch_token_bribe.contains(token_key)):
+            # Top up the existing bribe
+            bribe_id.value = self.data.epoch_token_bribe[token_key]
+            self.data.epoch_bribes[sp.record(epoch=params.epoch, bribe_id=bribe_id.value)].value += params.value
+        with sp.else_():
+            # Insert bribe in storage
+            self.data.uid += 1
+            bribe_id.value = self.data.uid
+            self.data.epoch_bribes[sp.record(epoch=params.epoch, bribe_id=bribe_id.value)] = sp.record(
                 type=params.type,
                 value=params.value,
-            ),
-        )
+            )
+            self.data.epoch_token_bribe[token_key] = bribe_id.value
+
+            # Index the bribe under its epoch
+            bribe_ids = sp.local("bribe_ids", self.data.epoch_bribe_ids.get(params.epoch, sp.set(l=[], t=sp.TNat)))
+            bribe_ids.value.add(bribe_id.value)
+            self.data.epoch_bribe_ids[params.epoch] = bribe_ids.value
+
+        # Record the contribution of the sender, to be refunded if the bribe is returned
+        provider_key = sp.compute(sp.record(bribe_id=bribe_id.value, provider=sp.sender))
+        self.data.bribe_providers[provider_key] = self.data.bribe_providers.get(provider_key, 0) + params.value
+
+    @sp.private_lambda(with_operations=True, wrap_call=True)
+    def retrieve_bribe(self, params):
+        sp.set_type(params, sp.TRecord(type=Types.TOKEN_VARIANT, value=sp.TNat))
 
         # Retrieve bribe amount from sender
         with params.type.match_cases() as arg:
@@ -160,11 +233,73 @@ class Bribe(sp.Contract):
                 sp.verify(sp.amount == sp.utils.nat_to_mutez(params.value), Errors.INCORRECT_TEZ_VALUE_SENT)
 
     @sp.entry_point
-    def claim(self, params):
-        sp.set_type(params, Types.CLAIM_PARAMS)
+    def add_bribe(self, params):
+        sp.set_type(params, Types.ADD_BRIBE_PARAMS)
+
+        # Get current epoch from Voter
+        epoch_ = sp.compute(
+            sp.view(
+                "get_current_epoch",
+                self.data.voter,
+                sp.unit,
+                sp.TPair(sp.TNat, sp.TTimestamp),
+            ).open_some(Errors.INVALID_VIEW)
+        )
+
+        # Sanity checks
+        sp.verify(
+            (params.epoch > sp.fst(epoch_)) | ((params.epoch == sp.fst(epoch_)) & (sp.now < sp.snd(epoch_))),
+            Errors.EPOCH_IN_THE_PAST,
+        )
+
+        self.insert_bribe(params)
+
+        self.retrieve_bribe(sp.record(type=params.type, value=params.value))
+
+    @sp.entry_point
+    def add_bribes(self, params):
+        sp.set_type(params, Types.ADD_BRIBES_PARAMS)
+
+        # Get current epoch from Voter
+        epoch_ = sp.compute(
+            sp.view(
+                "get_current_epoch",
+                self.data.voter,
+                sp.unit,
+                sp.TPair(sp.TNat, sp.TTimestamp),
+            ).open_some(Errors.INVALID_VIEW)
+        )
+
+        # Sanity checks
+        sp.verify(params.start_epoch <= params.end_epoch, Errors.INVALID_EPOCH_RANGE)
+        sp.verify(
+            (params.start_epoch > sp.fst(epoch_))
+            | ((params.start_epoch == sp.fst(epoch_)) & (sp.now < sp.snd(epoch_))),
+            Errors.EPOCH_IN_THE_PAST,
+        )
+
+        # Insert the bribe for every epoch in the range
+        with sp.for_("epoch", sp.range(params.start_epoch, params.end_epoch + 1)) as epoch:
+            self.insert_bribe(sp.record(epoch=epoch, type=params.type, value=params.value))
+
+        # Retrieve the bribe amount for all the epochs at once
+        num_epochs = sp.as_nat(params.end_epoch - params.start_epoch) + 1
+        self.retrieve_bribe(sp.record(type=params.type, value=params.value * num_epochs))
+
+    @sp.private_lambda(with_storage="read-write", wrap_call=True)
+    def settle_claim(self, params):
+        sp.set_type(
+            params,
+            sp.TRecord(
+                token_id=sp.TNat,
+                epoch=sp.TNat,
+                bribe_id=sp.TNat,
+                vote_share=sp.TNat,
+                payouts=sp.TMap(Types.TOKEN_VARIANT, sp.TNat),
+            ),
+        )
 
         # Sanity checks
-        sp.verify(sp.sender == self.data.voter, Errors.NOT_AUTHORISED)
         sp.verify(
             self.data.epoch_bribes.contains(sp.record(epoch=params.epoch, bribe_id=params.bribe_id)),
             Errors.INVALID_BRIBE_ID_OR_EPOCH,
@@ -174,36 +309,122 @@ class Bribe(sp.Contract):
             Errors.VOTER_HAS_ALREADY_CLAIMED_BRIBE,
         )
 
-        # Calculate bribe share for voter
+        # Calculate bribe share for voter and add it to the payout of the token
+        payouts = sp.local("payouts", params.payouts)
         epoch_bribe = sp.compute(self.data.epoch_bribes[sp.record(epoch=params.epoch, bribe_id=params.bribe_id)])
-        voter_bribe_share = sp.compute((epoch_bribe.bribe.value * params.vote_share) // VOTE_SHARE_MULTIPLIER)
+        voter_bribe_share = (epoch_bribe.value * params.vote_share) // VOTE_SHARE_MULTIPLIER
+        payouts.value[epoch_bribe.type] = payouts.value.get(epoch_bribe.type, 0) + voter_bribe_share
 
-        # Transfer bribe to voter
-        with epoch_bribe.bribe.type.match_cases() as arg:
-            with arg.match("fa12") as address:
-                TokenUtils.transfer_FA12(
-                    sp.record(
-                        from_=sp.self_address,
-                        to_=params.owner,
-                        value=voter_bribe_share,
-                        token_address=address,
+        # Mark the lock token as claimed and record the share of the bribe paid out so far
+        self.data.claim_ledger[sp.record(token_id=params.token_id, bribe_id=params.bribe_id)] = sp.unit
+        self.data.claimed_shares[params.bribe_id] = self.data.claimed_shares.get(params.bribe_id, 0) + params.vote_share
+
+        sp.result(payouts.value)
+
+    @sp.private_lambda(with_operations=True, wrap_call=True)
+    def transfer_payouts(self, params):
+        sp.set_type(params, sp.TRecord(owner=sp.TAddress, payouts=sp.TMap(Types.TOKEN_VARIANT, sp.TNat)))
+
+        # FA2 payouts are collected and sent in a single transfer per token contract
+        fa2_transfers = sp.local("fa2_transfers", [])
+
+        # Transfer a single payout per token to voter
+        with sp.for_("payout", params.payouts.items()) as payout:
+            with payout.key.match_cases() as arg:
+                with arg.match("fa12") as address:
+                    TokenUtils.transfer_FA12(
+                        sp.record(
+                            from_=sp.self_address,
+                            to_=params.owner,
+                            value=payout.value,
+                            token_address=address,
+                        )
                     )
-                )
-            with arg.match("fa2") as fa2_args:
-                TokenUtils.transfer_FA2(
-                    sp.record(
-                        from_=sp.self_address,
-                        to_=params.owner,
-                        amount=voter_bribe_share,
-                        token_address=sp.fst(fa2_args),
-                        token_id=sp.snd(fa2_args),
+                with arg.match("fa2") as fa2_args:
+                    fa2_transfers.value.push(
+                        sp.record(
+                            token_address=sp.fst(fa2_args),
+                            token_id=sp.snd(fa2_args),
+                            to_=params.owner,
+                            amount=payout.value,
+                        )
                     )
+                with arg.match("tez") as _:
+                    with sp.if_(payout.value > 0):
+                        sp.send(params.owner, sp.utils.nat_to_mutez(payout.value))
+
+        TokenUtils.transfer_FA2_batch(sp.record(from_=sp.self_address, transfers=fa2_transfers.value))
+
+    @sp.entry_point
+    def claim(self, params):
+        sp.set_type(params, Types.CLAIM_PARAMS)
+
+        # Sanity checks
+        sp.verify(sp.sender == self.data.voter, Errors.NOT_AUTHORISED)
+
+        payouts = self.settle_claim(
+            sp.record(
+                token_id=params.token_id,
+                epoch=params.epoch,
+                bribe_id=params.bribe_id,
+                vote_share=params.vote_share,
+                payouts=sp.map(l={}, tkey=Types.TOKEN_VARIANT, tvalue=sp.TNat),
+            )
+        )
+
+        self.transfer_payouts(sp.record(owner=params.owner, payouts=payouts))
+
+    @sp.entry_point
+    def claim_many(self, params):
+        sp.set_type(params, Types.CLAIM_MANY_PARAMS)
+
+        # Sanity checks
+        sp.verify(sp.sender == self.data.voter, Errors.NOT_AUTHORISED)
+
+        # Local variable to combine the payouts of bribes that share a token
+        payouts = sp.local("payouts", sp.map(l={}, tkey=Types.TOKEN_VARIANT, tvalue=sp.TNat))
+
+        with sp.for_("claim", params.claims) as claim:
+            payouts.value = self.settle_claim(
+                sp.record(
+                    token_id=params.token_id,
+                    epoch=claim.epoch,
+                    bribe_id=claim.bribe_id,
+                    vote_share=claim.vote_share,
+                    payouts=payouts.value,
                 )
-            with arg.match("tez") as _:
-                sp.send(params.owner, sp.utils.nat_to_mutez(voter_bribe_share))
+            )
 
-        # Mark the lock token as claimed
-        self.data.claim_ledger[sp.record(token_id=params.token_id, bribe_id=params.bribe_id)] = sp.unit
+        self.transfer_payouts(sp.record(owner=params.owner, payouts=payouts.value))
+
+    @sp.entry_point
+    def claim_epoch(self, params):
+        sp.set_type(params, Types.CLAIM_EPOCH_PARAMS)
+
+        # Sanity checks
+        sp.verify(sp.sender == self.data.voter, Errors.NOT_AUTHORISED)
+
+        # Local variable to combine the payouts of bribes that share a token
+        payouts = sp.local("payouts", sp.map(l={}, tkey=Types.TOKEN_VARIANT, tvalue=sp.TNat))
+
+        # Store as local variable to keep on stack
+        bribe_ids = sp.compute(self.data.epoch_bribe_ids.get(params.epoch, sp.set(l=[], t=sp.TNat)))
+
+        with sp.for_("bribe_id", bribe_ids.elements()) as bribe_id:
+            claim_key = sp.compute(sp.record(token_id=params.token_id, bribe_id=bribe_id))
+
+            # Bribes already claimed by the lock token are skipped
+            with sp.if_(~self.data.claim_ledger.contains(claim_key)):
+                # Calculate bribe share for voter
+                epoch_bribe = sp.compute(self.data.epoch_bribes[sp.record(epoch=params.epoch, bribe_id=bribe_id)])
+                voter_bribe_share = (epoch_bribe.value * params.vote_share) // VOTE_SHARE_MULTIPLIER
+                payouts.value[epoch_bribe.type] = payouts.value.get(epoch_bribe.type, 0) + voter_bribe_share
+
+                # Mark the lock token as claimed and record the share of the bribe paid out so far
+                self.data.claim_ledger[claim_key] = sp.unit
+                self.data.claimed_shares[bribe_id] = self.data.claimed_shares.get(bribe_id, 0) + params.vote_share
+
+        self.transfer_payouts(sp.record(owner=params.owner, payouts=payouts.value))
 
     @sp.entry_point
     def return_bribe(self, params):
@@ -215,33 +436,52 @@ class Bribe(sp.Contract):
             self.data.epoch_bribes.contains(params),
             Errors.INVALID_BRIBE_ID_OR_EPOCH,
         )
-        epoch_bribe = sp.compute(self.data.epoch_bribes[params])
 
-        # Return bribe to provider
-        with epoch_bribe.bribe.type.match_cases() as arg:
-            with arg.match("fa12") as address:
-                TokenUtils.transfer_FA12(
-                    sp.record(
-                        from_=sp.self_address,
-                        to_=epoch_bribe.provider,
-                        value=epoch_bribe.bribe.value,
-                        token_address=address,
-                    )
-                )
-            with arg.match("fa2") as fa2_args:
-                TokenUtils.transfer_FA2(
-                    sp.record(
-                        from_=sp.self_address,
-                        to_=epoch_bribe.provider,
-                        amount=epoch_bribe.bribe.value,
-                        token_address=sp.fst(fa2_args),
-                        token_id=sp.snd(fa2_args),
-                    )
-                )
-            with arg.match("tez") as _:
-                sp.send(epoch_bribe.provider, sp.utils.nat_to_mutez(epoch_bribe.bribe.value))
+        # Nothing can be claimed by voters anymore. Providers pull their contributions through claim_refund.
+        self.data.epoch_bribes[params].value = sp.nat(0)
+        self.data.returned_bribes[params.bribe_id] = sp.unit
+
+    @sp.entry_point
+    def return_epoch(self, params):
+        sp.set_type(params, sp.TNat)
+
+        # Sanity checks
+        sp.verify(sp.sender == self.data.voter, Errors.NOT_AUTHORISED)
+
+        # Return every bribe of the epoch. The unclaimed part of each is pulled by providers through claim_refund.
+        with sp.for_("bribe_id", self.data.epoch_bribe_ids.get(params, sp.set(l=[], t=sp.TNat)).elements()) as bribe_id:
+            self.data.epoch_bribes[sp.record(epoch=params, bribe_id=bribe_id)].value = sp.nat(0)
+            self.data.returned_bribes[bribe_id] = sp.unit
+
+    @sp.entry_point
+    def claim_refund(self, params):
+        sp.set_type(params, sp.TRecord(epoch=sp.TNat, bribe_id=sp.TNat))
+
+        # Sanity checks
+        sp.verify(
+            self.data.epoch_bribes.contains(params),
+            Errors.INVALID_BRIBE_ID_OR_EPOCH,
+        )
+        sp.verify(self.data.returned_bribes.contains(params.bribe_id), Errors.BRIBE_NOT_RETURNED)
 
-        self.data.epoch_bribes[params].bribe.value = sp.nat(0)
+        # Retrieve and clear the contribution of the sender
+        provider_key = sp.compute(sp.record(bribe_id=params.bribe_id, provider=sp.sender))
+        contribution = sp.compute(self.data.bribe_providers.get(provider_key, message=Errors.NO_CONTRIBUTION_TO_REFUND))
+        del self.data.bribe_providers[provider_key]
+
+        # Refund the contribution to the provider, less the share of the bribe already claimed by voters
+        unclaimed_share = sp.compute(
+            sp.as_nat(VOTE_SHARE_MULTIPLIER - self.data.claimed_shares.get(params.bribe_id, 0))
+        )
+        payouts = sp.local("payouts", sp.map(l={}, tkey=Types.TOKEN_VARIANT, tvalue=sp.TNat))
+        payouts.value[self.data.epoch_bribes[params].type] = (contribution * unclaimed_share) // VOTE_SHARE_MULTIPLIER
+        self.transfer_payouts(sp.record(owner=sp.sender, payouts=payouts.value))
+
+    @sp.onchain_view()
+    def get_epoch_bribe_ids(self, epoch):
+        sp.set_type(epoch, sp.TNat)
+
+        sp.result(self.data.epoch_bribe_ids.get(epoch, sp.set(l=[], t=sp.TNat)).elements())
 
 
 if __name__ == "__main__":
@@ -308,25 +548,120 @@ if __name__ == "__main__":
 
         # Storage is updated correctly
         scenario.verify(
-            bribe.data.epoch_bribes[sp.record(epoch=1, bribe_id=1)].provider == Addresses.ALICE,
-        )
-        scenario.verify(
-            bribe.data.epoch_bribes[sp.record(epoch=1, bribe_id=1)].bribe
+            bribe.data.epoch_bribes[sp.record(epoch=1, bribe_id=1)]
             == sp.record(type=sp.variant("fa12", token_1.address), value=100)
         )
         scenario.verify(
-            bribe.data.epoch_bribes[sp.record(epoch=3, bribe_id=2)].bribe
+            bribe.data.epoch_bribes[sp.record(epoch=3, bribe_id=2)]
             == sp.record(type=sp.variant("fa2", (token_2.address, 0)), value=150)
         )
         scenario.verify(
-            bribe.data.epoch_bribes[sp.record(epoch=4, bribe_id=3)].bribe
+            bribe.data.epoch_bribes[sp.record(epoch=4, bribe_id=3)]
             == sp.record(type=sp.variant("tez", sp.unit), value=200)
         )
+        scenario.verify(
+            bribe.data.epoch_token_bribe[sp.record(epoch=1, type=sp.variant("fa12", token_1.address))] == 1
+        )
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=1, provider=Addresses.ALICE)] == 100)
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=2, provider=Addresses.ALICE)] == 150)
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=3, provider=Addresses.ALICE)] == 200)
+
+        # Bribes are indexed under their epochs
+        scenario.verify_equal(bribe.get_epoch_bribe_ids(1), [1])
+        scenario.verify_equal(bribe.get_epoch_bribe_ids(3), [2])
+        scenario.verify_equal(bribe.get_epoch_bribe_ids(4), [3])
+        scenario.verify_equal(bribe.get_epoch_bribe_ids(2), [])
 
         # Tokens are correctly retrieved from ALICE
         scenario.verify(token_1.data.balances[bribe.address].balance == 100)
         scenario.verify(token_2.data.ledger[bribe.address].balance == 150)
 
+    @sp.add_test(name="add_bribe tops up the existing bribe of a token in an epoch")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize FA1.2 tokens
+        token_1 = FA12(admin=Addresses.ADMIN)
+        token_2 = FA12(admin=Addresses.ADMIN)
+
+        voter = Voter(epoch=sp.nat(1), end=sp.timestamp(10))
+        bribe = Bribe(voter=voter.address)
+
+        scenario += token_1
+        scenario += token_2
+        scenario += voter
+        scenario += bribe
+
+        # Mint tokens for ALICE and BOB (bribe creators)
+        scenario += token_1.mint(address=Addresses.ALICE, value=120).run(sender=Addresses.ADMIN)
+        scenario += token_1.mint(address=Addresses.BOB, value=40).run(sender=Addresses.ADMIN)
+        scenario += token_2.mint(address=Addresses.BOB, value=100).run(sender=Addresses.ADMIN)
+
+        # Approve tokens bribe contract
+        scenario += token_1.approve(spender=bribe.address, value=120).run(sender=Addresses.ALICE)
+        scenario += token_1.approve(spender=bribe.address, value=40).run(sender=Addresses.BOB)
+        scenario += token_2.approve(spender=bribe.address, value=100).run(sender=Addresses.BOB)
+
+        # When ALICE creates a bribe with token_1
+        scenario += bribe.add_bribe(
+            epoch=2,
+            type=sp.variant("fa12", token_1.address),
+            value=60,
+        ).run(sender=Addresses.ALICE, now=sp.timestamp(5))
+
+        # and BOB tops it up twice
+        scenario += bribe.add_bribe(
+            epoch=2,
+            type=sp.variant("fa12", token_1.address),
+            value=30,
+        ).run(sender=Addresses.BOB, now=sp.timestamp(5))
+        scenario += bribe.add_bribe(
+            epoch=2,
+            type=sp.variant("fa12", token_1.address),
+            value=10,
+        ).run(sender=Addresses.BOB, now=sp.timestamp(5))
+
+        # and adds a bribe with token_2 in the same epoch
+        scenario += bribe.add_bribe(
+            epoch=2,
+            type=sp.variant("fa12", token_2.address),
+            value=100,
+        ).run(sender=Addresses.BOB, now=sp.timestamp(5))
+
+        # and ALICE creates a bribe with token_1 in the next epoch
+        scenario += bribe.add_bribe(
+            epoch=3,
+            type=sp.variant("fa12", token_1.address),
+            value=60,
+        ).run(sender=Addresses.ALICE, now=sp.timestamp(5))
+
+        # Token_1 deposits for epoch 2 are pooled under a single bribe
+        scenario.verify(bribe.data.uid == 3)
+        scenario.verify(
+            bribe.data.epoch_bribes[sp.record(epoch=2, bribe_id=1)]
+            == sp.record(type=sp.variant("fa12", token_1.address), value=100)
+        )
+        scenario.verify(
+            bribe.data.epoch_bribes[sp.record(epoch=2, bribe_id=2)]
+            == sp.record(type=sp.variant("fa12", token_2.address), value=100)
+        )
+        scenario.verify(
+            bribe.data.epoch_bribes[sp.record(epoch=3, bribe_id=3)]
+            == sp.record(type=sp.variant("fa12", token_1.address), value=60)
+        )
+        scenario.verify_equal(bribe.get_epoch_bribe_ids(2), [1, 2])
+        scenario.verify_equal(bribe.get_epoch_bribe_ids(3), [3])
+
+        # Contributions of each provider are recorded
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=1, provider=Addresses.ALICE)] == 60)
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=1, provider=Addresses.BOB)] == 40)
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=2, provider=Addresses.BOB)] == 100)
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=3, provider=Addresses.ALICE)] == 60)
+
+        # Tokens are correctly retrieved from ALICE and BOB
+        scenario.verify(token_1.data.balances[bribe.address].balance == 160)
+        scenario.verify(token_2.data.balances[bribe.address].balance == 100)
+
     ###########################
     # add_bribe (failure test)
     ###########################
@@ -357,54 +692,182 @@ if __name__ == "__main__":
             exception=Errors.EPOCH_IN_THE_PAST,
         )
 
-    #####################
-    # claim (valid test)
-    #####################
+    ##########################
+    # add_bribes (valid test)
+    ##########################
 
-    @sp.add_test(name="claim works correctly for all token variants")
+    @sp.add_test(name="add_bribes adds a bribe for every epoch in the range and retrieves the total once")
     def test():
         scenario = sp.test_scenario()
 
-        # Initialize FA1.2 and FA2 tokens
+        # Initialize FA1.2 token
         token_1 = FA12(admin=Addresses.ADMIN)
-        token_2 = FA2.FA2(
-            FA2.FA2_config(),
-            sp.utils.metadata_of_url("https://example.com"),
-            Addresses.ADMIN,
-        )
 
-        bribe = Bribe(
-            epoch_bribes=sp.big_map(
-                l={
-                    sp.record(epoch=1, bribe_id=1): sp.record(
-                        provider=Addresses.ALICE,
-                        bribe=sp.record(
-                            type=sp.variant("fa12", token_1.address),
-                            value=100,
-                        ),
-                    ),
-                    sp.record(epoch=3, bribe_id=2): sp.record(
-                        provider=Addresses.ALICE,
-                        bribe=sp.record(
-                            type=sp.variant("fa2", (token_2.address, 0)),
-                            value=150,
-                        ),
-                    ),
-                    sp.record(epoch=4, bribe_id=3): sp.record(
-                        provider=Addresses.ALICE,
-                        bribe=sp.record(
-                            type=sp.variant("tez", sp.unit),
-                            value=150,
-                        ),
-                    ),
-                }
-            ),
-            voter=Addresses.CONTRACT,
-        )
+        voter = Voter(epoch=sp.nat(1), end=sp.timestamp(10))
+        bribe = Bribe(voter=voter.address)
 
-        # Create claim dummies for tez claim
-        alice_dummy = Pure()
-        bob_dummy = Pure()
+        scenario += token_1
+        scenario += voter
+        scenario += bribe
+
+        # Mint tokens for ALICE and BOB (bribe creators)
+        scenario += token_1.mint(address=Addresses.ALICE, value=300).run(sender=Addresses.ADMIN)
+        scenario += token_1.mint(address=Addresses.BOB, value=50).run(sender=Addresses.ADMIN)
+
+        # Approve tokens bribe contract
+        scenario += token_1.approve(spender=bribe.address, value=300).run(sender=Addresses.ALICE)
+        scenario += token_1.approve(spender=bribe.address, value=50).run(sender=Addresses.BOB)
+
+        # BOB creates a bribe with token_1 for epoch 3
+        scenario += bribe.add_bribe(
+            epoch=3,
+            type=sp.variant("fa12", token_1.address),
+            value=50,
+        ).run(sender=Addresses.BOB, now=sp.timestamp(5))
+
+        # When ALICE creates a bribe with token_1 for epochs 1 to 3
+        scenario += bribe.add_bribes(
+            start_epoch=1,
+            end_epoch=3,
+            type=sp.variant("fa12", token_1.address),
+            value=100,
+        ).run(sender=Addresses.ALICE, now=sp.timestamp(5))
+
+        # and a bribe in tez for epochs 4 to 5
+        scenario += bribe.add_bribes(
+            start_epoch=4,
+            end_epoch=5,
+            type=sp.variant("tez", sp.unit),
+            value=200,
+        ).run(sender=Addresses.ALICE, now=sp.timestamp(6), amount=sp.mutez(400))
+
+        # Storage is updated correctly
+        scenario.verify(
+            bribe.data.epoch_bribes[sp.record(epoch=1, bribe_id=2)]
+            == sp.record(type=sp.variant("fa12", token_1.address), value=100)
+        )
+        scenario.verify(
+            bribe.data.epoch_bribes[sp.record(epoch=2, bribe_id=3)]
+            == sp.record(type=sp.variant("fa12", token_1.address), value=100)
+        )
+        scenario.verify(
+            bribe.data.epoch_bribes[sp.record(epoch=3, bribe_id=1)]
+            == sp.record(type=sp.variant("fa12", token_1.address), value=150)
+        )
+        scenario.verify(
+            bribe.data.epoch_bribes[sp.record(epoch=4, bribe_id=4)]
+            == sp.record(type=sp.variant("tez", sp.unit), value=200)
+        )
+        scenario.verify(
+            bribe.data.epoch_bribes[sp.record(epoch=5, bribe_id=5)]
+            == sp.record(type=sp.variant("tez", sp.unit), value=200)
+        )
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=1, provider=Addresses.ALICE)] == 100)
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=1, provider=Addresses.BOB)] == 50)
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=5, provider=Addresses.ALICE)] == 200)
+
+        # Bribes are indexed under their epochs
+        scenario.verify_equal(bribe.get_epoch_bribe_ids(1), [2])
+        scenario.verify_equal(bribe.get_epoch_bribe_ids(2), [3])
+        scenario.verify_equal(bribe.get_epoch_bribe_ids(3), [1])
+
+        # Tokens are correctly retrieved from ALICE and BOB
+        scenario.verify(token_1.data.balances[bribe.address].balance == 350)
+        scenario.verify(bribe.balance == sp.mutez(400))
+
+    ############################
+    # add_bribes (failure test)
+    ############################
+
+    @sp.add_test(name="add_bribes fails for invalid epoch ranges, past epochs or incorrect tez value")
+    def test():
+        scenario = sp.test_scenario()
+
+        voter = Voter(epoch=sp.nat(2), end=sp.timestamp(10))
+        bribe = Bribe(voter=voter.address)
+
+        scenario += voter
+        scenario += bribe
+
+        # When ALICE creates a bribe with the end epoch before the start epoch, txn fails
+        scenario += bribe.add_bribes(
+            start_epoch=4,
+            end_epoch=3,
+            type=sp.variant("fa12", Addresses.TOKEN),
+            value=100,
+        ).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(5),
+            valid=False,
+            exception=Errors.INVALID_EPOCH_RANGE,
+        )
+
+        # When ALICE creates a bribe starting from a past epoch, txn fails
+        scenario += bribe.add_bribes(
+            start_epoch=1,
+            end_epoch=3,
+            type=sp.variant("fa12", Addresses.TOKEN),
+            value=100,
+        ).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(5),
+            valid=False,
+            exception=Errors.EPOCH_IN_THE_PAST,
+        )
+
+        # When ALICE sends tez for a single epoch of the range, txn fails
+        scenario += bribe.add_bribes(
+            start_epoch=3,
+            end_epoch=4,
+            type=sp.variant("tez", sp.unit),
+            value=100,
+        ).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(5),
+            amount=sp.mutez(100),
+            valid=False,
+            exception=Errors.INCORRECT_TEZ_VALUE_SENT,
+        )
+
+    #####################
+    # claim (valid test)
+    #####################
+
+    @sp.add_test(name="claim works correctly for all token variants")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize FA1.2 and FA2 tokens
+        token_1 = FA12(admin=Addresses.ADMIN)
+        token_2 = FA2.FA2(
+            FA2.FA2_config(),
+            sp.utils.metadata_of_url("https://example.com"),
+            Addresses.ADMIN,
+        )
+
+        bribe = Bribe(
+            epoch_bribes=sp.big_map(
+                l={
+                    sp.record(epoch=1, bribe_id=1): sp.record(
+                        type=sp.variant("fa12", token_1.address),
+                        value=100,
+                    ),
+                    sp.record(epoch=3, bribe_id=2): sp.record(
+                        type=sp.variant("fa2", (token_2.address, 0)),
+                        value=150,
+                    ),
+                    sp.record(epoch=4, bribe_id=3): sp.record(
+                        type=sp.variant("tez", sp.unit),
+                        value=150,
+                    ),
+                }
+            ),
+            voter=Addresses.CONTRACT,
+        )
+
+        # Create claim dummies for tez claim
+        alice_dummy = Pure()
+        bob_dummy = Pure()
 
         # Set tez balance for bribe contract
         bribe.set_initial_balance(sp.tez(1))
@@ -497,6 +960,9 @@ if __name__ == "__main__":
         scenario.verify(bribe.data.claim_ledger[sp.record(token_id=2, bribe_id=1)] == sp.unit)
         scenario.verify(bribe.data.claim_ledger[sp.record(token_id=2, bribe_id=2)] == sp.unit)
         scenario.verify(bribe.data.claim_ledger[sp.record(token_id=2, bribe_id=3)] == sp.unit)
+        scenario.verify(bribe.data.claimed_shares[1] == VOTE_SHARE_MULTIPLIER)
+        scenario.verify(bribe.data.claimed_shares[2] == VOTE_SHARE_MULTIPLIER)
+        scenario.verify(bribe.data.claimed_shares[3] == VOTE_SHARE_MULTIPLIER)
 
         # ALICE & BOB receive their tokens correctly
         scenario.verify(token_1.data.balances[Addresses.ALICE].balance == 35)
@@ -518,18 +984,12 @@ if __name__ == "__main__":
             epoch_bribes=sp.big_map(
                 l={
                     sp.record(epoch=1, bribe_id=1): sp.record(
-                        provider=Addresses.ALICE,
-                        bribe=sp.record(
-                            type=sp.variant("fa12", Addresses.TOKEN_1),
-                            value=100,
-                        ),
+                        type=sp.variant("fa12", Addresses.TOKEN_1),
+                        value=100,
                     ),
                     sp.record(epoch=3, bribe_id=2): sp.record(
-                        provider=Addresses.ALICE,
-                        bribe=sp.record(
-                            type=sp.variant("fa2", (Addresses.TOKEN_2, 0)),
-                            value=150,
-                        ),
+                        type=sp.variant("fa2", (Addresses.TOKEN_2, 0)),
+                        value=150,
                     ),
                 }
             ),
@@ -573,11 +1033,11 @@ if __name__ == "__main__":
             exception=Errors.VOTER_HAS_ALREADY_CLAIMED_BRIBE,
         )
 
-    ############################
-    # return_bribe (valid test)
-    ############################
+    ##########################
+    # claim_many (valid test)
+    ##########################
 
-    @sp.add_test(name="return_bribe returns bribe amount back to the provider")
+    @sp.add_test(name="claim_many claims multiple bribes for a lock token in one call")
     def test():
         scenario = sp.test_scenario()
 
@@ -589,48 +1049,214 @@ if __name__ == "__main__":
             Addresses.ADMIN,
         )
 
-        # Create claim dummies for tez claim
-        alice_dummy = Pure()
+        bribe = Bribe(
+            epoch_bribes=sp.big_map(
+                l={
+                    sp.record(epoch=1, bribe_id=1): sp.record(
+                        type=sp.variant("fa12", token_1.address),
+                        value=100,
+                    ),
+                    sp.record(epoch=2, bribe_id=2): sp.record(
+                        type=sp.variant("fa2", (token_2.address, 0)),
+                        value=150,
+                    ),
+                }
+            ),
+            voter=Addresses.CONTRACT,
+        )
+
+        scenario += token_1
+        scenario += token_2
+        scenario += bribe
+
+        # Mint tokens for bribe contract
+        scenario += token_1.mint(address=bribe.address, value=100).run(sender=Addresses.ADMIN)
+        scenario += token_2.mint(
+            address=bribe.address,
+            amount=150,
+            metadata=FA2.FA2.make_metadata(name="TOKEN", decimals=18, symbol="TKN"),
+            token_id=0,
+        ).run(sender=Addresses.ADMIN)
+
+        # When BOB claims bribe 1 & 2 using his lock token
+        scenario += bribe.claim_many(
+            token_id=2,
+            owner=Addresses.BOB,
+            claims=[
+                sp.record(epoch=1, bribe_id=1, vote_share=int(0.65 * VOTE_SHARE_MULTIPLIER)),
+                sp.record(epoch=2, bribe_id=2, vote_share=int(0.8 * VOTE_SHARE_MULTIPLIER)),
+            ],
+        ).run(sender=Addresses.CONTRACT)
+
+        # Storage is updated correctly
+        scenario.verify(bribe.data.claim_ledger[sp.record(token_id=2, bribe_id=1)] == sp.unit)
+        scenario.verify(bribe.data.claim_ledger[sp.record(token_id=2, bribe_id=2)] == sp.unit)
+
+        # BOB receives his tokens correctly
+        scenario.verify(token_1.data.balances[Addresses.BOB].balance == 65)
+        scenario.verify(token_2.data.ledger[Addresses.BOB].balance == 120)
+
+    @sp.add_test(name="claim_many pays bribes in multiple token ids of an FA2 contract")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize multi-asset FA2 token
+        token = FA2.FA2(
+            FA2.FA2_config(single_asset=False),
+            sp.utils.metadata_of_url("https://example.com"),
+            Addresses.ADMIN,
+        )
 
         bribe = Bribe(
             epoch_bribes=sp.big_map(
                 l={
                     sp.record(epoch=1, bribe_id=1): sp.record(
-                        provider=alice_dummy.address,
-                        bribe=sp.record(
-                            type=sp.variant("fa12", token_1.address),
-                            value=100,
-                        ),
+                        type=sp.variant("fa2", (token.address, 0)),
+                        value=100,
                     ),
-                    sp.record(epoch=3, bribe_id=2): sp.record(
-                        provider=alice_dummy.address,
-                        bribe=sp.record(
-                            type=sp.variant("fa2", (token_2.address, 0)),
-                            value=150,
-                        ),
+                    sp.record(epoch=1, bribe_id=2): sp.record(
+                        type=sp.variant("fa2", (token.address, 1)),
+                        value=200,
                     ),
-                    sp.record(epoch=4, bribe_id=3): sp.record(
-                        provider=alice_dummy.address,
-                        bribe=sp.record(
-                            type=sp.variant("tez", sp.unit),
-                            value=150,
-                        ),
+                }
+            ),
+            voter=Addresses.CONTRACT,
+        )
+
+        scenario += token
+        scenario += bribe
+
+        # Mint both token ids for bribe contract
+        scenario += token.mint(
+            address=bribe.address,
+            amount=100,
+            metadata=FA2.FA2.make_metadata(name="TOKEN", decimals=18, symbol="TKN"),
+            token_id=0,
+        ).run(sender=Addresses.ADMIN)
+        scenario += token.mint(
+            address=bribe.address,
+            amount=200,
+            metadata=FA2.FA2.make_metadata(name="TOKEN_1", decimals=18, symbol="TKN1"),
+            token_id=1,
+        ).run(sender=Addresses.ADMIN)
+
+        # When BOB claims bribe 1 & 2 using his lock token
+        scenario += bribe.claim_many(
+            token_id=2,
+            owner=Addresses.BOB,
+            claims=[
+                sp.record(epoch=1, bribe_id=1, vote_share=int(0.5 * VOTE_SHARE_MULTIPLIER)),
+                sp.record(epoch=1, bribe_id=2, vote_share=int(0.5 * VOTE_SHARE_MULTIPLIER)),
+            ],
+        ).run(sender=Addresses.CONTRACT)
+
+        # BOB receives both token ids correctly
+        scenario.verify(token.data.ledger[sp.pair(Addresses.BOB, 0)].balance == 50)
+        scenario.verify(token.data.ledger[sp.pair(Addresses.BOB, 1)].balance == 100)
+
+    ############################
+    # claim_many (failure test)
+    ############################
+
+    @sp.add_test(name="claim_many fails if not called by voter or if any bribe is already claimed")
+    def test():
+        scenario = sp.test_scenario()
+
+        bribe = Bribe(
+            epoch_bribes=sp.big_map(
+                l={
+                    sp.record(epoch=1, bribe_id=1): sp.record(
+                        type=sp.variant("fa12", Addresses.TOKEN_1),
+                        value=100,
+                    ),
+                    sp.record(epoch=1, bribe_id=2): sp.record(
+                        type=sp.variant("fa2", (Addresses.TOKEN_2, 0)),
+                        value=150,
                     ),
                 }
             ),
+            claim_ledger=sp.big_map(
+                l={
+                    sp.record(token_id=1, bribe_id=2): sp.unit,
+                }
+            ),
             voter=Addresses.CONTRACT,
         )
 
-        # Set tez balance for bribe contract
-        bribe.set_initial_balance(sp.tez(1))
+        scenario += bribe
+
+        claims = [
+            sp.record(epoch=1, bribe_id=1, vote_share=int(0.2 * VOTE_SHARE_MULTIPLIER)),
+            sp.record(epoch=1, bribe_id=2, vote_share=int(0.2 * VOTE_SHARE_MULTIPLIER)),
+        ]
+
+        # When ALICE calls claim_many directly, txn fails
+        scenario += bribe.claim_many(token_id=1, owner=Addresses.ALICE, claims=claims).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.NOT_AUTHORISED,
+        )
+
+        # When one of the bribes has already been claimed, txn fails
+        scenario += bribe.claim_many(token_id=1, owner=Addresses.ALICE, claims=claims).run(
+            sender=Addresses.CONTRACT,
+            valid=False,
+            exception=Errors.VOTER_HAS_ALREADY_CLAIMED_BRIBE,
+        )
+
+    ###########################
+    # claim_epoch (valid test)
+    ###########################
+
+    @sp.add_test(name="claim_epoch pays out all unclaimed bribes of an epoch with one transfer per token")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize FA1.2 and FA2 tokens
+        token_1 = FA12(admin=Addresses.ADMIN)
+        token_2 = FA2.FA2(
+            FA2.FA2_config(),
+            sp.utils.metadata_of_url("https://example.com"),
+            Addresses.ADMIN,
+        )
+
+        # Two bribes in token_1, one in token_2 and an already claimed one in token_1, all for epoch 1
+        bribe = Bribe(
+            epoch_bribes=sp.big_map(
+                l={
+                    sp.record(epoch=1, bribe_id=1): sp.record(
+                        type=sp.variant("fa12", token_1.address),
+                        value=100,
+                    ),
+                    sp.record(epoch=1, bribe_id=2): sp.record(
+                        type=sp.variant("fa12", token_1.address),
+                        value=50,
+                    ),
+                    sp.record(epoch=1, bribe_id=3): sp.record(
+                        type=sp.variant("fa2", (token_2.address, 0)),
+                        value=150,
+                    ),
+                    sp.record(epoch=1, bribe_id=4): sp.record(
+                        type=sp.variant("fa12", token_1.address),
+                        value=25,
+                    ),
+                }
+            ),
+            epoch_bribe_ids=sp.big_map(l={1: sp.set([1, 2, 3, 4])}),
+            claim_ledger=sp.big_map(
+                l={
+                    sp.record(token_id=1, bribe_id=4): sp.unit,
+                }
+            ),
+            voter=Addresses.CONTRACT,
+        )
 
         scenario += token_1
         scenario += token_2
         scenario += bribe
-        scenario += alice_dummy
 
         # Mint tokens for bribe contract
-        scenario += token_1.mint(address=bribe.address, value=100).run(sender=Addresses.ADMIN)
+        scenario += token_1.mint(address=bribe.address, value=175).run(sender=Addresses.ADMIN)
         scenario += token_2.mint(
             address=bribe.address,
             amount=150,
@@ -638,25 +1264,88 @@ if __name__ == "__main__":
             token_id=0,
         ).run(sender=Addresses.ADMIN)
 
-        # Call return_bribe for epoch 1
-        scenario += bribe.return_bribe(epoch=1, bribe_id=1).run(
-            sender=Addresses.CONTRACT,
+        # When ALICE claims all the bribes of epoch 1 using her lock token
+        scenario += bribe.claim_epoch(
+            token_id=1,
+            owner=Addresses.ALICE,
+            epoch=1,
+            vote_share=int(0.4 * VOTE_SHARE_MULTIPLIER),
+        ).run(sender=Addresses.CONTRACT)
+
+        # Storage is updated correctly
+        scenario.verify(bribe.data.claim_ledger[sp.record(token_id=1, bribe_id=1)] == sp.unit)
+        scenario.verify(bribe.data.claim_ledger[sp.record(token_id=1, bribe_id=2)] == sp.unit)
+        scenario.verify(bribe.data.claim_ledger[sp.record(token_id=1, bribe_id=3)] == sp.unit)
+        scenario.verify(bribe.data.claimed_shares[1] == int(0.4 * VOTE_SHARE_MULTIPLIER))
+        scenario.verify(bribe.data.claimed_shares[3] == int(0.4 * VOTE_SHARE_MULTIPLIER))
+        scenario.verify(~bribe.data.claimed_shares.contains(4))
+
+        # ALICE receives her share of the unclaimed bribes
+        scenario.verify(token_1.data.balances[Addresses.ALICE].balance == 60)
+        scenario.verify(token_2.data.ledger[Addresses.ALICE].balance == 60)
+
+    #############################
+    # claim_epoch (failure test)
+    #############################
+
+    @sp.add_test(name="claim_epoch fails if not called by voter")
+    def test():
+        scenario = sp.test_scenario()
+
+        bribe = Bribe(voter=Addresses.CONTRACT)
+
+        scenario += bribe
+
+        # When ALICE calls claim_epoch directly, txn fails
+        scenario += bribe.claim_epoch(
+            token_id=1,
+            owner=Addresses.ALICE,
+            epoch=1,
+            vote_share=int(0.4 * VOTE_SHARE_MULTIPLIER),
+        ).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.NOT_AUTHORISED,
         )
 
-        # Call return_bribe for epoch 3
-        scenario += bribe.return_bribe(epoch=3, bribe_id=2).run(
-            sender=Addresses.CONTRACT,
+    ############################
+    # return_bribe (valid test)
+    ############################
+
+    @sp.add_test(name="return_bribe empties the bribe and opens it for refunds")
+    def test():
+        scenario = sp.test_scenario()
+
+        bribe = Bribe(
+            epoch_bribes=sp.big_map(
+                l={
+                    sp.record(epoch=1, bribe_id=1): sp.record(
+                        type=sp.variant("fa12", Addresses.TOKEN_1),
+                        value=100,
+                    ),
+                }
+            ),
+            bribe_providers=sp.big_map(
+                l={
+                    sp.record(bribe_id=1, provider=Addresses.ALICE): 60,
+                    sp.record(bribe_id=1, provider=Addresses.BOB): 40,
+                }
+            ),
+            voter=Addresses.CONTRACT,
         )
 
-        # Call return_bribe for epoch 4
-        scenario += bribe.return_bribe(epoch=4, bribe_id=3).run(
+        scenario += bribe
+
+        # When return_bribe is called for epoch 1
+        scenario += bribe.return_bribe(epoch=1, bribe_id=1).run(
             sender=Addresses.CONTRACT,
         )
 
-        # alice_dummy receives correct amounts
-        scenario.verify(token_1.data.balances[alice_dummy.address].balance == 100)
-        scenario.verify(token_2.data.ledger[alice_dummy.address].balance == 150)
-        scenario.verify(alice_dummy.balance == sp.mutez(150))
+        # The bribe is emptied and marked as returned. Contributions are left for the providers to pull.
+        scenario.verify(bribe.data.epoch_bribes[sp.record(epoch=1, bribe_id=1)].value == 0)
+        scenario.verify(bribe.data.returned_bribes[1] == sp.unit)
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=1, provider=Addresses.ALICE)] == 60)
+        scenario.verify(bribe.data.bribe_providers[sp.record(bribe_id=1, provider=Addresses.BOB)] == 40)
 
     ##############################
     # return_bribe (failure test)
@@ -670,11 +1359,8 @@ if __name__ == "__main__":
             epoch_bribes=sp.big_map(
                 l={
                     sp.record(epoch=1, bribe_id=1): sp.record(
-                        provider=Addresses.ALICE,
-                        bribe=sp.record(
-                            type=sp.variant("fa12", Addresses.TOKEN_1),
-                            value=100,
-                        ),
+                        type=sp.variant("fa12", Addresses.TOKEN_1),
+                        value=100,
                     ),
                 }
             ),
@@ -697,4 +1383,258 @@ if __name__ == "__main__":
             exception=Errors.INVALID_BRIBE_ID_OR_EPOCH,
         )
 
+    ############################
+    # return_epoch (valid test)
+    ############################
+
+    @sp.add_test(name="return_epoch empties every bribe of the epoch and opens them for refunds")
+    def test():
+        scenario = sp.test_scenario()
+
+        bribe = Bribe(
+            epoch_bribes=sp.big_map(
+                l={
+                    sp.record(epoch=1, bribe_id=1): sp.record(
+                        type=sp.variant("fa12", Addresses.TOKEN_1),
+                        value=100,
+                    ),
+                    sp.record(epoch=1, bribe_id=2): sp.record(
+                        type=sp.variant("fa12", Addresses.TOKEN_2),
+                        value=50,
+                    ),
+                    sp.record(epoch=2, bribe_id=3): sp.record(
+                        type=sp.variant("fa12", Addresses.TOKEN_1),
+                        value=80,
+                    ),
+                }
+            ),
+            epoch_bribe_ids=sp.big_map(l={1: sp.set([1, 2]), 2: sp.set([3])}),
+            voter=Addresses.CONTRACT,
+        )
+
+        scenario += bribe
+
+        # When return_epoch is called for epoch 1
+        scenario += bribe.return_epoch(1).run(sender=Addresses.CONTRACT)
+
+        # Both bribes of epoch 1 are emptied and marked as returned
+        scenario.verify(bribe.data.epoch_bribes[sp.record(epoch=1, bribe_id=1)].value == 0)
+        scenario.verify(bribe.data.epoch_bribes[sp.record(epoch=1, bribe_id=2)].value == 0)
+        scenario.verify(bribe.data.returned_bribes[1] == sp.unit)
+        scenario.verify(bribe.data.returned_bribes[2] == sp.unit)
+
+        # The bribe of epoch 2 is untouched
+        scenario.verify(bribe.data.epoch_bribes[sp.record(epoch=2, bribe_id=3)].value == 80)
+        scenario.verify(~bribe.data.returned_bribes.contains(3))
+
+        # When return_epoch is called for an epoch without bribes, nothing changes
+        scenario += bribe.return_epoch(5).run(sender=Addresses.CONTRACT)
+
+    ##############################
+    # return_epoch (failure test)
+    ##############################
+
+    @sp.add_test(name="return_epoch fails if not called by voter")
+    def test():
+        scenario = sp.test_scenario()
+
+        bribe = Bribe(voter=Addresses.CONTRACT)
+
+        scenario += bribe
+
+        # When return_epoch is called by ALICE, txn fails
+        scenario += bribe.return_epoch(1).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.NOT_AUTHORISED,
+        )
+
+    ############################
+    # claim_refund (valid test)
+    ############################
+
+    @sp.add_test(name="claim_refund returns the contribution of each provider in all token variants")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize FA1.2 and FA2 tokens
+        token_1 = FA12(admin=Addresses.ADMIN)
+        token_2 = FA2.FA2(
+            FA2.FA2_config(),
+            sp.utils.metadata_of_url("https://example.com"),
+            Addresses.ADMIN,
+        )
+
+        # Create provider dummies for tez refund
+        alice_dummy = Pure()
+        bob_dummy = Pure()
+
+        # Initialize with three returned bribes
+        bribe = Bribe(
+            epoch_bribes=sp.big_map(
+                l={
+                    sp.record(epoch=1, bribe_id=1): sp.record(
+                        type=sp.variant("fa12", token_1.address),
+                        value=0,
+                    ),
+                    sp.record(epoch=3, bribe_id=2): sp.record(
+                        type=sp.variant("fa2", (token_2.address, 0)),
+                        value=0,
+                    ),
+                    sp.record(epoch=4, bribe_id=3): sp.record(
+                        type=sp.variant("tez", sp.unit),
+                        value=0,
+                    ),
+                }
+            ),
+            bribe_providers=sp.big_map(
+                l={
+                    sp.record(bribe_id=1, provider=alice_dummy.address): 60,
+                    sp.record(bribe_id=1, provider=bob_dummy.address): 40,
+                    sp.record(bribe_id=2, provider=alice_dummy.address): 150,
+                    sp.record(bribe_id=3, provider=alice_dummy.address): 100,
+                    sp.record(bribe_id=3, provider=bob_dummy.address): 50,
+                }
+            ),
+            returned_bribes=sp.big_map(l={1: sp.unit, 2: sp.unit, 3: sp.unit}),
+            voter=Addresses.CONTRACT,
+        )
+
+        # Set tez balance for bribe contract
+        bribe.set_initial_balance(sp.tez(1))
+
+        scenario += token_1
+        scenario += token_2
+        scenario += bribe
+        scenario += alice_dummy
+        scenario += bob_dummy
+
+        # Mint tokens for bribe contract
+        scenario += token_1.mint(address=bribe.address, value=100).run(sender=Addresses.ADMIN)
+        scenario += token_2.mint(
+            address=bribe.address,
+            amount=150,
+            metadata=FA2.FA2.make_metadata(name="TOKEN", decimals=18, symbol="TKN"),
+            token_id=0,
+        ).run(sender=Addresses.ADMIN)
+
+        # When alice_dummy and bob_dummy claim their refunds for each bribe
+        scenario += bribe.claim_refund(epoch=1, bribe_id=1).run(sender=alice_dummy.address)
+        scenario += bribe.claim_refund(epoch=1, bribe_id=1).run(sender=bob_dummy.address)
+        scenario += bribe.claim_refund(epoch=3, bribe_id=2).run(sender=alice_dummy.address)
+        scenario += bribe.claim_refund(epoch=4, bribe_id=3).run(sender=alice_dummy.address)
+        scenario += bribe.claim_refund(epoch=4, bribe_id=3).run(sender=bob_dummy.address)
+
+        # alice_dummy and bob_dummy receive their contributions
+        scenario.verify(token_1.data.balances[alice_dummy.address].balance == 60)
+        scenario.verify(token_1.data.balances[bob_dummy.address].balance == 40)
+        scenario.verify(token_2.data.ledger[alice_dummy.address].balance == 150)
+        scenario.verify(alice_dummy.balance == sp.mutez(100))
+        scenario.verify(bob_dummy.balance == sp.mutez(50))
+
+        # Contributions are removed
+        scenario.verify(~bribe.data.bribe_providers.contains(sp.record(bribe_id=1, provider=alice_dummy.address)))
+        scenario.verify(~bribe.data.bribe_providers.contains(sp.record(bribe_id=1, provider=bob_dummy.address)))
+        scenario.verify(~bribe.data.bribe_providers.contains(sp.record(bribe_id=2, provider=alice_dummy.address)))
+        scenario.verify(~bribe.data.bribe_providers.contains(sp.record(bribe_id=3, provider=alice_dummy.address)))
+        scenario.verify(~bribe.data.bribe_providers.contains(sp.record(bribe_id=3, provider=bob_dummy.address)))
+
+    @sp.add_test(name="claim_refund returns only the part of a bribe left unclaimed by voters")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize FA1.2 token
+        token = FA12(admin=Addresses.ADMIN)
+
+        # A returned bribe of which voters claimed 25% before it expired
+        bribe = Bribe(
+            epoch_bribes=sp.big_map(
+                l={
+                    sp.record(epoch=1, bribe_id=1): sp.record(
+                        type=sp.variant("fa12", token.address),
+                        value=0,
+                    ),
+                }
+            ),
+            bribe_providers=sp.big_map(
+                l={
+                    sp.record(bribe_id=1, provider=Addresses.ALICE): 60,
+                    sp.record(bribe_id=1, provider=Addresses.BOB): 40,
+                }
+            ),
+            returned_bribes=sp.big_map(l={1: sp.unit}),
+            claimed_shares=sp.big_map(l={1: int(0.25 * VOTE_SHARE_MULTIPLIER)}),
+            voter=Addresses.CONTRACT,
+        )
+
+        scenario += token
+        scenario += bribe
+
+        # Mint the unclaimed part of the bribe for the bribe contract
+        scenario += token.mint(address=bribe.address, value=75).run(sender=Addresses.ADMIN)
+
+        # When ALICE and BOB claim their refunds
+        scenario += bribe.claim_refund(epoch=1, bribe_id=1).run(sender=Addresses.ALICE)
+        scenario += bribe.claim_refund(epoch=1, bribe_id=1).run(sender=Addresses.BOB)
+
+        # ALICE and BOB receive 75% of their contributions
+        scenario.verify(token.data.balances[Addresses.ALICE].balance == 45)
+        scenario.verify(token.data.balances[Addresses.BOB].balance == 30)
+        scenario.verify(token.data.balances[bribe.address].balance == 0)
+
+    ##############################
+    # claim_refund (failure test)
+    ##############################
+
+    @sp.add_test(name="claim_refund fails for bribes not returned or without a contribution from the sender")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Bribe 1 is returned while bribe 2 is not
+        bribe = Bribe(
+            epoch_bribes=sp.big_map(
+                l={
+                    sp.record(epoch=1, bribe_id=1): sp.record(
+                        type=sp.variant("fa12", Addresses.TOKEN_1),
+                        value=0,
+                    ),
+                    sp.record(epoch=1, bribe_id=2): sp.record(
+                        type=sp.variant("fa12", Addresses.TOKEN_2),
+                        value=100,
+                    ),
+                }
+            ),
+            bribe_providers=sp.big_map(
+                l={
+                    sp.record(bribe_id=1, provider=Addresses.ALICE): 100,
+                    sp.record(bribe_id=2, provider=Addresses.ALICE): 100,
+                }
+            ),
+            returned_bribes=sp.big_map(l={1: sp.unit}),
+            voter=Addresses.CONTRACT,
+        )
+
+        scenario += bribe
+
+        # When ALICE claims a refund for epoch 2, txn fails
+        scenario += bribe.claim_refund(epoch=2, bribe_id=1).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.INVALID_BRIBE_ID_OR_EPOCH,
+        )
+
+        # When ALICE claims a refund for a bribe that is not returned, txn fails
+        scenario += bribe.claim_refund(epoch=1, bribe_id=2).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.BRIBE_NOT_RETURNED,
+        )
+
+        # When BOB claims a refund for a bribe he did not contribute to, txn fails
+        scenario += bribe.claim_refund(epoch=1, bribe_id=1).run(
+            sender=Addresses.BOB,
+            valid=False,
+            exception=Errors.NO_CONTRIBUTION_TO_REFUND,
+        )
+
     sp.add_compilation_target("bribe", Bribe())
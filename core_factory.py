@@ -14,6 +14,10 @@ FeeDistributor = sp.io.import_script_from_url("file:fee_distributor.py").FeeDist
 
 class Types:
 
+    # Enumeration for voting power readers used in gauge boosts
+    CURRENT = sp.nat(0)  # Current timestamp
+    WHOLE_WEEK = sp.nat(1)  # Timestamp rounded down to a whole week
+
     # Token types on Tezos
     TOKEN_VARIANT = sp.TVariant(
         fa12=sp.TAddress,
@@ -25,7 +29,8 @@ class Types:
         amm=sp.TAddress,
         lp_token_address=sp.TAddress,
         tokens=sp.TSet(TOKEN_VARIANT),
-    ).layout(("amm", ("lp_token_address", "tokens")))
+        boost_time=sp.TNat,
+    ).layout(("amm", ("lp_token_address", ("tokens", "boost_time"))))
 
 
 ###########
@@ -95,6 +100,10 @@ class CoreFactory(sp.Contract):
         # Sanity checks
         sp.verify(sp.sender == self.data.add_admin, Errors.NOT_AUTHORISED)
         sp.verify(~self.data.amm_registered.contains(params.amm), Errors.AMM_ALREADY_ADDED)
+        sp.verify(
+            (params.boost_time == Types.CURRENT) | (params.boost_time == Types.WHOLE_WEEK),
+            Errors.INVALID_BOOST_TIME,
+        )
 
         # Mark AMM as added
         self.data.amm_registered[params.amm] = sp.unit
@@ -110,13 +119,11 @@ class CoreFactory(sp.Contract):
             last_update_time=sp.nat(0),
             period_finish=sp.nat(0),
             recharge_ledger=sp.big_map(l={}),
-            user_reward_per_token_debt=sp.big_map(l={}),
-            balances=sp.big_map(l={}),
-            derived_balances=sp.big_map(l={}),
-            attached_tokens=sp.big_map(l={}),
-            rewards=sp.big_map(l={}),
+            stakers=sp.big_map(l={}),
             total_supply=sp.nat(0),
             derived_supply=sp.nat(0),
+            boost_time=params.boost_time,
+            total_power_cache=sp.record(week=sp.nat(0), power=sp.nat(0)),
         )
 
         # Deploy gauge for AMM
@@ -127,6 +134,11 @@ class CoreFactory(sp.Contract):
             uid=sp.nat(0),
             epoch_bribes=sp.big_map(l={}),
             claim_ledger=sp.big_map(l={}),
+            epoch_bribe_ids=sp.big_map(l={}),
+            epoch_token_bribe=sp.big_map(l={}),
+            bribe_providers=sp.big_map(l={}),
+            returned_bribes=sp.big_map(l={}),
+            claimed_shares=sp.big_map(l={}),
             voter=self.data.voter,
         )
 
@@ -271,6 +283,7 @@ if __name__ == "__main__":
             amm=Addresses.AMM,
             lp_token_address=Addresses.LP_TOKEN,
             tokens=TOKENS,
+            boost_time=Types.CURRENT,
         ).run(sender=Addresses.ADMIN)
 
         # Storage is updated correctly in required contracts
@@ -282,7 +295,7 @@ if __name__ == "__main__":
     # add_amm (failure test)
     #########################
 
-    @sp.add_test(name="add_amm fails if not called by add_admin or if amm is already added")
+    @sp.add_test(name="add_amm fails if not called by add_admin, if amm is already added or boost time is invalid")
     def test():
         scenario = sp.test_scenario()
 
@@ -308,6 +321,7 @@ if __name__ == "__main__":
             amm=Addresses.AMM,
             lp_token_address=Addresses.LP_TOKEN,
             tokens=TOKENS,
+            boost_time=Types.CURRENT,
         ).run(sender=Addresses.ALICE, valid=False, exception=Errors.NOT_AUTHORISED)
 
         # When ADMIN adds a new AMM
@@ -315,8 +329,17 @@ if __name__ == "__main__":
             amm=Addresses.AMM,
             lp_token_address=Addresses.LP_TOKEN,
             tokens=TOKENS,
+            boost_time=Types.CURRENT,
         ).run(sender=Addresses.ADMIN, valid=False, exception=Errors.AMM_ALREADY_ADDED)
 
+        # When ADMIN adds a new AMM with an invalid boost time, txn fails
+        scenario += factory.add_amm(
+            amm=Addresses.AMM_1,
+            lp_token_address=Addresses.LP_TOKEN,
+            tokens=TOKENS,
+            boost_time=sp.nat(2),
+        ).run(sender=Addresses.ADMIN, valid=False, exception=Errors.INVALID_BOOST_TIME)
+
     ##########################
     # remove_amm (valid test)
     ##########################
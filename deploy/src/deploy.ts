@@ -8,6 +8,7 @@ export interface DeployParams {
   tezos: TezosToolkit;
   plyAdmin: string;
   factoryAdmin: string;
+  feeTreasury: string;
   deployVeSwap: boolean;
   plentyAddress: string;
   wrapAddress: string;
@@ -101,6 +102,7 @@ export const deploy = async (deployParams: DeployParams) => {
     // Prepare storage and contract for Fee Distributor
     const feeDistributorStorage = storageUtils.getFeeDistributorStorage({
       factoryAddress,
+      treasury: deployParams.feeTreasury,
       voterAddress,
     });
     const feeDistributorContract = contractUtils.loadContract("fee_distributor");
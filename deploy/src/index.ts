@@ -19,6 +19,9 @@ const PLY_ADMIN = "tz1Y8cACwiwQYwLNzzHnBvLQBendT6DUR3Rn";
 // Admin for core factory contract
 const FACTORY_ADMIN = "tz1Y8cACwiwQYwLNzzHnBvLQBendT6DUR3Rn";
 
+// Recipient of the AMM fees left unclaimed by voters once an epoch expires
+const FEE_TREASURY = "tz1Y8cACwiwQYwLNzzHnBvLQBendT6DUR3Rn";
+
 // True if initial plenty/wrap to PLY swap contract needs to be deployed
 const DEPLOY_VE_SWAP = true;
 
@@ -44,6 +47,7 @@ const deployParams: DeployParams = {
   tezos,
   plyAdmin: PLY_ADMIN,
   factoryAdmin: FACTORY_ADMIN,
+  feeTreasury: FEE_TREASURY,
   deployVeSwap: DEPLOY_VE_SWAP,
   plentyAddress: PLENTY_ADDRESS,
   wrapAddress: WRAP_ADDRESS,
@@ -20,7 +20,7 @@ interface VoterStorageParams {
 }
 
 export const getVoterStorage = (params: VoterStorageParams): string => {
-  return `(Pair (Pair (Pair {} (Pair "KT1TezoooozzSmartPyzzDYNAMiCzzpLu4LU" (Pair 2000000000000000000000000 (Pair 0 0)))) (Pair 0 (Pair {} "KT1TezoooozzSmartPyzzDYNAMiCzzpLu4LU"))) (Pair (Pair "${params.plyAddress}" (Pair {} {})) (Pair {} (Pair {} "${params.veAddress}"))))`;
+  return `(Pair (Pair (Pair (Pair 0 {}) (Pair {} {})) (Pair (Pair "KT1TezoooozzSmartPyzzDYNAMiCzzpLu4LU" (Pair 2000000000000000000000000 (Pair 0 0))) (Pair 0 {}))) (Pair (Pair (Pair "KT1TezoooozzSmartPyzzDYNAMiCzzpLu4LU" "${params.plyAddress}") (Pair {} {})) (Pair (Pair {} {}) (Pair {} (Pair {} "${params.veAddress}")))))`;
 };
 
 interface FactoryStorageParams {
@@ -36,11 +36,12 @@ export const getFactoryStorage = (params: FactoryStorageParams): string => {
 
 interface FeeDistributorStorageParams {
   factoryAddress: string;
+  treasury: string;
   voterAddress: string;
 }
 
 export const getFeeDistributorStorage = (params: FeeDistributorStorageParams): string => {
-  return `(Pair (Pair {} {}) (Pair {} (Pair "${params.factoryAddress}" "${params.voterAddress}")))`;
+  return `(Pair (Pair {} (Pair {} {})) (Pair (Pair {} "${params.factoryAddress}") (Pair "${params.treasury}" "${params.voterAddress}")))`;
 };
 
 interface VESwapStorageParams {
@@ -65,6 +65,12 @@ class Types:
         epoch_vote_shares=sp.TList(sp.TRecord(epoch=sp.TNat, share=sp.TNat)),
     ).layout(("token_id", ("owner", ("amm", "epoch_vote_shares"))))
 
+    CLAIM_MANY_PARAMS = sp.TRecord(
+        token_id=sp.TNat,
+        owner=sp.TAddress,
+        amm_vote_shares=sp.TMap(sp.TAddress, sp.TList(sp.TRecord(epoch=sp.TNat, share=sp.TNat))),
+    ).layout(("token_id", ("owner", "amm_vote_shares")))
+
 
 ############
 # Contracts
@@ -76,6 +82,7 @@ class FeeDistributor(sp.Contract):
         self,
         voter=Addresses.CONTRACT,
         core_factory=Addresses.CONTRACT,
+        treasury=Addresses.ADMIN,
         amm_to_tokens=sp.big_map(
             l={},
             tkey=sp.TAddress,
@@ -91,22 +98,31 @@ class FeeDistributor(sp.Contract):
             tkey=Types.CLAIM_LEDGER_KEY,
             tvalue=sp.TUnit,
         ),
+        claimed_shares=sp.big_map(
+            l={},
+            tkey=Types.AMM_EPOCH_FEE_KEY,
+            tvalue=sp.TNat,
+        ),
     ):
         self.init(
             voter=voter,
             core_factory=core_factory,
+            treasury=treasury,
             amm_to_tokens=amm_to_tokens,
             amm_epoch_fee=amm_epoch_fee,
             claim_ledger=claim_ledger,
+            claimed_shares=claimed_shares,
         )
 
         self.init_type(
             sp.TRecord(
                 voter=sp.TAddress,
                 core_factory=sp.TAddress,
+                treasury=sp.TAddress,
                 amm_to_tokens=sp.TBigMap(sp.TAddress, Types.AMM_TO_TOKENS_VALUE),
                 amm_epoch_fee=sp.TBigMap(Types.AMM_EPOCH_FEE_KEY, Types.AMM_EPOCH_FEE_VALUE),
                 claim_ledger=sp.TBigMap(Types.CLAIM_LEDGER_KEY, sp.TUnit),
+                claimed_shares=sp.TBigMap(Types.AMM_EPOCH_FEE_KEY, sp.TNat),
             )
         )
 
@@ -150,15 +166,20 @@ class FeeDistributor(sp.Contract):
             sp.verify(self.data.amm_to_tokens[sp.sender].contains(token), Errors.INVALID_TOKEN)
             self.data.amm_epoch_fee[key_][token] = params.fees[token]
 
-    @sp.entry_point
-    def claim(self, params):
-        sp.set_type(params, Types.CLAIM_PARAMS)
-
-        # Sanity checks
-        sp.verify(sp.sender == self.data.voter, Errors.NOT_AUTHORISED)
+    @sp.private_lambda(with_storage="read-write", wrap_call=True)
+    def accumulate_fees(self, params):
+        sp.set_type(
+            params,
+            sp.TRecord(
+                token_id=sp.TNat,
+                amm=sp.TAddress,
+                epoch_vote_shares=sp.TList(sp.TRecord(epoch=sp.TNat, share=sp.TNat)),
+                token_fees=sp.TMap(Types.TOKEN_VARIANT, sp.TNat),
+            ),
+        )
 
         # Local variables to store fees for individual tokens across epochs
-        token_fees = sp.local("token_fees", sp.map(l={}, tkey=Types.TOKEN_VARIANT, tvalue=sp.TNat))
+        token_fees = sp.local("token_fees", params.token_fees)
 
         # Iterate through the epochs and vote shares
         with sp.for_("epoch_vote_share", params.epoch_vote_shares) as epoch_vote_share:
@@ -182,6 +203,9 @@ class FeeDistributor(sp.Contract):
                 fees_share = token_fees.value.get(token, 0)
                 token_fees.value[token] = fees_share + (total_fees * epoch_vote_share.share)
 
+            # Record the share of the fees paid out so far
+            self.data.claimed_shares[key_] = self.data.claimed_shares.get(key_, 0) + epoch_vote_share.share
+
             # Mark the voter (vePLY token id) as claimed
             self.data.claim_ledger[
                 sp.record(
@@ -191,9 +215,18 @@ class FeeDistributor(sp.Contract):
                 )
             ] = sp.unit
 
-        # Iterate through the two tokens and transfer the share to token / lock owner
-        with sp.for_("token", token_fees.value.keys()) as token:
-            voter_fees_share = sp.compute(token_fees.value[token] // VOTE_SHARE_MULTIPLIER)
+        sp.result(token_fees.value)
+
+    @sp.private_lambda(with_operations=True, wrap_call=True)
+    def transfer_fees(self, params):
+        sp.set_type(params, sp.TRecord(owner=sp.TAddress, token_fees=sp.TMap(Types.TOKEN_VARIANT, sp.TNat)))
+
+        # FA2 shares are collected and sent in a single transfer per token contract
+        fa2_transfers = sp.local("fa2_transfers", [])
+
+        # Iterate through the tokens and transfer the share to token / lock owner
+        with sp.for_("token", params.token_fees.keys()) as token:
+            voter_fees_share = sp.compute(params.token_fees[token] // VOTE_SHARE_MULTIPLIER)
 
             with token.match_cases() as arg:
                 with arg.match("fa12") as address:
@@ -206,19 +239,83 @@ class FeeDistributor(sp.Contract):
                         )
                     )
                 with arg.match("fa2") as fa2_args:
-                    TokenUtils.transfer_FA2(
+                    fa2_transfers.value.push(
                         sp.record(
-                            from_=sp.self_address,
-                            to_=params.owner,
-                            amount=voter_fees_share,
                             token_address=sp.fst(fa2_args),
                             token_id=sp.snd(fa2_args),
+                            to_=params.owner,
+                            amount=voter_fees_share,
                         )
                     )
                 with arg.match("tez") as _:
                     with sp.if_(voter_fees_share > 0):
                         sp.send(params.owner, sp.utils.nat_to_mutez(voter_fees_share))
 
+        TokenUtils.transfer_FA2_batch(sp.record(from_=sp.self_address, transfers=fa2_transfers.value))
+
+    @sp.entry_point
+    def claim(self, params):
+        sp.set_type(params, Types.CLAIM_PARAMS)
+
+        # Sanity checks
+        sp.verify(sp.sender == self.data.voter, Errors.NOT_AUTHORISED)
+
+        token_fees = self.accumulate_fees(
+            sp.record(
+                token_id=params.token_id,
+                amm=params.amm,
+                epoch_vote_shares=params.epoch_vote_shares,
+                token_fees=sp.map(l={}, tkey=Types.TOKEN_VARIANT, tvalue=sp.TNat),
+            )
+        )
+
+        self.transfer_fees(sp.record(owner=params.owner, token_fees=token_fees))
+
+    @sp.entry_point
+    def claim_many(self, params):
+        sp.set_type(params, Types.CLAIM_MANY_PARAMS)
+
+        # Sanity checks
+        sp.verify(sp.sender == self.data.voter, Errors.NOT_AUTHORISED)
+
+        # Local variables to store fees for individual tokens across amms and epochs
+        token_fees = sp.local("token_fees", sp.map(l={}, tkey=Types.TOKEN_VARIANT, tvalue=sp.TNat))
+
+        # Fees of the same token across different amms are combined into a single transfer
+        with sp.for_("amm_vote_share", params.amm_vote_shares.items()) as amm_vote_share:
+            token_fees.value = self.accumulate_fees(
+                sp.record(
+                    token_id=params.token_id,
+                    amm=amm_vote_share.key,
+                    epoch_vote_shares=amm_vote_share.value,
+                    token_fees=token_fees.value,
+                )
+            )
+
+        self.transfer_fees(sp.record(owner=params.owner, token_fees=token_fees.value))
+
+    @sp.entry_point
+    def sweep(self, params):
+        sp.set_type(params, Types.AMM_EPOCH_FEE_KEY)
+
+        # Sanity checks
+        sp.verify(sp.sender == self.data.voter, Errors.NOT_AUTHORISED)
+
+        # Fees that were never added or are already swept are skipped
+        with sp.if_(self.data.amm_epoch_fee.contains(params)):
+            # Fees left unclaimed by voters, scaled like the accumulated fees
+            unclaimed_share = sp.compute(sp.as_nat(VOTE_SHARE_MULTIPLIER - self.data.claimed_shares.get(params, 0)))
+            token_fees = sp.local("token_fees", sp.map(l={}, tkey=Types.TOKEN_VARIANT, tvalue=sp.TNat))
+            amm_epoch_fee = sp.compute(self.data.amm_epoch_fee[params])
+            with sp.for_("token", amm_epoch_fee.keys()) as token:
+                token_fees.value[token] = amm_epoch_fee[token] * unclaimed_share
+
+            # The emptied entry is kept so that fees cannot be added again for the epoch
+            self.data.amm_epoch_fee[params] = {}
+            del self.data.claimed_shares[params]
+
+            self.transfer_fees(sp.record(owner=self.data.treasury, token_fees=token_fees.value))
+
     @sp.entry_point
     def default(self):
         pass
@@ -418,6 +515,7 @@ if __name__ == "__main__":
         # Storage is updated correctly
         scenario.verify(fee_dist.data.claim_ledger[sp.record(token_id=1, amm=Addresses.AMM, epoch=3)] == sp.unit)
         scenario.verify(fee_dist.data.claim_ledger[sp.record(token_id=2, amm=Addresses.AMM, epoch=3)] == sp.unit)
+        scenario.verify(fee_dist.data.claimed_shares[sp.record(amm=Addresses.AMM, epoch=3)] == VOTE_SHARE_MULTIPLIER)
 
         # ALICE and BOB get their tokens
         scenario.verify(token_1.data.balances[Addresses.ALICE].balance == 40)
@@ -743,4 +841,228 @@ if __name__ == "__main__":
             exception=Errors.FEES_NOT_YET_ADDED,
         )
 
+    ##########################
+    # claim_many (valid test)
+    ##########################
+
+    @sp.add_test(name="claim_many combines fees of the same token across multiple amms")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize FA1.2 and FA2 token pair shared by the two AMMs
+        token_1 = FA12(admin=Addresses.ADMIN)
+        token_2 = FA2.FA2(
+            FA2.FA2_config(),
+            sp.utils.metadata_of_url("https://example.com"),
+            Addresses.ADMIN,
+        )
+
+        TOKEN_1 = sp.variant("fa12", token_1.address)
+        TOKEN_2 = sp.variant("fa2", (token_2.address, 0))
+
+        fee_dist = FeeDistributor(
+            amm_to_tokens=sp.big_map(
+                l={
+                    Addresses.AMM: sp.set([TOKEN_1, TOKEN_2]),
+                    Addresses.AMM_1: sp.set([TOKEN_1, TOKEN_2]),
+                }
+            ),
+            amm_epoch_fee=sp.big_map(
+                l={
+                    sp.record(amm=Addresses.AMM, epoch=1): {
+                        TOKEN_1: 100,
+                        TOKEN_2: 200,
+                    },
+                    sp.record(amm=Addresses.AMM_1, epoch=1): {
+                        TOKEN_1: 300,
+                        TOKEN_2: 400,
+                    },
+                }
+            ),
+            voter=Addresses.CONTRACT,
+        )
+
+        scenario += token_1
+        scenario += token_2
+        scenario += fee_dist
+
+        # Mint tokens for fee_dist
+        scenario += token_1.mint(address=fee_dist.address, value=400).run(sender=Addresses.ADMIN)
+        scenario += token_2.mint(
+            address=fee_dist.address,
+            amount=600,
+            metadata=FA2.FA2.make_metadata(name="TOKEN", decimals=18, symbol="TKN"),
+            token_id=0,
+        ).run(sender=Addresses.ADMIN)
+
+        # When ALICE (40% share in AMM and 50% share in AMM_1) claims fee for epoch 1 across both AMMs
+        scenario += fee_dist.claim_many(
+            token_id=1,
+            owner=Addresses.ALICE,
+            amm_vote_shares={
+                Addresses.AMM: [sp.record(epoch=1, share=int(0.4 * VOTE_SHARE_MULTIPLIER))],
+                Addresses.AMM_1: [sp.record(epoch=1, share=int(0.5 * VOTE_SHARE_MULTIPLIER))],
+            },
+        ).run(sender=Addresses.CONTRACT)
+
+        # Storage is updated correctly
+        scenario.verify(fee_dist.data.claim_ledger[sp.record(token_id=1, amm=Addresses.AMM, epoch=1)] == sp.unit)
+        scenario.verify(fee_dist.data.claim_ledger[sp.record(token_id=1, amm=Addresses.AMM_1, epoch=1)] == sp.unit)
+
+        # ALICE gets her tokens
+        scenario.verify(token_1.data.balances[Addresses.ALICE].balance == 190)
+        scenario.verify(token_2.data.ledger[Addresses.ALICE].balance == 280)
+
+    ############################
+    # claim_many (failure test)
+    ############################
+
+    @sp.add_test(name="claim_many fails if not called by voter or if fees are already claimed for any amm")
+    def test():
+        scenario = sp.test_scenario()
+
+        TOKEN_1 = sp.variant("fa12", Addresses.TOKEN_1)
+
+        fee_dist = FeeDistributor(
+            amm_to_tokens=sp.big_map(
+                l={
+                    Addresses.AMM: sp.set([TOKEN_1]),
+                    Addresses.AMM_1: sp.set([TOKEN_1]),
+                }
+            ),
+            amm_epoch_fee=sp.big_map(
+                l={
+                    sp.record(amm=Addresses.AMM, epoch=1): {TOKEN_1: 100},
+                    sp.record(amm=Addresses.AMM_1, epoch=1): {TOKEN_1: 300},
+                }
+            ),
+            claim_ledger=sp.big_map(
+                l={
+                    sp.record(token_id=1, amm=Addresses.AMM_1, epoch=1): sp.unit,
+                }
+            ),
+            voter=Addresses.CONTRACT,
+        )
+
+        scenario += fee_dist
+
+        amm_vote_shares = {
+            Addresses.AMM: [sp.record(epoch=1, share=int(0.4 * VOTE_SHARE_MULTIPLIER))],
+            Addresses.AMM_1: [sp.record(epoch=1, share=int(0.5 * VOTE_SHARE_MULTIPLIER))],
+        }
+
+        # When ALICE calls claim_many directly, txn fails
+        scenario += fee_dist.claim_many(token_id=1, owner=Addresses.ALICE, amm_vote_shares=amm_vote_shares).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.NOT_AUTHORISED,
+        )
+
+        # When fees for one of the amms is already claimed, txn fails
+        scenario += fee_dist.claim_many(token_id=1, owner=Addresses.ALICE, amm_vote_shares=amm_vote_shares).run(
+            sender=Addresses.CONTRACT,
+            valid=False,
+            exception=Errors.VOTER_ALREADY_CLAIMED_FEES_FOR_EPOCH,
+        )
+
+    #####################
+    # sweep (valid test)
+    #####################
+
+    @sp.add_test(name="sweep sends the fees left unclaimed in an epoch to the treasury")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize FA1.2 and FA2 token pair for the AMM
+        token_1 = FA12(admin=Addresses.ADMIN)
+        token_2 = FA2.FA2(
+            FA2.FA2_config(),
+            sp.utils.metadata_of_url("https://example.com"),
+            Addresses.ADMIN,
+        )
+
+        TOKEN_1 = sp.variant("fa12", token_1.address)
+        TOKEN_2 = sp.variant("fa2", (token_2.address, 0))
+
+        # Voters have claimed 40% of the fees of epoch 3
+        fee_dist = FeeDistributor(
+            amm_to_tokens=sp.big_map(
+                l={
+                    Addresses.AMM: sp.set([TOKEN_1, TOKEN_2]),
+                }
+            ),
+            amm_epoch_fee=sp.big_map(
+                l={
+                    sp.record(amm=Addresses.AMM, epoch=3): {
+                        TOKEN_1: 100,
+                        TOKEN_2: 200,
+                    }
+                }
+            ),
+            claimed_shares=sp.big_map(
+                l={
+                    sp.record(amm=Addresses.AMM, epoch=3): int(0.4 * VOTE_SHARE_MULTIPLIER),
+                }
+            ),
+            voter=Addresses.CONTRACT,
+            treasury=Addresses.ADMIN,
+        )
+
+        scenario += token_1
+        scenario += token_2
+        scenario += fee_dist
+
+        # Mint the unclaimed fees for fee_dist
+        scenario += token_1.mint(address=fee_dist.address, value=60).run(sender=Addresses.ADMIN)
+        scenario += token_2.mint(
+            address=fee_dist.address,
+            amount=120,
+            metadata=FA2.FA2.make_metadata(name="TOKEN", decimals=18, symbol="TKN"),
+            token_id=0,
+        ).run(sender=Addresses.ADMIN)
+
+        # When the fees of epoch 3 are swept
+        scenario += fee_dist.sweep(amm=Addresses.AMM, epoch=3).run(sender=Addresses.CONTRACT)
+
+        # The treasury receives the unclaimed fees
+        scenario.verify(token_1.data.balances[Addresses.ADMIN].balance == 60)
+        scenario.verify(token_2.data.ledger[Addresses.ADMIN].balance == 120)
+
+        # Storage is updated correctly
+        scenario.verify(fee_dist.data.amm_epoch_fee[sp.record(amm=Addresses.AMM, epoch=3)] == {})
+        scenario.verify(~fee_dist.data.claimed_shares.contains(sp.record(amm=Addresses.AMM, epoch=3)))
+
+        # When the fees of epoch 3 are swept again, or an epoch without fees is swept, nothing is transferred
+        scenario += fee_dist.sweep(amm=Addresses.AMM, epoch=3).run(sender=Addresses.CONTRACT)
+        scenario += fee_dist.sweep(amm=Addresses.AMM, epoch=4).run(sender=Addresses.CONTRACT)
+
+        scenario.verify(token_1.data.balances[Addresses.ADMIN].balance == 60)
+        scenario.verify(token_2.data.ledger[Addresses.ADMIN].balance == 120)
+
+        # Fees cannot be added again for the swept epoch
+        scenario += fee_dist.add_fees(epoch=3, fees={TOKEN_1: 100}).run(
+            sender=Addresses.AMM,
+            valid=False,
+            exception=Errors.ALREADY_ADDED_FEES_FOR_EPOCH,
+        )
+
+    #######################
+    # sweep (failure test)
+    #######################
+
+    @sp.add_test(name="sweep fails if not called by voter")
+    def test():
+        scenario = sp.test_scenario()
+
+        fee_dist = FeeDistributor(voter=Addresses.CONTRACT)
+
+        scenario += fee_dist
+
+        # When ALICE calls sweep directly, txn fails
+        scenario += fee_dist.sweep(amm=Addresses.AMM, epoch=3).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.NOT_AUTHORISED,
+        )
+
     sp.add_compilation_target("fee_distributor", FeeDistributor())
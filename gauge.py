@@ -25,9 +25,48 @@ PRECISION = Constants.PRECISION
 class Types:
 
     # Enumeration for voting power readers
-    CURRENT = sp.nat(0)  # Curren timestamp
+    CURRENT = sp.nat(0)  # Current timestamp
     WHOLE_WEEK = sp.nat(1)  # Timestamp rounded down to a whole week
 
+    # Per-staker state. attached_token is 0 when no vePLY token is attached for boosting.
+    STAKER = sp.TRecord(
+        balance=sp.TNat,
+        derived_balance=sp.TNat,
+        reward_per_token_debt=sp.TNat,
+        rewards=sp.TNat,
+        attached_token=sp.TNat,
+    ).layout(("balance", ("derived_balance", ("reward_per_token_debt", ("rewards", "attached_token")))))
+
+    # Total voting power of VE at the start of a week
+    TOTAL_POWER_CACHE = sp.TRecord(
+        week=sp.TNat,
+        power=sp.TNat,
+    ).layout(("week", "power"))
+
+    # Pending rewards and boost of a staker. boost is a multiple of the unboosted balance, scaled by PRECISION.
+    STAKER_INFO = sp.TRecord(
+        balance=sp.TNat,
+        derived_balance=sp.TNat,
+        earned=sp.TNat,
+        boost=sp.TNat,
+        attached_token=sp.TNat,
+    ).layout(("balance", ("derived_balance", ("earned", ("boost", "attached_token")))))
+
+    # total_voting_power is 0 when it is yet to be read in the operation
+    UPDATE_DERIVED_PARAMS = sp.TRecord(
+        staker=STAKER,
+        total_voting_power=sp.TNat,
+    ).layout(("staker", "total_voting_power"))
+
+
+# State of an address that has never staked
+EMPTY_STAKER = sp.record(
+    balance=sp.nat(0),
+    derived_balance=sp.nat(0),
+    reward_per_token_debt=sp.nat(0),
+    rewards=sp.nat(0),
+    attached_token=sp.nat(0),
+)
 
 ###########
 # Contract
@@ -50,33 +89,15 @@ class Gauge(sp.Contract):
             tkey=sp.TNat,
             tvalue=sp.TUnit,
         ),
-        user_reward_per_token_debt=sp.big_map(
+        stakers=sp.big_map(
             l={},
             tkey=sp.TAddress,
-            tvalue=sp.TNat,
-        ),
-        balances=sp.big_map(
-            l={},
-            tkey=sp.TAddress,
-            tvalue=sp.TNat,
-        ),
-        derived_balances=sp.big_map(
-            l={},
-            tkey=sp.TAddress,
-            tvalue=sp.TNat,
-        ),
-        attached_tokens=sp.big_map(
-            l={},
-            tkey=sp.TAddress,
-            tvalue=sp.TNat,
-        ),
-        rewards=sp.big_map(
-            l={},
-            tkey=sp.TAddress,
-            tvalue=sp.TNat,
+            tvalue=Types.STAKER,
         ),
         total_supply=sp.nat(0),
         derived_supply=sp.nat(0),
+        boost_time=Types.CURRENT,
+        total_power_cache=sp.record(week=sp.nat(0), power=sp.nat(0)),
     ):
         self.init(
             lp_token_address=lp_token_address,
@@ -88,13 +109,11 @@ class Gauge(sp.Contract):
             last_update_time=last_update_time,
             period_finish=period_finish,
             recharge_ledger=recharge_ledger,
-            user_reward_per_token_debt=user_reward_per_token_debt,
-            balances=balances,
-            derived_balances=derived_balances,
-            attached_tokens=attached_tokens,
-            rewards=rewards,
+            stakers=stakers,
             total_supply=total_supply,
             derived_supply=derived_supply,
+            boost_time=boost_time,
+            total_power_cache=total_power_cache,
         )
 
         self.init_type(
@@ -108,19 +127,17 @@ class Gauge(sp.Contract):
                 last_update_time=sp.TNat,
                 period_finish=sp.TNat,
                 recharge_ledger=sp.TBigMap(sp.TNat, sp.TUnit),
-                user_reward_per_token_debt=sp.TBigMap(sp.TAddress, sp.TNat),
-                balances=sp.TBigMap(sp.TAddress, sp.TNat),
-                derived_balances=sp.TBigMap(sp.TAddress, sp.TNat),
-                attached_tokens=sp.TBigMap(sp.TAddress, sp.TNat),
-                rewards=sp.TBigMap(sp.TAddress, sp.TNat),
+                stakers=sp.TBigMap(sp.TAddress, Types.STAKER),
                 total_supply=sp.TNat,
                 derived_supply=sp.TNat,
+                boost_time=sp.TNat,
+                total_power_cache=Types.TOTAL_POWER_CACHE,
             )
         )
 
     @sp.private_lambda(with_storage="read-write", wrap_call=True)
-    def update_reward(self, address):
-        sp.set_type(address, sp.TAddress)
+    def update_reward_per_token(self, params):
+        sp.set_type(params, sp.TUnit)
 
         # nat version of block timestamp
         now_ = sp.compute(sp.as_nat(sp.now - sp.timestamp(0)))
@@ -136,96 +153,170 @@ class Gauge(sp.Contract):
 
         self.data.reward_per_token = reward_per_token_.value
 
-        # Store as local variable to keep on stack
-        reward_per_token = sp.compute(self.data.reward_per_token)
-
         # Update last update time
         self.data.last_update_time = sp.min(now_, period_finish)
 
-        with sp.if_(address != Addresses.DUMMY):
-            existing_rewards = self.data.rewards.get(address, 0)
+    @sp.private_lambda(with_storage="read-only", wrap_call=True)
+    def update_reward(self, staker):
+        sp.set_type(staker, Types.STAKER)
 
-            # Update already earned rewards for the user
-            self.data.rewards[address] = (
-                existing_rewards
-                + (
-                    self.data.derived_balances.get(address, 0)
-                    * sp.as_nat(reward_per_token - self.data.user_reward_per_token_debt.get(address, 0))
-                )
-                // PRECISION
-            )
+        # Store as local variable to keep on stack
+        reward_per_token = sp.compute(self.data.reward_per_token)
 
-            self.data.user_reward_per_token_debt[address] = reward_per_token
+        # Update already earned rewards for the staker
+        staker_ = sp.local("staker_", staker)
+        staker_.value.rewards += (
+            staker.derived_balance * sp.as_nat(reward_per_token - staker.reward_per_token_debt)
+        ) // PRECISION
+        staker_.value.reward_per_token_debt = reward_per_token
+
+        sp.result(staker_.value)
 
     @sp.private_lambda(with_storage="read-write", wrap_call=True)
     def update_derived(self, params):
-        sp.set_type(params, sp.TRecord(address=sp.TAddress, token_id=sp.TNat))
-
-        balance_ = sp.compute(self.data.balances[params.address])
+        sp.set_type(params, Types.UPDATE_DERIVED_PARAMS)
 
-        derived_balance_ = sp.compute(self.data.derived_balances.get(params.address, 0))
+        # Store as local variable to keep on stack
+        staker = sp.compute(params.staker)
 
-        with sp.if_(derived_balance_ != 0):
-            self.data.derived_supply = sp.as_nat(self.data.derived_supply - derived_balance_)
+        with sp.if_(staker.derived_balance != 0):
+            self.data.derived_supply = sp.as_nat(self.data.derived_supply - staker.derived_balance)
 
         # nat version of block timestamp
         now_ = sp.compute(sp.as_nat(sp.now - sp.timestamp(0)))
 
-        # Calculate a mark_up if the user chooses to boost
+        # Calculate a mark_up if the staker has attached a token to boost
         mark_up = sp.local("mark_up", sp.nat(0))
 
-        with sp.if_(params.token_id != 0):
-            # Get current voting power of token
-            token_voting_power = sp.view(
-                "get_token_voting_power",
-                self.data.ve_address,
-                sp.record(token_id=params.token_id, ts=now_, time=Types.CURRENT),
-                sp.TNat,
-            ).open_some(Errors.INVALID_VIEW)
-
-            # Get total voting power of VE
-            total_voting_power = sp.view(
-                "get_total_voting_power",
-                self.data.ve_address,
-                sp.record(ts=now_, time=Types.CURRENT),
-                sp.TNat,
-            ).open_some(Errors.INVALID_VIEW)
-
-            mark_up.value = (((self.data.total_supply * token_voting_power) // total_voting_power) * 60) // 100
-
-        base_balance = (balance_ * 40) // 100
-        derived_balance = sp.compute(sp.min(base_balance + mark_up.value, balance_))
-        self.data.derived_balances[params.address] = derived_balance
+        # Total voting power already read in this operation, if any
+        total_voting_power = sp.local("total_voting_power", params.total_voting_power)
+
+        with sp.if_(staker.attached_token != 0):
+            # Store as local variable to keep on stack
+            boost_time = sp.compute(self.data.boost_time)
+
+            # Get voting power of token, either current or at the start of the week
+            token_voting_power = sp.compute(
+                sp.view(
+                    "get_token_voting_power",
+                    self.data.ve_address,
+                    sp.record(token_id=staker.attached_token, ts=now_, time=boost_time),
+                    sp.TNat,
+                ).open_some(Errors.INVALID_VIEW)
+            )
+
+            # A token without voting power, such as a lock created within the week, gives no boost
+            with sp.if_(token_voting_power != 0):
+                with sp.if_(total_voting_power.value == 0):
+                    with sp.if_(boost_time == Types.CURRENT):
+                        # Get current total voting power of VE
+                        total_voting_power.value = sp.view(
+                            "get_total_voting_power",
+                            self.data.ve_address,
+                            sp.record(ts=now_, time=Types.CURRENT),
+                            sp.TNat,
+                        ).open_some(Errors.INVALID_VIEW)
+                    with sp.else_():
+                        # Only the first boost of a week reads the total voting power of VE. It is cached for the rest.
+                        week_ = sp.compute((now_ // WEEK) * WEEK)
+                        with sp.if_(self.data.total_power_cache.week == week_):
+                            total_voting_power.value = self.data.total_power_cache.power
+                        with sp.if_(total_voting_power.value == 0):
+                            total_voting_power.value = sp.view(
+                                "get_total_voting_power",
+                                self.data.ve_address,
+                                sp.record(ts=now_, time=Types.WHOLE_WEEK),
+                                sp.TNat,
+                            ).open_some(Errors.INVALID_VIEW)
+
+                            self.data.total_power_cache = sp.record(week=week_, power=total_voting_power.value)
+
+                mark_up.value = (
+                    ((self.data.total_supply * token_voting_power) // total_voting_power.value) * 60
+                ) // 100
+
+        base_balance = (staker.balance * 40) // 100
+        derived_balance = sp.compute(sp.min(base_balance + mark_up.value, staker.balance))
         self.data.derived_supply += derived_balance
 
+        staker_ = sp.local("staker_", staker)
+        staker_.value.derived_balance = derived_balance
+
+        sp.result(sp.record(staker=staker_.value, total_voting_power=total_voting_power.value))
+
+    @sp.private_lambda(with_storage="read-write", wrap_call=True)
+    def notify_reward_amount(self, amount):
+        sp.set_type(amount, sp.TNat)
+
+        # nat version of block timestamp
+        now_ = sp.compute(sp.as_nat(sp.now - sp.timestamp(0)))
+
+        final_amount = sp.local("final_amount", amount)
+
+        # If period has not ended (possible only when a past missed recharge is being done)
+        with sp.if_(now_ < self.data.period_finish):
+            remaining_rewards = self.data.reward_rate * sp.as_nat(self.data.period_finish - now_)
+            final_amount.value = remaining_rewards + amount
+
+        # Calculate current finish period
+        # NOTE: Since new recharge period must start after previous epoch ends, no two periods would overlap.
+        # Missed past recharges are accumulated within the current period itself.
+        self.data.period_finish = ((now_ + WEEK) // WEEK) * WEEK
+
+        # Calculate duration of rewards distribution. Should be ~ 7 days
+        duration = sp.as_nat(self.data.period_finish - now_)
+
+        # Set new reward rate for the week
+        self.data.reward_rate = final_amount.value // duration
+
+        # Set last update time to now
+        self.data.last_update_time = now_
+
     @sp.entry_point
     def stake(self, params):
         sp.set_type(
             params,
-            sp.TRecord(amount=sp.TNat, token_id=sp.TNat),
+            sp.TRecord(
+                amount=sp.TNat,
+                token_id=sp.TNat,
+                claim_reward=sp.TBool,
+            ).layout(("amount", ("token_id", "claim_reward"))),
         )
 
         # Reject tez
         sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
 
-        # Update global and user specific reward metrics
-        self.update_reward(sp.sender)
+        # Read the staker's state once
+        staker = sp.local("staker", self.data.stakers.get(sp.sender, EMPTY_STAKER))
+
+        # Update global and staker specific reward metrics
+        self.update_reward_per_token(sp.unit)
+        staker.value = self.update_reward(staker.value)
+
+        # Pay out the rewards in the same pass if the staker chooses to
+        with sp.if_(params.claim_reward & (staker.value.rewards != 0)):
+            TokenUtils.transfer_FA12(
+                sp.record(
+                    from_=sp.self_address,
+                    to_=sp.sender,
+                    value=staker.value.rewards,
+                    token_address=self.data.ply_address,
+                )
+            )
+
+            staker.value.rewards = 0
 
         # Set balance and supply
-        balance = self.data.balances.get(sp.sender, 0)
-        self.data.balances[sp.sender] = balance + params.amount
+        staker.value.balance += params.amount
         self.data.total_supply += params.amount
 
-        # Update derived balance and derived supply for boosting
-        self.update_derived(sp.record(address=sp.sender, token_id=params.token_id))
-
-        with sp.if_(params.token_id != 0):
-            # If there is no token attached
-            with sp.if_(~self.data.attached_tokens.contains(sp.sender)):
-                # Attach first token
-                self.data.attached_tokens[sp.sender] = params.token_id
+        # Store as local variable to keep on stack
+        attached_token = sp.compute(staker.value.attached_token)
 
-                # Attach tokens in ve
+        # If the boosting token is being changed
+        with sp.if_(params.token_id != attached_token):
+            # If there is no token attached, attach the first token in ve
+            with sp.if_(attached_token == 0):
                 TokenUtils.update_token_attachments(
                     sp.record(
                         attachments=[sp.variant("add_attachment", params.token_id)],
@@ -233,35 +324,36 @@ class Gauge(sp.Contract):
                         owner=sp.sender,
                     )
                 )
-            # If a new token is being attached
-            with sp.if_(self.data.attached_tokens[sp.sender] != params.token_id):
-                # Remove current attachment and attach fresh token in ve
-                TokenUtils.update_token_attachments(
-                    sp.record(
-                        attachments=[
-                            sp.variant("remove_attachment", self.data.attached_tokens[sp.sender]),
-                            sp.variant("add_attachment", params.token_id),
-                        ],
-                        ve_address=self.data.ve_address,
-                        owner=sp.sender,
+            with sp.else_():
+                # If the boost is being removed, detach the current token in ve
+                with sp.if_(params.token_id == 0):
+                    TokenUtils.update_token_attachments(
+                        sp.record(
+                            attachments=[sp.variant("remove_attachment", attached_token)],
+                            ve_address=self.data.ve_address,
+                            owner=sp.sender,
+                        )
                     )
-                )
-
-                self.data.attached_tokens[sp.sender] = params.token_id
-        with sp.else_():
-            # If a token is attached, then detach it
-            with sp.if_(self.data.attached_tokens.contains(sp.sender)):
-                TokenUtils.update_token_attachments(
-                    sp.record(
-                        attachments=[
-                            sp.variant("remove_attachment", self.data.attached_tokens[sp.sender]),
-                        ],
-                        ve_address=self.data.ve_address,
-                        owner=sp.sender,
+                # Else, remove current attachment and attach fresh token in ve
+                with sp.else_():
+                    TokenUtils.update_token_attachments(
+                        sp.record(
+                            attachments=[
+                                sp.variant("remove_attachment", attached_token),
+                                sp.variant("add_attachment", params.token_id),
+                            ],
+                            ve_address=self.data.ve_address,
+                            owner=sp.sender,
+                        )
                     )
-                )
 
-                del self.data.attached_tokens[sp.sender]
+            staker.value.attached_token = params.token_id
+
+        # Update derived balance and derived supply for boosting
+        staker.value = self.update_derived(sp.record(staker=staker.value, total_voting_power=0)).staker
+
+        # Write the staker's state once
+        self.data.stakers[sp.sender] = staker.value
 
         # Retrieve lp tokens
         TokenUtils.transfer_FA12(
@@ -283,17 +375,18 @@ class Gauge(sp.Contract):
         # Verify that withdrawal amount is non zero
         sp.verify(amount > 0, Errors.ZERO_WITHDRAWAL_NOT_ALLOWED)
 
-        # Verify that sender has a stake
-        sp.verify(self.data.balances.get(sp.sender, 0) != 0, Errors.NO_STAKE_TO_WITHDRAW)
+        # Read the staker's state once
+        staker = sp.local("staker", self.data.stakers.get(sp.sender, EMPTY_STAKER))
 
-        # Update global and user specific reward metrics
-        self.update_reward(sp.sender)
+        # Verify that sender has a stake
+        sp.verify(staker.value.balance != 0, Errors.NO_STAKE_TO_WITHDRAW)
 
-        # Store as local variable to keep on stack
-        balance = sp.compute(self.data.balances[sp.sender])
+        # Update global and staker specific reward metrics
+        self.update_reward_per_token(sp.unit)
+        staker.value = self.update_reward(staker.value)
 
         # Push withdrawal amount on stack
-        withdrawal_amount = sp.compute(sp.min(amount, balance))
+        withdrawal_amount = sp.compute(sp.min(amount, staker.value.balance))
 
         # Transfer withdrawn tokens back to sender
         TokenUtils.transfer_FA12(
@@ -307,49 +400,209 @@ class Gauge(sp.Contract):
 
         # Modify balance and total supply
         self.data.total_supply = sp.as_nat(self.data.total_supply - withdrawal_amount)
-        self.data.balances[sp.sender] = sp.as_nat(balance - withdrawal_amount)
+        staker.value.balance = sp.as_nat(staker.value.balance - withdrawal_amount)
 
         # Detach boost token if all balance is withdrawn
-        with sp.if_(self.data.balances[sp.sender] == 0):
-            with sp.if_(self.data.attached_tokens.contains(sp.sender)):
-                # Detach tokens in ve
-                TokenUtils.update_token_attachments(
-                    sp.record(
-                        attachments=[
-                            sp.variant("remove_attachment", self.data.attached_tokens[sp.sender]),
-                        ],
-                        ve_address=self.data.ve_address,
-                        owner=sp.sender,
-                    )
+        with sp.if_((staker.value.balance == 0) & (staker.value.attached_token != 0)):
+            # Detach tokens in ve
+            TokenUtils.update_token_attachments(
+                sp.record(
+                    attachments=[
+                        sp.variant("remove_attachment", staker.value.attached_token),
+                    ],
+                    ve_address=self.data.ve_address,
+                    owner=sp.sender,
                 )
+            )
 
-                del self.data.attached_tokens[sp.sender]
+            staker.value.attached_token = 0
 
         # Update derived balance and derived supply for boosting
-        self.update_derived(sp.record(address=sp.sender, token_id=self.data.attached_tokens.get(sp.sender, 0)))
+        staker.value = self.update_derived(sp.record(staker=staker.value, total_voting_power=0)).staker
+
+        # Write the staker's state once
+        self.data.stakers[sp.sender] = staker.value
 
     @sp.entry_point
-    def get_reward(self):
-        # Update global and user specific reward metrics
-        self.update_reward(sp.sender)
+    def exit(self):
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Read the staker's state once
+        staker = sp.local("staker", self.data.stakers.get(sp.sender, EMPTY_STAKER))
+
+        # Verify that sender has a stake
+        sp.verify(staker.value.balance != 0, Errors.NO_STAKE_TO_WITHDRAW)
+
+        # Update global and staker specific reward metrics
+        self.update_reward_per_token(sp.unit)
+        staker.value = self.update_reward(staker.value)
+
+        # Transfer the entire stake back to sender
+        TokenUtils.transfer_FA12(
+            sp.record(
+                from_=sp.self_address,
+                to_=sp.sender,
+                value=staker.value.balance,
+                token_address=self.data.lp_token_address,
+            )
+        )
+
+        # Transfer rewards to the sender
+        with sp.if_(staker.value.rewards != 0):
+            TokenUtils.transfer_FA12(
+                sp.record(
+                    from_=sp.self_address,
+                    to_=sp.sender,
+                    value=staker.value.rewards,
+                    token_address=self.data.ply_address,
+                )
+            )
+
+        # Detach boost token in ve
+        with sp.if_(staker.value.attached_token != 0):
+            TokenUtils.update_token_attachments(
+                sp.record(
+                    attachments=[
+                        sp.variant("remove_attachment", staker.value.attached_token),
+                    ],
+                    ve_address=self.data.ve_address,
+                    owner=sp.sender,
+                )
+            )
+
+        # Modify total and derived supply. Derived balance of an empty stake is 0, hence no boost views are needed.
+        self.data.total_supply = sp.as_nat(self.data.total_supply - staker.value.balance)
+        self.data.derived_supply = sp.as_nat(self.data.derived_supply - staker.value.derived_balance)
+
+        # Nothing is left to track for the sender
+        del self.data.stakers[sp.sender]
 
+    @sp.entry_point
+    def get_reward(self):
         # Reject tez
         sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
 
+        # Read the staker's state once
+        staker = sp.local("staker", self.data.stakers.get(sp.sender, EMPTY_STAKER))
+
+        # Update global and staker specific reward metrics
+        self.update_reward_per_token(sp.unit)
+        staker.value = self.update_reward(staker.value)
+
         # If there is a non-zero reward to withdraw for the sender
-        with sp.if_(self.data.rewards[sp.sender] != 0):
+        with sp.if_(staker.value.rewards != 0):
             # Transfer rewards to the user
             TokenUtils.transfer_FA12(
                 sp.record(
                     from_=sp.self_address,
                     to_=sp.sender,
-                    value=self.data.rewards[sp.sender],
+                    value=staker.value.rewards,
+                    token_address=self.data.ply_address,
+                )
+            )
+
+            # Set rewards to 0
+            staker.value.rewards = 0
+
+        # Write the staker's state once
+        self.data.stakers[sp.sender] = staker.value
+
+    @sp.entry_point
+    def get_reward_for(self, owner):
+        sp.set_type(owner, sp.TAddress)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Verify that the voter is the sender
+        sp.verify(sp.sender == self.data.voter, Errors.NOT_AUTHORISED)
+
+        # Read the owner's state once
+        staker = sp.local("staker", self.data.stakers.get(owner, EMPTY_STAKER))
+
+        # Update global and staker specific reward metrics
+        self.update_reward_per_token(sp.unit)
+        staker.value = self.update_reward(staker.value)
+
+        # If there is a non-zero reward to withdraw for the owner
+        with sp.if_(staker.value.rewards != 0):
+            # Transfer rewards to the owner
+            TokenUtils.transfer_FA12(
+                sp.record(
+                    from_=sp.self_address,
+                    to_=owner,
+                    value=staker.value.rewards,
                     token_address=self.data.ply_address,
                 )
             )
 
             # Set rewards to 0
-            self.data.rewards[sp.sender] = 0
+            staker.value.rewards = 0
+
+        # Write the owner's state once
+        self.data.stakers[owner] = staker.value
+
+    @sp.entry_point
+    def update_boost(self, params):
+        sp.set_type(
+            params,
+            sp.TRecord(
+                owner=sp.TAddress,
+                prev_token_id=sp.TNat,
+                token_id=sp.TNat,
+            ).layout(("owner", ("prev_token_id", "token_id"))),
+        )
+
+        # Verify that the sender is VoteEscrow
+        sp.verify(sp.sender == self.data.ve_address, Errors.NOT_AUTHORISED)
+
+        # Read the staker's state once
+        staker = sp.local("staker", self.data.stakers.get(params.owner, EMPTY_STAKER))
+
+        # Sanity checks
+        sp.verify(staker.value.balance != 0, Errors.NO_STAKE_TO_BOOST)
+        sp.verify(staker.value.attached_token == params.prev_token_id, Errors.INVALID_ATTACHED_TOKEN)
+
+        # Update global and staker specific reward metrics
+        self.update_reward_per_token(sp.unit)
+        staker.value = self.update_reward(staker.value)
+
+        # Record the attachment already made in ve
+        staker.value.attached_token = params.token_id
+
+        # Update derived balance and derived supply for boosting
+        staker.value = self.update_derived(sp.record(staker=staker.value, total_voting_power=0)).staker
+
+        # Write the staker's state once
+        self.data.stakers[params.owner] = staker.value
+
+    @sp.entry_point
+    def kick(self, addresses):
+        sp.set_type(addresses, sp.TList(sp.TAddress))
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Update global reward metrics once for all the stakers
+        self.update_reward_per_token(sp.unit)
+
+        # Total voting power of VE is read at most once and shared across the stakers
+        total_voting_power = sp.local("total_voting_power", sp.nat(0))
+
+        with sp.for_("address", addresses) as address:
+            # Addresses without a stake are skipped
+            with sp.if_(self.data.stakers.contains(address)):
+                # Update staker specific reward metrics
+                staker = sp.compute(self.update_reward(self.data.stakers[address]))
+
+                # Recompute derived balance based on the present voting power of the attached token
+                result = sp.compute(
+                    self.update_derived(sp.record(staker=staker, total_voting_power=total_voting_power.value))
+                )
+                total_voting_power.value = result.total_voting_power
+
+                self.data.stakers[address] = result.staker
 
     @sp.entry_point
     def recharge(self, params):
@@ -362,34 +615,77 @@ class Gauge(sp.Contract):
         sp.verify(~self.data.recharge_ledger.contains(params.epoch), Errors.ALREADY_RECHARGED_FOR_EPOCH)
 
         # Update global reward metrics
-        self.update_reward(Addresses.DUMMY)
+        self.update_reward_per_token(sp.unit)
 
-        # nat version of block timestamp
-        now_ = sp.compute(sp.as_nat(sp.now - sp.timestamp(0)))
+        # Distribute the amount over the new period
+        self.notify_reward_amount(params.amount)
 
-        final_amount = sp.local("final_amount", params.amount)
+        # Mark recharged for the epoch
+        self.data.recharge_ledger[params.epoch] = sp.unit
 
-        # If period has not ended (possible only when a past missed recharge is being done)
-        with sp.if_(now_ < self.data.period_finish):
-            remaining_rewards = self.data.reward_rate * sp.as_nat(self.data.period_finish - now_)
-            final_amount.value = remaining_rewards + params.amount
+    @sp.entry_point
+    def recharge_many(self, recharges):
+        sp.set_type(recharges, sp.TList(sp.TRecord(amount=sp.TNat, epoch=sp.TNat)))
 
-        # Calculate current finish period
-        # NOTE: Since new recharge period must start after previous epoch ends, no two periods would overlap.
-        # Missed past recharges are accumulated within the current period itself.
-        self.data.period_finish = ((now_ + WEEK) // WEEK) * WEEK
+        # Verify that the voter is the sender
+        sp.verify(sp.sender == self.data.voter, Errors.NOT_AUTHORISED)
 
-        # Calculate duration of rewards distribution. Should be ~ 7 days
-        duration = sp.as_nat(self.data.period_finish - now_)
+        # Local variable to sum up the amounts of all the epochs
+        total_amount = sp.local("total_amount", sp.nat(0))
 
-        # Set new reward rate for the week
-        self.data.reward_rate = final_amount.value // duration
+        with sp.for_("recharge", recharges) as recharge:
+            # verify that recharge is not already done for the epoch
+            sp.verify(~self.data.recharge_ledger.contains(recharge.epoch), Errors.ALREADY_RECHARGED_FOR_EPOCH)
 
-        # Set last update time to now
-        self.data.last_update_time = now_
+            # Mark recharged for the epoch
+            self.data.recharge_ledger[recharge.epoch] = sp.unit
 
-        # Mark recharged for the epoch
-        self.data.recharge_ledger[params.epoch] = sp.unit
+            total_amount.value += recharge.amount
+
+        # Update global reward metrics
+        self.update_reward_per_token(sp.unit)
+
+        # Distribute the total amount over the new period in a single reward rate update
+        self.notify_reward_amount(total_amount.value)
+
+    @sp.onchain_view()
+    def get_staker_info(self, address):
+        sp.set_type(address, sp.TAddress)
+
+        staker = sp.compute(self.data.stakers.get(address, EMPTY_STAKER))
+
+        # nat version of block timestamp
+        now_ = sp.compute(sp.as_nat(sp.now - sp.timestamp(0)))
+
+        # Calculate reward/token-staked as of now, same as update_reward_per_token
+        reward_per_token_ = sp.local("reward_per_token_", self.data.reward_per_token)
+        with sp.if_(self.data.total_supply != 0):
+            d_ts = sp.as_nat(sp.min(now_, self.data.period_finish) - self.data.last_update_time)
+            reward_per_token_.value += (d_ts * self.data.reward_rate * PRECISION) // self.data.derived_supply
+
+        # Rewards earned by the staker so far, same as update_reward
+        earned = staker.rewards + (
+            staker.derived_balance * sp.as_nat(reward_per_token_.value - staker.reward_per_token_debt)
+        ) // PRECISION
+
+        # Derived balance relative to the unboosted 40% of the staked balance
+        boost = sp.local("boost", sp.nat(0))
+        base_balance = sp.compute((staker.balance * 40) // 100)
+        with sp.if_(base_balance != 0):
+            boost.value = (staker.derived_balance * PRECISION) // base_balance
+
+        sp.result(
+            sp.set_type_expr(
+                sp.record(
+                    balance=staker.balance,
+                    derived_balance=staker.derived_balance,
+                    earned=earned,
+                    boost=boost.value,
+                    attached_token=staker.attached_token,
+                ),
+                Types.STAKER_INFO,
+            )
+        )
 
 
 if __name__ == "__main__":
@@ -444,26 +740,26 @@ if __name__ == "__main__":
         ).run(sender=Addresses.BOB)
 
         # When ALICE stakes her LP tokens using lock with token-id 1 to boost
-        scenario += gauge.stake(amount=50 * DECIMALS, token_id=1).run(
+        scenario += gauge.stake(amount=50 * DECIMALS, token_id=1, claim_reward=False).run(
             sender=Addresses.ALICE,
             now=sp.timestamp(DAY),
         )
 
         # The storage is updated correctly
         scenario.verify(gauge.data.total_supply == 50 * DECIMALS)
-        scenario.verify(gauge.data.balances[Addresses.ALICE] == 50 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].balance == 50 * DECIMALS)
         scenario.verify(gauge.data.reward_per_token == 0)
         scenario.verify(gauge.data.last_update_time == DAY)
-        scenario.verify(gauge.data.user_reward_per_token_debt[Addresses.ALICE] == 0)
-        scenario.verify(gauge.data.rewards[Addresses.ALICE] == 0)
-        scenario.verify(gauge.data.derived_balances[Addresses.ALICE] == 32 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 32 * DECIMALS)
         scenario.verify(gauge.data.derived_supply == 32 * DECIMALS)
 
         # Gauge retrieves the LP tokens
         scenario.verify(lp_token.data.balances[gauge.address].balance == 50 * DECIMALS)
 
         # When BOB stakes his LP tokens without any boost i.e using token_id 0
-        scenario += gauge.stake(amount=75 * DECIMALS, token_id=0).run(
+        scenario += gauge.stake(amount=75 * DECIMALS, token_id=0, claim_reward=False).run(
             sender=Addresses.BOB,
             now=sp.timestamp(2 * DAY),  # A day after ALICE stakes
         )
@@ -473,12 +769,12 @@ if __name__ == "__main__":
 
         # The storage is updated correctly
         scenario.verify(gauge.data.total_supply == 125 * DECIMALS)
-        scenario.verify(gauge.data.balances[Addresses.BOB] == 75 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.BOB].balance == 75 * DECIMALS)
         scenario.verify(gauge.data.reward_per_token == reward_per_token_)
         scenario.verify(gauge.data.last_update_time == 2 * DAY)
-        scenario.verify(gauge.data.user_reward_per_token_debt[Addresses.BOB] == reward_per_token_)
-        scenario.verify(gauge.data.rewards[Addresses.BOB] == 0)
-        scenario.verify(gauge.data.derived_balances[Addresses.BOB] == 30 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.BOB].reward_per_token_debt == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.BOB].rewards == 0)
+        scenario.verify(gauge.data.stakers[Addresses.BOB].derived_balance == 30 * DECIMALS)
         scenario.verify(gauge.data.derived_supply == 62 * DECIMALS)
 
         # Gauge retrieves the LP tokens
@@ -522,26 +818,26 @@ if __name__ == "__main__":
         ).run(sender=Addresses.ALICE)
 
         # When ALICE stakes her LP tokens using lock with token-id 1 to boost
-        scenario += gauge.stake(amount=50 * DECIMALS, token_id=1).run(
+        scenario += gauge.stake(amount=50 * DECIMALS, token_id=1, claim_reward=False).run(
             sender=Addresses.ALICE,
             now=sp.timestamp(DAY),
         )
 
         # The storage is updated correctly
         scenario.verify(gauge.data.total_supply == 50 * DECIMALS)
-        scenario.verify(gauge.data.balances[Addresses.ALICE] == 50 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].balance == 50 * DECIMALS)
         scenario.verify(gauge.data.reward_per_token == 0)
         scenario.verify(gauge.data.last_update_time == DAY)
-        scenario.verify(gauge.data.user_reward_per_token_debt[Addresses.ALICE] == 0)
-        scenario.verify(gauge.data.rewards[Addresses.ALICE] == 0)
-        scenario.verify(gauge.data.derived_balances[Addresses.ALICE] == 32 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 32 * DECIMALS)
         scenario.verify(gauge.data.derived_supply == 32 * DECIMALS)
 
         # Gauge retrieves the LP tokens
         scenario.verify(lp_token.data.balances[gauge.address].balance == 50 * DECIMALS)
 
         # When ALICE stakes more LP tokens using lock with token-id 2 to boost
-        scenario += gauge.stake(amount=25 * DECIMALS, token_id=2).run(
+        scenario += gauge.stake(amount=25 * DECIMALS, token_id=2, claim_reward=False).run(
             sender=Addresses.ALICE,
             now=sp.timestamp(2 * DAY),  # One day later to original stake
         )
@@ -552,19 +848,19 @@ if __name__ == "__main__":
 
         # The storage is updated correctly
         scenario.verify(gauge.data.total_supply == 75 * DECIMALS)
-        scenario.verify(gauge.data.balances[Addresses.ALICE] == 75 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].balance == 75 * DECIMALS)
         scenario.verify(gauge.data.reward_per_token == reward_per_token_)
         scenario.verify(gauge.data.last_update_time == 2 * DAY)
-        scenario.verify(gauge.data.user_reward_per_token_debt[Addresses.ALICE] == reward_per_token_)
-        scenario.verify(gauge.data.rewards[Addresses.ALICE] == reward_)
-        scenario.verify(gauge.data.derived_balances[Addresses.ALICE] == 57 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == reward_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 57 * DECIMALS)
         scenario.verify(gauge.data.derived_supply == 57 * DECIMALS)
 
         # Gauge retrieves the LP tokens
         scenario.verify(lp_token.data.balances[gauge.address].balance == 75 * DECIMALS)
 
         # When ALICE stakes more LP tokens and remove a boost lock
-        scenario += gauge.stake(amount=25 * DECIMALS, token_id=0).run(
+        scenario += gauge.stake(amount=25 * DECIMALS, token_id=0, claim_reward=False).run(
             sender=Addresses.ALICE,
             now=sp.timestamp(3 * DAY),  # One day later to second stake
         )
@@ -575,12 +871,12 @@ if __name__ == "__main__":
 
         # The storage is updated correctly
         scenario.verify(gauge.data.total_supply == 100 * DECIMALS)
-        scenario.verify(gauge.data.balances[Addresses.ALICE] == 100 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].balance == 100 * DECIMALS)
         scenario.verify(gauge.data.reward_per_token == reward_per_token__)
         scenario.verify(gauge.data.last_update_time == 3 * DAY)
-        scenario.verify(gauge.data.user_reward_per_token_debt[Addresses.ALICE] == reward_per_token__)
-        scenario.verify(gauge.data.rewards[Addresses.ALICE] == reward__)
-        scenario.verify(gauge.data.derived_balances[Addresses.ALICE] == 40 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == reward_per_token__)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == reward__)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 40 * DECIMALS)
         scenario.verify(gauge.data.derived_supply == 40 * DECIMALS)
 
     @sp.add_test(name="stake works correctly when unboosted staked user attempts to boost")
@@ -621,26 +917,26 @@ if __name__ == "__main__":
         ).run(sender=Addresses.ALICE)
 
         # When ALICE stakes her LP tokens without any boost
-        scenario += gauge.stake(amount=50 * DECIMALS, token_id=0).run(
+        scenario += gauge.stake(amount=50 * DECIMALS, token_id=0, claim_reward=False).run(
             sender=Addresses.ALICE,
             now=sp.timestamp(DAY),
         )
 
         # The storage is updated correctly
         scenario.verify(gauge.data.total_supply == 50 * DECIMALS)
-        scenario.verify(gauge.data.balances[Addresses.ALICE] == 50 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].balance == 50 * DECIMALS)
         scenario.verify(gauge.data.reward_per_token == 0)
         scenario.verify(gauge.data.last_update_time == DAY)
-        scenario.verify(gauge.data.user_reward_per_token_debt[Addresses.ALICE] == 0)
-        scenario.verify(gauge.data.rewards[Addresses.ALICE] == 0)
-        scenario.verify(gauge.data.derived_balances[Addresses.ALICE] == 20 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 20 * DECIMALS)
         scenario.verify(gauge.data.derived_supply == 20 * DECIMALS)
 
         # Gauge retrieves the LP tokens
         scenario.verify(lp_token.data.balances[gauge.address].balance == 50 * DECIMALS)
 
         # When ALICE boosts by calling stake with 0 amount and adding a token only
-        scenario += gauge.stake(amount=0 * DECIMALS, token_id=1).run(
+        scenario += gauge.stake(amount=0 * DECIMALS, token_id=1, claim_reward=False).run(
             sender=Addresses.ALICE,
             now=sp.timestamp(2 * DAY),  # One day later to original stake
         )
@@ -651,19 +947,15 @@ if __name__ == "__main__":
 
         # The storage is updated correctly
         scenario.verify(gauge.data.total_supply == 50 * DECIMALS)
-        scenario.verify(gauge.data.balances[Addresses.ALICE] == 50 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].balance == 50 * DECIMALS)
         scenario.verify(gauge.data.reward_per_token == reward_per_token_)
         scenario.verify(gauge.data.last_update_time == 2 * DAY)
-        scenario.verify(gauge.data.user_reward_per_token_debt[Addresses.ALICE] == reward_per_token_)
-        scenario.verify(gauge.data.rewards[Addresses.ALICE] == reward_)
-        scenario.verify(gauge.data.derived_balances[Addresses.ALICE] == 32 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == reward_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 32 * DECIMALS)
         scenario.verify(gauge.data.derived_supply == 32 * DECIMALS)
 
-    ########################
-    # withdraw (valid test)
-    ########################
-
-    @sp.add_test(name="withdraw works correctly for partial withdrawal")
+    @sp.add_test(name="stake caches the weekly total voting power when boosting with whole week voting power")
     def test():
         scenario = sp.test_scenario()
 
@@ -676,76 +968,109 @@ if __name__ == "__main__":
             total_power=sp.nat(250 * DECIMALS),
         )
 
-        # Set gauge to relevant initial values with ALICE as a staker
+        # Set gauge to use whole week voting power, with a total voting power already cached for the first week
         gauge = Gauge(
             lp_token_address=lp_token.address,
             ve_address=ve.address,
             period_finish=WEEK,
-            last_update_time=DAY,
+            last_update_time=10,
             reward_rate=sp.nat(500),
-            user_reward_per_token_debt=sp.big_map(
-                l={Addresses.ALICE: 0},
-            ),
-            reward_per_token=sp.nat(0),
-            rewards=sp.big_map(
-                l={
-                    Addresses.ALICE: 0,
-                }
-            ),
-            attached_tokens=sp.big_map(
-                l={Addresses.ALICE: 1},
-            ),
-            balances=sp.big_map(
-                l={Addresses.ALICE: 50 * DECIMALS},
-            ),
-            total_supply=50 * DECIMALS,
-            derived_balances=sp.big_map(
-                l={Addresses.ALICE: 32 * DECIMALS},
-            ),
-            derived_supply=32 * DECIMALS,
+            boost_time=Types.WHOLE_WEEK,
+            total_power_cache=sp.record(week=0, power=200 * DECIMALS),
         )
 
         scenario += lp_token
         scenario += ve
         scenario += gauge
 
-        # Mint L.P tokens for the gauge
+        # Mint lp tokens for ALICE
         scenario += lp_token.mint(
-            address=gauge.address,
-            value=sp.nat(50 * DECIMALS),
+            address=Addresses.ALICE,
+            value=sp.nat(100 * DECIMALS),
         ).run(sender=Addresses.ADMIN)
 
-        # When ALICE withdraws her stake
-        scenario += gauge.withdraw(25 * DECIMALS).run(
+        # Approve tokens for ALICE with gauge as spender
+        scenario += lp_token.approve(
+            spender=gauge.address,
+            value=sp.nat(100 * DECIMALS),
+        ).run(sender=Addresses.ALICE)
+
+        # When ALICE stakes her LP tokens using lock with token-id 1 to boost in the first week
+        scenario += gauge.stake(amount=50 * DECIMALS, token_id=1, claim_reward=False).run(
             sender=Addresses.ALICE,
-            now=sp.timestamp(2 * DAY),  # a DAY after staking
+            now=sp.timestamp(DAY),
         )
 
-        # Predicted values
-        reward_per_token_ = (DAY * 500 * PRECISION) // (32 * DECIMALS)
-        reward_ = (reward_per_token_ * 32 * DECIMALS) // PRECISION
+        # The cached total voting power is used i.e (20 + (50 * 100 / 200) * 0.6)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 35 * DECIMALS)
+        scenario.verify(gauge.data.derived_supply == 35 * DECIMALS)
+        scenario.verify(gauge.data.total_power_cache.power == 200 * DECIMALS)
 
-        # Storage is updated correctly
-        scenario.verify(gauge.data.total_supply == 25 * DECIMALS)
-        scenario.verify(gauge.data.balances[Addresses.ALICE] == 25 * DECIMALS)
-        scenario.verify(gauge.data.reward_per_token == reward_per_token_)
-        scenario.verify(gauge.data.last_update_time == 2 * DAY)
-        scenario.verify(gauge.data.user_reward_per_token_debt[Addresses.ALICE] == reward_per_token_)
-        scenario.verify(gauge.data.rewards[Addresses.ALICE] == reward_)
-        scenario.verify(gauge.data.derived_balances[Addresses.ALICE] == 16 * DECIMALS)
-        scenario.verify(gauge.data.derived_supply == 16 * DECIMALS)
-        scenario.verify(gauge.data.attached_tokens[Addresses.ALICE] == 1)
+        # When ALICE stakes again in the second week
+        scenario += gauge.stake(amount=50 * DECIMALS, token_id=1, claim_reward=False).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(WEEK + DAY),
+        )
 
-        # ALICE received withdrawn LP tokens
-        scenario.verify(lp_token.data.balances[Addresses.ALICE].balance == 25 * DECIMALS)
+        # The total voting power is read from ve and cached for the week i.e (40 + (100 * 100 / 250) * 0.6)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 64 * DECIMALS)
+        scenario.verify(gauge.data.derived_supply == 64 * DECIMALS)
+        scenario.verify(gauge.data.total_power_cache.week == WEEK)
+        scenario.verify(gauge.data.total_power_cache.power == 250 * DECIMALS)
 
-    @sp.add_test(name="withdraw works correctly for complete withdrawal")
+    @sp.add_test(name="stake gives no boost for a lock without whole week voting power")
     def test():
         scenario = sp.test_scenario()
 
         # Staking LP token
         lp_token = FA12(admin=Addresses.ADMIN)
 
+        # Token id 1 is a lock created within the week, so it has no voting power at the start of the week
+        ve = VE(powers=sp.big_map(l={1: sp.nat(0)}))
+
+        # Set gauge to use whole week voting power
+        gauge = Gauge(
+            lp_token_address=lp_token.address,
+            ve_address=ve.address,
+            boost_time=Types.WHOLE_WEEK,
+        )
+
+        scenario += lp_token
+        scenario += ve
+        scenario += gauge
+
+        # Mint lp tokens for ALICE
+        scenario += lp_token.mint(
+            address=Addresses.ALICE,
+            value=sp.nat(100 * DECIMALS),
+        ).run(sender=Addresses.ADMIN)
+
+        # Approve tokens for ALICE with gauge as spender
+        scenario += lp_token.approve(
+            spender=gauge.address,
+            value=sp.nat(100 * DECIMALS),
+        ).run(sender=Addresses.ALICE)
+
+        # When ALICE stakes her LP tokens using lock with token-id 1 to boost
+        scenario += gauge.stake(amount=50 * DECIMALS, token_id=1, claim_reward=False).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(WEEK + DAY),
+        )
+
+        # The token is attached but gives no boost i.e (50 * 0.4), and the total voting power is not read
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].attached_token == 1)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 20 * DECIMALS)
+        scenario.verify(gauge.data.derived_supply == 20 * DECIMALS)
+        scenario.verify(gauge.data.total_power_cache.power == 0)
+
+    @sp.add_test(name="stake pays out rewards in the same operation when claim_reward is set")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Staking LP token and reward PLY token
+        lp_token = FA12(admin=Addresses.ADMIN)
+        ply_token = FA12(admin=Addresses.ADMIN)
+
         # Initialize dummy voting powers for token id's 1 and 2 in ve
         ve = VE(
             powers=sp.big_map(l={1: sp.nat(100 * DECIMALS), 2: sp.nat(150 * DECIMALS)}),
@@ -755,29 +1080,178 @@ if __name__ == "__main__":
         # Set gauge to relevant initial values with ALICE as a staker
         gauge = Gauge(
             lp_token_address=lp_token.address,
+            ply_address=ply_token.address,
             ve_address=ve.address,
             period_finish=WEEK,
             last_update_time=DAY,
             reward_rate=sp.nat(500),
-            user_reward_per_token_debt=sp.big_map(
-                l={Addresses.ALICE: 0},
+            stakers=sp.big_map(
+                l={
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
+                }
             ),
             reward_per_token=sp.nat(0),
-            rewards=sp.big_map(
+            total_supply=50 * DECIMALS,
+            derived_supply=32 * DECIMALS,
+        )
+
+        scenario += lp_token
+        scenario += ply_token
+        scenario += ve
+        scenario += gauge
+
+        # Mint PLY tokens for the gauge
+        scenario += ply_token.mint(
+            address=gauge.address,
+            value=1000 * DECIMALS,
+        ).run(sender=Addresses.ADMIN)
+
+        # Mint lp tokens for ALICE
+        scenario += lp_token.mint(
+            address=Addresses.ALICE,
+            value=sp.nat(50 * DECIMALS),
+        ).run(sender=Addresses.ADMIN)
+
+        # Approve tokens for ALICE with gauge as spender
+        scenario += lp_token.approve(
+            spender=gauge.address,
+            value=sp.nat(50 * DECIMALS),
+        ).run(sender=Addresses.ALICE)
+
+        # When ALICE stakes more LP tokens and claims her reward at 2 * DAY
+        scenario += gauge.stake(amount=50 * DECIMALS, token_id=1, claim_reward=True).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(2 * DAY),
+        )
+
+        # Predicted values
+        reward_per_token_ = (DAY * 500 * PRECISION) // (32 * DECIMALS)
+        reward_ = (reward_per_token_ * 32 * DECIMALS) // PRECISION
+
+        # Storage is updated correctly
+        scenario.verify(gauge.data.total_supply == 100 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].balance == 100 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 64 * DECIMALS)
+        scenario.verify(gauge.data.derived_supply == 64 * DECIMALS)
+
+        # ALICE receives her ply reward
+        scenario.verify(ply_token.data.balances[Addresses.ALICE].balance == reward_)
+
+    ########################
+    # withdraw (valid test)
+    ########################
+
+    @sp.add_test(name="withdraw works correctly for partial withdrawal")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Staking LP token
+        lp_token = FA12(admin=Addresses.ADMIN)
+
+        # Initialize dummy voting powers for token id's 1 and 2 in ve
+        ve = VE(
+            powers=sp.big_map(l={1: sp.nat(100 * DECIMALS), 2: sp.nat(150 * DECIMALS)}),
+            total_power=sp.nat(250 * DECIMALS),
+        )
+
+        # Set gauge to relevant initial values with ALICE as a staker
+        gauge = Gauge(
+            lp_token_address=lp_token.address,
+            ve_address=ve.address,
+            period_finish=WEEK,
+            last_update_time=DAY,
+            reward_rate=sp.nat(500),
+            stakers=sp.big_map(
                 l={
-                    Addresses.ALICE: 0,
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
                 }
             ),
-            attached_tokens=sp.big_map(
-                l={Addresses.ALICE: 1},
-            ),
-            balances=sp.big_map(
-                l={Addresses.ALICE: 50 * DECIMALS},
-            ),
+            reward_per_token=sp.nat(0),
             total_supply=50 * DECIMALS,
-            derived_balances=sp.big_map(
-                l={Addresses.ALICE: 32 * DECIMALS},
+            derived_supply=32 * DECIMALS,
+        )
+
+        scenario += lp_token
+        scenario += ve
+        scenario += gauge
+
+        # Mint L.P tokens for the gauge
+        scenario += lp_token.mint(
+            address=gauge.address,
+            value=sp.nat(50 * DECIMALS),
+        ).run(sender=Addresses.ADMIN)
+
+        # When ALICE withdraws her stake
+        scenario += gauge.withdraw(25 * DECIMALS).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(2 * DAY),  # a DAY after staking
+        )
+
+        # Predicted values
+        reward_per_token_ = (DAY * 500 * PRECISION) // (32 * DECIMALS)
+        reward_ = (reward_per_token_ * 32 * DECIMALS) // PRECISION
+
+        # Storage is updated correctly
+        scenario.verify(gauge.data.total_supply == 25 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].balance == 25 * DECIMALS)
+        scenario.verify(gauge.data.reward_per_token == reward_per_token_)
+        scenario.verify(gauge.data.last_update_time == 2 * DAY)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == reward_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 16 * DECIMALS)
+        scenario.verify(gauge.data.derived_supply == 16 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].attached_token == 1)
+
+        # ALICE received withdrawn LP tokens
+        scenario.verify(lp_token.data.balances[Addresses.ALICE].balance == 25 * DECIMALS)
+
+    @sp.add_test(name="withdraw works correctly for complete withdrawal")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Staking LP token
+        lp_token = FA12(admin=Addresses.ADMIN)
+
+        # Initialize dummy voting powers for token id's 1 and 2 in ve
+        ve = VE(
+            powers=sp.big_map(l={1: sp.nat(100 * DECIMALS), 2: sp.nat(150 * DECIMALS)}),
+            total_power=sp.nat(250 * DECIMALS),
+        )
+
+        # Set gauge to relevant initial values with ALICE as a staker
+        gauge = Gauge(
+            lp_token_address=lp_token.address,
+            ve_address=ve.address,
+            period_finish=WEEK,
+            last_update_time=DAY,
+            reward_rate=sp.nat(500),
+            stakers=sp.big_map(
+                l={
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
+                }
             ),
+            reward_per_token=sp.nat(0),
+            total_supply=50 * DECIMALS,
             derived_supply=32 * DECIMALS,
         )
 
@@ -803,14 +1277,14 @@ if __name__ == "__main__":
 
         # Storage is updated correctly
         scenario.verify(gauge.data.total_supply == 0)
-        scenario.verify(gauge.data.balances[Addresses.ALICE] == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].balance == 0)
         scenario.verify(gauge.data.reward_per_token == reward_per_token_)
         scenario.verify(gauge.data.last_update_time == 2 * DAY)
-        scenario.verify(gauge.data.user_reward_per_token_debt[Addresses.ALICE] == reward_per_token_)
-        scenario.verify(gauge.data.rewards[Addresses.ALICE] == reward_)
-        scenario.verify(gauge.data.derived_balances[Addresses.ALICE] == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == reward_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 0)
         scenario.verify(gauge.data.derived_supply == 0)
-        scenario.verify(~gauge.data.attached_tokens.contains(Addresses.ALICE))
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].attached_token == 0)
 
         # ALICE received withdrawn LP tokens
         scenario.verify(lp_token.data.balances[Addresses.ALICE].balance == 50 * DECIMALS)
@@ -875,25 +1349,19 @@ if __name__ == "__main__":
             period_finish=WEEK,
             last_update_time=DAY,
             reward_rate=sp.nat(500),
-            user_reward_per_token_debt=sp.big_map(
-                l={Addresses.ALICE: 0},
-            ),
-            reward_per_token=sp.nat(0),
-            rewards=sp.big_map(
+            stakers=sp.big_map(
                 l={
-                    Addresses.ALICE: 0,
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
                 }
             ),
-            attached_tokens=sp.big_map(
-                l={Addresses.ALICE: 1},
-            ),
-            balances=sp.big_map(
-                l={Addresses.ALICE: 50 * DECIMALS},
-            ),
+            reward_per_token=sp.nat(0),
             total_supply=50 * DECIMALS,
-            derived_balances=sp.big_map(
-                l={Addresses.ALICE: 32 * DECIMALS},
-            ),
             derived_supply=32 * DECIMALS,
         )
 
@@ -919,12 +1387,12 @@ if __name__ == "__main__":
 
         # Storage is updated correctly
         scenario.verify(gauge.data.total_supply == 50 * DECIMALS)
-        scenario.verify(gauge.data.balances[Addresses.ALICE] == 50 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].balance == 50 * DECIMALS)
         scenario.verify(gauge.data.reward_per_token == reward_per_token_)
         scenario.verify(gauge.data.last_update_time == 2 * DAY)
-        scenario.verify(gauge.data.user_reward_per_token_debt[Addresses.ALICE] == reward_per_token_)
-        scenario.verify(gauge.data.rewards[Addresses.ALICE] == 0)
-        scenario.verify(gauge.data.derived_balances[Addresses.ALICE] == 32 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 32 * DECIMALS)
         scenario.verify(gauge.data.derived_supply == 32 * DECIMALS)
 
         # ALICE receives her ply reward
@@ -950,25 +1418,19 @@ if __name__ == "__main__":
             period_finish=WEEK,
             last_update_time=DAY,
             reward_rate=sp.nat(500),
-            user_reward_per_token_debt=sp.big_map(
-                l={Addresses.ALICE: 0},
-            ),
-            reward_per_token=sp.nat(0),
-            rewards=sp.big_map(
+            stakers=sp.big_map(
                 l={
-                    Addresses.ALICE: 0,
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
                 }
             ),
-            attached_tokens=sp.big_map(
-                l={Addresses.ALICE: 1},
-            ),
-            balances=sp.big_map(
-                l={Addresses.ALICE: 50 * DECIMALS},
-            ),
+            reward_per_token=sp.nat(0),
             total_supply=50 * DECIMALS,
-            derived_balances=sp.big_map(
-                l={Addresses.ALICE: 32 * DECIMALS},
-            ),
             derived_supply=32 * DECIMALS,
         )
 
@@ -994,49 +1456,403 @@ if __name__ == "__main__":
 
         # Storage is updated correctly
         scenario.verify(gauge.data.total_supply == 50 * DECIMALS)
-        scenario.verify(gauge.data.balances[Addresses.ALICE] == 50 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].balance == 50 * DECIMALS)
         scenario.verify(gauge.data.reward_per_token == reward_per_token_)
         scenario.verify(gauge.data.last_update_time == WEEK)
-        scenario.verify(gauge.data.user_reward_per_token_debt[Addresses.ALICE] == reward_per_token_)
-        scenario.verify(gauge.data.rewards[Addresses.ALICE] == 0)
-        scenario.verify(gauge.data.derived_balances[Addresses.ALICE] == 32 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 32 * DECIMALS)
         scenario.verify(gauge.data.derived_supply == 32 * DECIMALS)
 
         # ALICE receives her ply reward
         scenario.verify(ply_token.data.balances[Addresses.ALICE].balance == reward_)
 
-    ########################
-    # recharge (valid test)
-    ########################
+    ##############################
+    # get_reward_for (valid test)
+    ##############################
 
-    @sp.add_test(name="recharge correctly updates the reward metrics")
+    @sp.add_test(name="get_reward_for pays out the rewards of a staker when called by voter")
     def test():
         scenario = sp.test_scenario()
 
+        # Reward PLY token
+        ply_token = FA12(admin=Addresses.ADMIN)
+
         # Set gauge to relevant initial values with ALICE as a staker
         gauge = Gauge(
+            ply_address=ply_token.address,
+            voter=Addresses.CONTRACT,
             period_finish=WEEK,
             last_update_time=DAY,
             reward_rate=sp.nat(500),
-            user_reward_per_token_debt=sp.big_map(
-                l={Addresses.ALICE: 0},
+            stakers=sp.big_map(
+                l={
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
+                }
             ),
-            reward_per_token=sp.nat(0),
-            rewards=sp.big_map(
+            total_supply=50 * DECIMALS,
+            derived_supply=32 * DECIMALS,
+        )
+
+        scenario += ply_token
+        scenario += gauge
+
+        # Mint PLY tokens for the gauge
+        scenario += ply_token.mint(
+            address=gauge.address,
+            value=1000 * DECIMALS,
+        ).run(sender=Addresses.ADMIN)
+
+        # When voter claims the reward of ALICE at 2 * DAY
+        scenario += gauge.get_reward_for(Addresses.ALICE).run(
+            sender=Addresses.CONTRACT,
+            now=sp.timestamp(2 * DAY),
+        )
+
+        # Predicted values
+        reward_per_token_ = (DAY * 500 * PRECISION) // (32 * DECIMALS)
+        reward_ = (reward_per_token_ * 32 * DECIMALS) // PRECISION
+
+        # Storage is updated correctly
+        scenario.verify(gauge.data.reward_per_token == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == 0)
+
+        # ALICE receives her ply reward
+        scenario.verify(ply_token.data.balances[Addresses.ALICE].balance == reward_)
+
+    ################################
+    # get_reward_for (failure test)
+    ################################
+
+    @sp.add_test(name="get_reward_for fails if not called by voter")
+    def test():
+        scenario = sp.test_scenario()
+
+        gauge = Gauge(voter=Addresses.CONTRACT)
+
+        scenario += gauge
+
+        # When ALICE calls get_reward_for directly, txn fails
+        scenario += gauge.get_reward_for(Addresses.ALICE).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.NOT_AUTHORISED,
+        )
+
+    ####################
+    # exit (valid test)
+    ####################
+
+    @sp.add_test(name="exit withdraws the whole stake, pays out rewards and detaches the boost token")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Staking LP token and reward PLY token
+        lp_token = FA12(admin=Addresses.ADMIN)
+        ply_token = FA12(admin=Addresses.ADMIN)
+
+        # Initialize dummy voting powers for token id's 1 and 2 in ve
+        ve = VE(
+            powers=sp.big_map(l={1: sp.nat(100 * DECIMALS), 2: sp.nat(150 * DECIMALS)}),
+            total_power=sp.nat(250 * DECIMALS),
+        )
+
+        # Set gauge to relevant initial values with ALICE as a staker
+        gauge = Gauge(
+            lp_token_address=lp_token.address,
+            ply_address=ply_token.address,
+            ve_address=ve.address,
+            period_finish=WEEK,
+            last_update_time=DAY,
+            reward_rate=sp.nat(500),
+            stakers=sp.big_map(
                 l={
-                    Addresses.ALICE: 0,
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
                 }
             ),
-            attached_tokens=sp.big_map(
-                l={Addresses.ALICE: 1},
+            reward_per_token=sp.nat(0),
+            total_supply=50 * DECIMALS,
+            derived_supply=32 * DECIMALS,
+        )
+
+        scenario += lp_token
+        scenario += ply_token
+        scenario += ve
+        scenario += gauge
+
+        # Mint PLY tokens for the gauge
+        scenario += ply_token.mint(
+            address=gauge.address,
+            value=1000 * DECIMALS,
+        ).run(sender=Addresses.ADMIN)
+
+        # Mint L.P tokens for the gauge
+        scenario += lp_token.mint(
+            address=gauge.address,
+            value=sp.nat(50 * DECIMALS),
+        ).run(sender=Addresses.ADMIN)
+
+        # When ALICE exits the gauge at 2 * DAY
+        scenario += gauge.exit().run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(2 * DAY),
+        )
+
+        # Predicted values
+        reward_per_token_ = (DAY * 500 * PRECISION) // (32 * DECIMALS)
+        reward_ = (reward_per_token_ * 32 * DECIMALS) // PRECISION
+
+        # Storage is updated correctly
+        scenario.verify(gauge.data.total_supply == 0)
+        scenario.verify(gauge.data.derived_supply == 0)
+        scenario.verify(gauge.data.reward_per_token == reward_per_token_)
+        scenario.verify(gauge.data.last_update_time == 2 * DAY)
+        scenario.verify(~gauge.data.stakers.contains(Addresses.ALICE))
+
+        # ALICE receives her LP tokens and ply reward
+        scenario.verify(lp_token.data.balances[Addresses.ALICE].balance == 50 * DECIMALS)
+        scenario.verify(ply_token.data.balances[Addresses.ALICE].balance == reward_)
+
+    ######################
+    # exit (failure test)
+    ######################
+
+    @sp.add_test(name="exit fails if the sender has no stake")
+    def test():
+        scenario = sp.test_scenario()
+
+        gauge = Gauge()
+
+        scenario += gauge
+
+        # When BOB tries to exit without a stake, txn fails
+        scenario += gauge.exit().run(
+            sender=Addresses.BOB,
+            valid=False,
+            exception=Errors.NO_STAKE_TO_WITHDRAW,
+        )
+
+    ############################
+    # update_boost (valid test)
+    ############################
+
+    @sp.add_test(name="update_boost correctly re-points the boost of a staker")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy voting powers for token id's 1 and 2 in ve
+        ve = VE(
+            powers=sp.big_map(l={1: sp.nat(100 * DECIMALS), 2: sp.nat(150 * DECIMALS)}),
+            total_power=sp.nat(250 * DECIMALS),
+        )
+
+        # Set gauge to relevant initial values with ALICE as a staker boosted by token 1
+        gauge = Gauge(
+            ve_address=ve.address,
+            period_finish=WEEK,
+            last_update_time=DAY,
+            reward_rate=sp.nat(500),
+            stakers=sp.big_map(
+                l={
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
+                }
             ),
-            balances=sp.big_map(
-                l={Addresses.ALICE: 50 * DECIMALS},
+            reward_per_token=sp.nat(0),
+            total_supply=50 * DECIMALS,
+            derived_supply=32 * DECIMALS,
+        )
+
+        scenario += ve
+        scenario += gauge
+
+        # When ve notifies the gauge that ALICE swapped token 1 for token 2
+        scenario += gauge.update_boost(owner=Addresses.ALICE, prev_token_id=1, token_id=2).run(
+            sender=ve.address,
+            now=sp.timestamp(2 * DAY),
+        )
+
+        # Predicted values
+        reward_per_token_ = (DAY * 500 * PRECISION) // (32 * DECIMALS)
+        reward_ = (reward_per_token_ * 32 * DECIMALS) // PRECISION
+
+        # Storage is updated correctly
+        scenario.verify(gauge.data.reward_per_token == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == reward_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].attached_token == 2)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 38 * DECIMALS)
+        scenario.verify(gauge.data.derived_supply == 38 * DECIMALS)
+
+        # When ve notifies the gauge that ALICE removed her boost
+        scenario += gauge.update_boost(owner=Addresses.ALICE, prev_token_id=2, token_id=0).run(
+            sender=ve.address,
+            now=sp.timestamp(2 * DAY),
+        )
+
+        # Storage is updated correctly
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].attached_token == 0)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 20 * DECIMALS)
+        scenario.verify(gauge.data.derived_supply == 20 * DECIMALS)
+
+    ##############################
+    # update_boost (failure test)
+    ##############################
+
+    @sp.add_test(name="update_boost fails if not called by ve or if attachment records do not match")
+    def test():
+        scenario = sp.test_scenario()
+
+        gauge = Gauge(
+            ve_address=Addresses.CONTRACT,
+            stakers=sp.big_map(
+                l={
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=0,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
+                }
             ),
             total_supply=50 * DECIMALS,
-            derived_balances=sp.big_map(
-                l={Addresses.ALICE: 32 * DECIMALS},
+        )
+
+        scenario += gauge
+
+        # When ALICE calls update_boost directly, txn fails
+        scenario += gauge.update_boost(owner=Addresses.ALICE, prev_token_id=1, token_id=2).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.NOT_AUTHORISED,
+        )
+
+        # When the boost is updated for BOB who has no stake, txn fails
+        scenario += gauge.update_boost(owner=Addresses.BOB, prev_token_id=0, token_id=2).run(
+            sender=Addresses.CONTRACT,
+            valid=False,
+            exception=Errors.NO_STAKE_TO_BOOST,
+        )
+
+        # When the previous token does not match the gauge's records, txn fails
+        scenario += gauge.update_boost(owner=Addresses.ALICE, prev_token_id=0, token_id=2).run(
+            sender=Addresses.CONTRACT,
+            valid=False,
+            exception=Errors.INVALID_ATTACHED_TOKEN,
+        )
+
+    ####################
+    # kick (valid test)
+    ####################
+
+    @sp.add_test(name="kick correctly refreshes the derived balances of multiple stakers")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy voting powers for token id's 1 and 2 in ve, decayed since the stakers boosted
+        ve = VE(
+            powers=sp.big_map(l={1: sp.nat(25 * DECIMALS), 2: sp.nat(50 * DECIMALS)}),
+            total_power=sp.nat(250 * DECIMALS),
+        )
+
+        # Set gauge to relevant initial values with ALICE and BOB as boosted stakers
+        gauge = Gauge(
+            ve_address=ve.address,
+            period_finish=WEEK,
+            last_update_time=DAY,
+            reward_rate=sp.nat(500),
+            stakers=sp.big_map(
+                l={
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
+                    Addresses.BOB: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=50 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=2,
+                    ),
+                }
+            ),
+            total_supply=100 * DECIMALS,
+            derived_supply=82 * DECIMALS,
+        )
+
+        scenario += ve
+        scenario += gauge
+
+        # When JOHN kicks ALICE, BOB and MIKE (who has no stake)
+        scenario += gauge.kick([Addresses.ALICE, Addresses.BOB, Addresses.MIKE]).run(
+            sender=Addresses.JOHN,
+            now=sp.timestamp(2 * DAY),
+        )
+
+        # Predicted values
+        reward_per_token_ = (DAY * 500 * PRECISION) // (82 * DECIMALS)
+        reward_alice = (reward_per_token_ * 32 * DECIMALS) // PRECISION
+        reward_bob = (reward_per_token_ * 50 * DECIMALS) // PRECISION
+
+        # Storage is updated correctly
+        scenario.verify(gauge.data.reward_per_token == reward_per_token_)
+        scenario.verify(gauge.data.last_update_time == 2 * DAY)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].rewards == reward_alice)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].reward_per_token_debt == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.ALICE].derived_balance == 26 * DECIMALS)
+        scenario.verify(gauge.data.stakers[Addresses.BOB].rewards == reward_bob)
+        scenario.verify(gauge.data.stakers[Addresses.BOB].reward_per_token_debt == reward_per_token_)
+        scenario.verify(gauge.data.stakers[Addresses.BOB].derived_balance == 32 * DECIMALS)
+        scenario.verify(gauge.data.derived_supply == 58 * DECIMALS)
+        scenario.verify(~gauge.data.stakers.contains(Addresses.MIKE))
+
+    ########################
+    # recharge (valid test)
+    ########################
+
+    @sp.add_test(name="recharge correctly updates the reward metrics")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Set gauge to relevant initial values with ALICE as a staker
+        gauge = Gauge(
+            period_finish=WEEK,
+            last_update_time=DAY,
+            reward_rate=sp.nat(500),
+            stakers=sp.big_map(
+                l={
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
+                }
             ),
+            reward_per_token=sp.nat(0),
+            total_supply=50 * DECIMALS,
             derived_supply=32 * DECIMALS,
         )
 
@@ -1095,4 +1911,147 @@ if __name__ == "__main__":
             exception=Errors.ALREADY_RECHARGED_FOR_EPOCH,
         )
 
+    #############################
+    # recharge_many (valid test)
+    #############################
+
+    @sp.add_test(name="recharge_many folds the amounts of multiple epochs into a single reward rate")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Set gauge to relevant initial values with ALICE as a staker
+        gauge = Gauge(
+            period_finish=WEEK,
+            last_update_time=DAY,
+            reward_rate=sp.nat(500),
+            stakers=sp.big_map(
+                l={
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=0,
+                        attached_token=1,
+                    ),
+                }
+            ),
+            total_supply=50 * DECIMALS,
+            derived_supply=32 * DECIMALS,
+        )
+
+        scenario += gauge
+
+        # When the gauge is recharged with 10 PLY tokens each for epochs 1 and 2 after epoch completion
+        scenario += gauge.recharge_many(
+            [
+                sp.record(amount=10 * DECIMALS, epoch=1),
+                sp.record(amount=10 * DECIMALS, epoch=2),
+            ]
+        ).run(
+            sender=Addresses.CONTRACT,
+            now=sp.timestamp(WEEK + 5),  # 5 is random. Timestamp must be higher than a week
+        )
+
+        # Predicted values
+        reward_per_token_ = (6 * DAY * 500 * PRECISION) // (32 * DECIMALS)
+        reward_rate_ = (20 * DECIMALS) // (WEEK - 5)
+
+        # Storage is updated correctly
+        scenario.verify(gauge.data.reward_per_token == reward_per_token_)
+        scenario.verify(gauge.data.last_update_time == WEEK + 5)
+        scenario.verify(gauge.data.period_finish == 2 * WEEK)
+        scenario.verify(gauge.data.reward_rate == reward_rate_)
+        scenario.verify(gauge.data.recharge_ledger.contains(1))
+        scenario.verify(gauge.data.recharge_ledger.contains(2))
+
+    ###############################
+    # recharge_many (failure test)
+    ###############################
+
+    @sp.add_test(name="recharge_many fails if not called by voter or an epoch is already recharged")
+    def test():
+        scenario = sp.test_scenario()
+
+        gauge = Gauge(
+            recharge_ledger=sp.big_map(
+                l={1: sp.unit},
+            ),
+        )
+
+        scenario += gauge
+
+        # When ALICE calls recharge_many directly, txn fails
+        scenario += gauge.recharge_many([sp.record(amount=10 * DECIMALS, epoch=2)]).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.NOT_AUTHORISED,
+        )
+
+        # When the gauge is recharged again for epoch 1 alongside epoch 2, the txn fails
+        scenario += gauge.recharge_many(
+            [
+                sp.record(amount=10 * DECIMALS, epoch=2),
+                sp.record(amount=10 * DECIMALS, epoch=1),
+            ]
+        ).run(
+            sender=Addresses.CONTRACT,
+            valid=False,
+            exception=Errors.ALREADY_RECHARGED_FOR_EPOCH,
+        )
+
+    ###############################
+    # get_staker_info (valid test)
+    ###############################
+
+    @sp.add_test(name="get_staker_info returns the pending rewards and boost of a staker")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Set gauge to relevant initial values with ALICE as a staker
+        gauge = Gauge(
+            period_finish=WEEK,
+            last_update_time=DAY,
+            reward_rate=sp.nat(500),
+            stakers=sp.big_map(
+                l={
+                    Addresses.ALICE: sp.record(
+                        balance=50 * DECIMALS,
+                        derived_balance=32 * DECIMALS,
+                        reward_per_token_debt=0,
+                        rewards=10,
+                        attached_token=1,
+                    ),
+                }
+            ),
+            total_supply=50 * DECIMALS,
+            derived_supply=32 * DECIMALS,
+        )
+
+        scenario += gauge
+
+        # Move the global reward metrics to 2 * DAY without touching ALICE's record
+        scenario += gauge.kick([]).run(now=sp.timestamp(2 * DAY))
+
+        # Predicted values
+        reward_per_token_ = (DAY * 500 * PRECISION) // (32 * DECIMALS)
+        reward_ = 10 + (reward_per_token_ * 32 * DECIMALS) // PRECISION
+
+        # Correct pending rewards and boost are returned (32 / 20 = 1.6x)
+        scenario.verify_equal(
+            gauge.get_staker_info(Addresses.ALICE),
+            sp.record(
+                balance=50 * DECIMALS,
+                derived_balance=32 * DECIMALS,
+                earned=reward_,
+                boost=(16 * PRECISION) // 10,
+                attached_token=1,
+            ),
+        )
+
+        # Zero values are returned for an address without a stake
+        scenario.verify_equal(
+            gauge.get_staker_info(Addresses.BOB),
+            sp.record(balance=0, derived_balance=0, earned=0, boost=0, attached_token=0),
+        )
+
     sp.add_compilation_target("gauge", Gauge())
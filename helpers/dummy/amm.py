@@ -0,0 +1,15 @@
+import smartpy as sp
+
+# Dummy contract to test fee forwarding calls to the AMMs from within the Voter contract
+
+
+class AMM(sp.Contract):
+    def __init__(self):
+        self.init(forward_fee_val=sp.none, forward_fee_count=sp.nat(0))
+
+    @sp.entry_point
+    def forwardFee(self, params):
+        sp.set_type(params, sp.TRecord(feeDistributor=sp.TAddress, epoch=sp.TNat))
+
+        self.data.forward_fee_val = sp.some(params)
+        self.data.forward_fee_count += 1
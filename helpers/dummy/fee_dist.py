@@ -3,7 +3,7 @@ import smartpy as sp
 
 class FeeDist(sp.Contract):
     def __init__(self):
-        self.init(claim_val=sp.none)
+        self.init(claim_val=sp.none, claim_many_val=sp.none, sweep_val=sp.none)
 
     @sp.entry_point
     def claim(self, params):
@@ -18,3 +18,22 @@ class FeeDist(sp.Contract):
         )
 
         self.data.claim_val = sp.some(params)
+
+    @sp.entry_point
+    def claim_many(self, params):
+        sp.set_type(
+            params,
+            sp.TRecord(
+                token_id=sp.TNat,
+                owner=sp.TAddress,
+                amm_vote_shares=sp.TMap(sp.TAddress, sp.TList(sp.TRecord(epoch=sp.TNat, share=sp.TNat))),
+            ).layout(("token_id", ("owner", "amm_vote_shares"))),
+        )
+
+        self.data.claim_many_val = sp.some(params)
+
+    @sp.entry_point
+    def sweep(self, params):
+        sp.set_type(params, sp.TRecord(amm=sp.TAddress, epoch=sp.TNat).layout(("amm", "epoch")))
+
+        self.data.sweep_val = sp.some(params)
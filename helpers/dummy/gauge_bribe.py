@@ -1,11 +1,21 @@
 import smartpy as sp
 
-# Dummy contract to test calls to Bribe and Gauge contracts from within the Voter contract
+# Dummy contract to test calls to Bribe and Gauge contracts from within the Voter & VoteEscrow contracts
 
 
 class GaugeBribe(sp.Contract):
     def __init__(self):
-        self.init(claim_val=sp.none, return_val=sp.none, recharge_val=sp.none)
+        self.init(
+            claim_val=sp.none,
+            claim_many_val=sp.none,
+            claim_epoch_val=sp.none,
+            return_val=sp.none,
+            return_epoch_val=sp.none,
+            recharge_val=sp.none,
+            recharge_many_val=sp.none,
+            boost_val=sp.none,
+            reward_for_val=sp.none,
+        )
 
     @sp.entry_point
     def claim(self, params):
@@ -22,14 +32,78 @@ class GaugeBribe(sp.Contract):
 
         self.data.claim_val = sp.some(params)
 
+    @sp.entry_point
+    def claim_many(self, params):
+        sp.set_type(
+            params,
+            sp.TRecord(
+                token_id=sp.TNat,
+                owner=sp.TAddress,
+                claims=sp.TList(
+                    sp.TRecord(
+                        epoch=sp.TNat,
+                        bribe_id=sp.TNat,
+                        vote_share=sp.TNat,
+                    ).layout(("epoch", ("bribe_id", "vote_share")))
+                ),
+            ).layout(("token_id", ("owner", "claims"))),
+        )
+
+        self.data.claim_many_val = sp.some(params)
+
+    @sp.entry_point
+    def claim_epoch(self, params):
+        sp.set_type(
+            params,
+            sp.TRecord(
+                token_id=sp.TNat,
+                owner=sp.TAddress,
+                epoch=sp.TNat,
+                vote_share=sp.TNat,
+            ).layout(("token_id", ("owner", ("epoch", "vote_share")))),
+        )
+
+        self.data.claim_epoch_val = sp.some(params)
+
     @sp.entry_point
     def return_bribe(self, params):
         sp.set_type(params, sp.TRecord(epoch=sp.TNat, bribe_id=sp.TNat))
 
         self.data.return_val = sp.some(params)
 
+    @sp.entry_point
+    def return_epoch(self, params):
+        sp.set_type(params, sp.TNat)
+
+        self.data.return_epoch_val = sp.some(params)
+
     @sp.entry_point
     def recharge(self, params):
         sp.set_type(params, sp.TRecord(amount=sp.TNat, epoch=sp.TNat))
 
         self.data.recharge_val = sp.some(params)
+
+    @sp.entry_point
+    def recharge_many(self, params):
+        sp.set_type(params, sp.TList(sp.TRecord(amount=sp.TNat, epoch=sp.TNat)))
+
+        self.data.recharge_many_val = sp.some(params)
+
+    @sp.entry_point
+    def update_boost(self, params):
+        sp.set_type(
+            params,
+            sp.TRecord(
+                owner=sp.TAddress,
+                prev_token_id=sp.TNat,
+                token_id=sp.TNat,
+            ).layout(("owner", ("prev_token_id", "token_id"))),
+        )
+
+        self.data.boost_val = sp.some(params)
+
+    @sp.entry_point
+    def get_reward_for(self, owner):
+        sp.set_type(owner, sp.TAddress)
+
+        self.data.reward_for_val = sp.some(owner)
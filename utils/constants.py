@@ -16,6 +16,12 @@ PRECISION = 10 ** 18
 # Precision for vote share calculation
 VOTE_SHARE_MULTIPLIER = 10 ** 18
 
+# Granularity of vote weights i.e basis points of a token's voting power
+VOTE_WEIGHT_GRANULARITY = 10_000
+
+# Number of past epochs for which votes are retained for claims and recharges
+VOTE_RETENTION_EPOCHS = 52
+
 # PLY total supply
 MAX_SUPPLY = 1_000_000_000 * DECIMALS
 
@@ -18,12 +18,18 @@ ZERO_VOTE_NOT_ALLOWED = "ZERO_VOTE_NOT_ALLOWED"
 SENDER_DOES_NOT_OWN_LOCK = "SENDER_DOES_NOT_OWN_LOCK"
 PREVIOUS_EPOCH_YET_TO_END = "PREVIOUS_EPOCH_YET_TO_END"
 NOT_ENOUGH_VOTING_POWER_AVAILABLE = "NOT_ENOUGH_VOTING_POWER_AVAILABLE"
+VOTE_WEIGHTS_EXCEED_TOTAL = "VOTE_WEIGHTS_EXCEED_TOTAL"
+EPOCH_EXPIRED = "EPOCH_EXPIRED"
+EPOCH_WITHIN_RETENTION = "EPOCH_WITHIN_RETENTION"
 
 # Bribe
 EPOCH_IN_THE_PAST = "EPOCH_IN_THE_PAST"
 EPOCH_NOT_YET_OVER = "EPOCH_NOT_YET_OVER"
 INCORRECT_TEZ_VALUE_SENT = "INCORRECT_TEZ_VALUE_SENT"
 INVALID_BRIBE_ID_OR_EPOCH = "INVALID_BRIBE_ID_OR_EPOCH"
+INVALID_EPOCH_RANGE = "INVALID_EPOCH_RANGE"
+BRIBE_NOT_RETURNED = "BRIBE_NOT_RETURNED"
+NO_CONTRIBUTION_TO_REFUND = "NO_CONTRIBUTION_TO_REFUND"
 VOTER_HAS_ALREADY_CLAIMED_BRIBE = "VOTER_HAS_ALREADY_CLAIMED_BRIBE"
 
 # Gauge
@@ -32,6 +38,8 @@ ZERO_STAKE_NOT_ALLOWED = "ZERO_STAKE_NOT_ALLOWED"
 SENDER_DOES_NOT_OWN_LOCK = "SENDER_DOES_NOT_OWN_LOCK"
 ZERO_WITHDRAWAL_NOT_ALLOWED = "ZERO_WITHDRAWAL_NOT_ALLOWED"
 ALREADY_RECHARGED_FOR_EPOCH = "ALREADY_RECHARGED_FOR_EPOCH"
+NO_STAKE_TO_BOOST = "NO_STAKE_TO_BOOST"
+INVALID_ATTACHED_TOKEN = "INVALID_ATTACHED_TOKEN"
 
 # Fee Distributor
 INVALID_TOKEN = "INVALID_TOKEN"
@@ -48,6 +56,7 @@ CLAIMING_BEFORE_24_HOURS = "CLAIMING_BEFORE_24_HOURS"
 AMM_INVALID = "AMM_INVALID"
 AMM_ALREADY_ADDED = "AMM_ALREADY_ADDED"
 NO_ADMIN_PROPOSED = "NO_ADMIN_PROPOSED"
+INVALID_BOOST_TIME = "INVALID_BOOST_TIME"
 
 # Generic
 INVALID_VIEW = "INVALID_VIEW"
@@ -69,6 +69,58 @@ def transfer_FA2(params):
         )
 
 
+def transfer_FA2_batch(params):
+    sp.set_type(
+        params,
+        sp.TRecord(
+            from_=sp.TAddress,
+            transfers=sp.TList(
+                sp.TRecord(
+                    token_address=sp.TAddress,
+                    token_id=sp.TNat,
+                    to_=sp.TAddress,
+                    amount=sp.TNat,
+                ),
+            ),
+        ),
+    )
+
+    tx_type = sp.TRecord(to_=sp.TAddress, token_id=sp.TNat, amount=sp.TNat,).layout(
+        ("to_", ("token_id", "amount")),
+    )
+
+    param_type = sp.TList(
+        sp.TRecord(
+            from_=sp.TAddress,
+            txs=sp.TList(tx_type),
+        ).layout(("from_", "txs"))
+    )
+
+    # Group the transfers by token contract
+    batches = sp.local("batches", sp.map(l={}, tkey=sp.TAddress, tvalue=sp.TList(tx_type)))
+    with sp.for_("transfer", params.transfers) as transfer:
+        with sp.if_(transfer.amount > 0):
+            with sp.if_(~batches.value.contains(transfer.token_address)):
+                batches.value[transfer.token_address] = sp.list(l=[], t=tx_type)
+            batches.value[transfer.token_address].push(
+                sp.record(to_=transfer.to_, token_id=transfer.token_id, amount=transfer.amount)
+            )
+
+    # Single transfer operation per token contract
+    with sp.for_("batch", batches.value.items()) as batch:
+        c = sp.contract(
+            param_type,
+            batch.key,
+            "transfer",
+        ).open_some()
+
+        sp.transfer(
+            [sp.record(from_=params.from_, txs=batch.value)],
+            sp.tez(0),
+            c,
+        )
+
+
 # VE attachment for Gauge LP boosting
 def update_token_attachments(params):
     sp.set_type(
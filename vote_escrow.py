@@ -6,6 +6,7 @@ TokenUtils = sp.io.import_script_from_url("file:utils/token.py")
 Constants = sp.io.import_script_from_url("file:utils/constants.py")
 Addresses = sp.io.import_script_from_url("file:helpers/addresses.py")
 Voter = sp.io.import_script_from_url("file:helpers/dummy/voter.py").Voter
+GaugeBribe = sp.io.import_script_from_url("file:helpers/dummy/gauge_bribe.py").GaugeBribe
 Utils = sp.io.import_script_from_url("file:utils/misc.py")
 SVG = sp.io.import_script_from_url("file:utils/svg.py")
 
@@ -77,6 +78,14 @@ class Types:
         epoch=sp.TNat,
     ).layout(("token_id", "epoch"))
 
+    UPDATE_BOOSTS_PARAMS = sp.TList(
+        sp.TRecord(
+            gauge=sp.TAddress,
+            prev_token_id=sp.TNat,
+            token_id=sp.TNat,
+        ).layout(("gauge", ("prev_token_id", "token_id")))
+    )
+
     # Enumeration for voting power readers
     CURRENT = sp.nat(0)
     WHOLE_WEEK = sp.nat(1)
@@ -366,6 +375,49 @@ class VoteEscrow(sp.Contract):
                         # Detach token/lock
                         del self.data.attached[token_id]
 
+    @sp.entry_point
+    def update_boosts(self, params):
+        sp.set_type(params, Types.UPDATE_BOOSTS_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        with sp.for_("boost", params) as boost:
+            # Detach the token currently boosting the sender's stake in the gauge
+            with sp.if_(boost.prev_token_id != 0):
+                # Sanity checks
+                sp.verify(self.data.ledger.get((sp.sender, boost.prev_token_id), 0) == 1, Errors.NOT_AUTHORISED)
+                sp.verify(self.data.attached.contains(boost.prev_token_id), Errors.INVALID_ATTACHED_TOKEN)
+                sp.verify(self.data.attached[boost.prev_token_id] == boost.gauge, Errors.NOT_AUTHORISED)
+
+                # Detach token/lock
+                del self.data.attached[boost.prev_token_id]
+
+            # Attach the fresh token to the gauge
+            with sp.if_(boost.token_id != 0):
+                # Sanity checks
+                sp.verify(~self.data.attached.contains(boost.token_id), Errors.LOCK_IS_ATTACHED)
+                sp.verify(self.data.ledger.get((sp.sender, boost.token_id), 0) == 1, Errors.NOT_AUTHORISED)
+
+                # Attach token/lock
+                self.data.attached[boost.token_id] = boost.gauge
+
+            # Notify the gauge to recalculate the boost for the sender's stake
+            c = sp.contract(
+                sp.TRecord(
+                    owner=sp.TAddress,
+                    prev_token_id=sp.TNat,
+                    token_id=sp.TNat,
+                ).layout(("owner", ("prev_token_id", "token_id"))),
+                boost.gauge,
+                "update_boost",
+            ).open_some()
+            sp.transfer(
+                sp.record(owner=sp.sender, prev_token_id=boost.prev_token_id, token_id=boost.token_id),
+                sp.tez(0),
+                c,
+            )
+
     @sp.private_lambda(with_storage="read-write", wrap_call=True)
     def record_global_checkpoint(self, params):
         sp.set_type(
@@ -784,42 +836,50 @@ class VoteEscrow(sp.Contract):
         # Sanity checks
         sp.verify((params.time == Types.CURRENT) | (params.time == Types.WHOLE_WEEK), Errors.INVALID_TIME)
         sp.verify(self.data.locks.contains(params.token_id), Errors.LOCK_DOES_NOT_EXIST)
-        sp.verify(ts >= self.data.token_checkpoints[(params.token_id, 1)].ts, Errors.TOO_EARLY_TIMESTAMP)
 
-        # Store as local variables to keep on stack
-        index_ = sp.compute(self.data.num_token_checkpoints[params.token_id])
-        last_checkpoint = sp.compute(self.data.token_checkpoints[(params.token_id, index_)])
-
-        with sp.if_(ts >= last_checkpoint.ts):
-            i_bias = last_checkpoint.bias
-            slope = last_checkpoint.slope
-            f_bias = sp.compute(i_bias - (sp.as_nat(ts - last_checkpoint.ts) * slope) // SLOPE_MULTIPLIER)
-            with sp.if_(f_bias < 0):
-                sp.result(sp.nat(0))
-            with sp.else_():
-                sp.result(sp.as_nat(f_bias))
+        # Store as local variable to keep on stack
+        first_ts = sp.compute(self.data.token_checkpoints[(params.token_id, 1)].ts)
+
+        # A lock created after the start of the week had no voting power at the rounded timestamp
+        with sp.if_((params.time == Types.WHOLE_WEEK) & (ts < first_ts)):
+            sp.result(sp.nat(0))
         with sp.else_():
-            high = sp.local("high", sp.as_nat(index_ - 2))
-            low = sp.local("low", sp.nat(0))
-            mid = sp.local("mid", sp.nat(0))
+            sp.verify(ts >= first_ts, Errors.TOO_EARLY_TIMESTAMP)
 
-            with sp.while_(
-                (low.value < high.value) & (self.data.token_checkpoints[(params.token_id, mid.value + 1)].ts != ts)
-            ):
-                mid.value = (low.value + high.value + 1) // 2
-                with sp.if_(self.data.token_checkpoints[(params.token_id, mid.value + 1)].ts < ts):
-                    low.value = mid.value
+            # Store as local variables to keep on stack
+            index_ = sp.compute(self.data.num_token_checkpoints[params.token_id])
+            last_checkpoint = sp.compute(self.data.token_checkpoints[(params.token_id, index_)])
+
+            with sp.if_(ts >= last_checkpoint.ts):
+                i_bias = last_checkpoint.bias
+                slope = last_checkpoint.slope
+                f_bias = sp.compute(i_bias - (sp.as_nat(ts - last_checkpoint.ts) * slope) // SLOPE_MULTIPLIER)
+                with sp.if_(f_bias < 0):
+                    sp.result(sp.nat(0))
                 with sp.else_():
-                    high.value = sp.as_nat(mid.value - 1)
-
-            with sp.if_(self.data.token_checkpoints[(params.token_id, mid.value + 1)].ts == ts):
-                sp.result(self.data.token_checkpoints[(params.token_id, mid.value + 1)].bias)
+                    sp.result(sp.as_nat(f_bias))
             with sp.else_():
-                checkpoint = sp.compute(self.data.token_checkpoints[(params.token_id, low.value + 1)])
-                bias = checkpoint.bias
-                slope = checkpoint.slope
-                d_ts = ts - checkpoint.ts
-                sp.result(sp.as_nat(bias - (sp.as_nat(d_ts) * slope) // SLOPE_MULTIPLIER))
+                high = sp.local("high", sp.as_nat(index_ - 2))
+                low = sp.local("low", sp.nat(0))
+                mid = sp.local("mid", sp.nat(0))
+
+                with sp.while_(
+                    (low.value < high.value) & (self.data.token_checkpoints[(params.token_id, mid.value + 1)].ts != ts)
+                ):
+                    mid.value = (low.value + high.value + 1) // 2
+                    with sp.if_(self.data.token_checkpoints[(params.token_id, mid.value + 1)].ts < ts):
+                        low.value = mid.value
+                    with sp.else_():
+                        high.value = sp.as_nat(mid.value - 1)
+
+                with sp.if_(self.data.token_checkpoints[(params.token_id, mid.value + 1)].ts == ts):
+                    sp.result(self.data.token_checkpoints[(params.token_id, mid.value + 1)].bias)
+                with sp.else_():
+                    checkpoint = sp.compute(self.data.token_checkpoints[(params.token_id, low.value + 1)])
+                    bias = checkpoint.bias
+                    slope = checkpoint.slope
+                    d_ts = ts - checkpoint.ts
+                    sp.result(sp.as_nat(bias - (sp.as_nat(d_ts) * slope) // SLOPE_MULTIPLIER))
 
     @sp.onchain_view()
     def get_total_voting_power(self, params):
@@ -1807,6 +1867,117 @@ if __name__ == "__main__":
         # Storage is updated correctly
         scenario.verify(~ve.data.attached.contains(1))
 
+    ###########################
+    # update_boosts (valid test)
+    ###########################
+
+    @sp.add_test(name="update_boosts re-points boost tokens across multiple gauges")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy gauges
+        gauge_1 = GaugeBribe()
+        gauge_2 = GaugeBribe()
+
+        # Initialize with ALICE's token 1 attached to gauge_1
+        ve = VoteEscrow(
+            ledger=sp.big_map(l={(Addresses.ALICE, 1): 1, (Addresses.ALICE, 2): 1, (Addresses.ALICE, 3): 1}),
+            attached=sp.big_map(l={1: gauge_1.address}),
+        )
+
+        scenario += gauge_1
+        scenario += gauge_2
+        scenario += ve
+
+        # When ALICE swaps token 1 for token 2 in gauge_1 and attaches token 3 to gauge_2
+        scenario += ve.update_boosts(
+            [
+                sp.record(gauge=gauge_1.address, prev_token_id=1, token_id=2),
+                sp.record(gauge=gauge_2.address, prev_token_id=0, token_id=3),
+            ]
+        ).run(sender=Addresses.ALICE)
+
+        # Storage is updated correctly
+        scenario.verify(~ve.data.attached.contains(1))
+        scenario.verify(ve.data.attached[2] == gauge_1.address)
+        scenario.verify(ve.data.attached[3] == gauge_2.address)
+
+        # Both the gauges are notified
+        scenario.verify(
+            gauge_1.data.boost_val.open_some() == sp.record(owner=Addresses.ALICE, prev_token_id=1, token_id=2)
+        )
+        scenario.verify(
+            gauge_2.data.boost_val.open_some() == sp.record(owner=Addresses.ALICE, prev_token_id=0, token_id=3)
+        )
+
+        # When ALICE removes the boost from gauge_2
+        scenario += ve.update_boosts([sp.record(gauge=gauge_2.address, prev_token_id=3, token_id=0)]).run(
+            sender=Addresses.ALICE
+        )
+
+        # Storage is updated correctly
+        scenario.verify(~ve.data.attached.contains(3))
+        scenario.verify(
+            gauge_2.data.boost_val.open_some() == sp.record(owner=Addresses.ALICE, prev_token_id=3, token_id=0)
+        )
+
+    #############################
+    # update_boosts (failure test)
+    #############################
+
+    @sp.add_test(name="update_boosts fails if sender does not own the tokens or token is attached elsewhere")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy gauges
+        gauge_1 = GaugeBribe()
+        gauge_2 = GaugeBribe()
+
+        # Initialize with ALICE's token 1 attached to gauge_1
+        ve = VoteEscrow(
+            ledger=sp.big_map(l={(Addresses.ALICE, 1): 1, (Addresses.BOB, 2): 1}),
+            attached=sp.big_map(l={1: gauge_1.address}),
+        )
+
+        scenario += gauge_1
+        scenario += gauge_2
+        scenario += ve
+
+        # When BOB tries to detach ALICE's token, txn fails
+        scenario += ve.update_boosts([sp.record(gauge=gauge_1.address, prev_token_id=1, token_id=2)]).run(
+            sender=Addresses.BOB,
+            valid=False,
+            exception=Errors.NOT_AUTHORISED,
+        )
+
+        # When ALICE tries to detach her token from a gauge it is not attached to, txn fails
+        scenario += ve.update_boosts([sp.record(gauge=gauge_2.address, prev_token_id=1, token_id=0)]).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.NOT_AUTHORISED,
+        )
+
+        # When BOB tries to detach his token that is not attached to any gauge, txn fails
+        scenario += ve.update_boosts([sp.record(gauge=gauge_1.address, prev_token_id=2, token_id=0)]).run(
+            sender=Addresses.BOB,
+            valid=False,
+            exception=Errors.INVALID_ATTACHED_TOKEN,
+        )
+
+        # When ALICE tries to attach her already attached token to another gauge, txn fails
+        scenario += ve.update_boosts([sp.record(gauge=gauge_2.address, prev_token_id=0, token_id=1)]).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.LOCK_IS_ATTACHED,
+        )
+
+        # When ALICE tries to attach BOB's token, txn fails
+        scenario += ve.update_boosts([sp.record(gauge=gauge_2.address, prev_token_id=0, token_id=2)]).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.NOT_AUTHORISED,
+        )
+
     #########################
     # get_token_voting_power
     #########################
@@ -2231,6 +2402,50 @@ if __name__ == "__main__":
         # Correct voting power is received after expiry - i.e 0
         scenario.verify(ve.get_token_voting_power(sp.record(token_id=1, ts=44 * DAY, time=Types.WHOLE_WEEK)) == 0)
 
+    @sp.add_test(name="get_token_voting_power is zero at the week start for a lock created within the week")
+    def test():
+        scenario = sp.test_scenario()
+
+        ve = VoteEscrow(
+            locks=sp.big_map(
+                l={
+                    1: sp.record(
+                        # Random values. Inconsequential for this test.
+                        base_value=1000,
+                        end=4 * YEAR,
+                    )
+                }
+            ),
+            num_token_checkpoints=sp.big_map(
+                l={
+                    1: 1,
+                },
+            ),
+            # Lock created 2 days into the week
+            token_checkpoints=sp.big_map(
+                l={
+                    (1, 1): sp.record(
+                        bias=1000 * DECIMALS,
+                        slope=5 * SLOPE_MULTIPLIER,
+                        ts=WEEK + 2 * DAY,
+                    ),
+                },
+            ),
+        )
+
+        scenario += ve
+
+        # Voting power at the start of the week is 0
+        scenario.verify(
+            ve.get_token_voting_power(sp.record(token_id=1, ts=WEEK + 3 * DAY, time=Types.WHOLE_WEEK)) == 0
+        )
+
+        # Voting power at the current timestamp is unaffected
+        bias = (1000 * DECIMALS) - DAY * 5
+        scenario.verify(
+            ve.get_token_voting_power(sp.record(token_id=1, ts=WEEK + 3 * DAY, time=Types.CURRENT)) == bias
+        )
+
     #########################
     # get_total_voting_power
     #########################
@@ -9,6 +9,7 @@ Ply = sp.io.import_script_from_url("file:helpers/dummy/ply.py").Ply
 Addresses = sp.io.import_script_from_url("file:helpers/addresses.py")
 FeeDist = sp.io.import_script_from_url("file:helpers/dummy/fee_dist.py").FeeDist
 GaugeBribe = sp.io.import_script_from_url("file:helpers/dummy/gauge_bribe.py").GaugeBribe
+AMM = sp.io.import_script_from_url("file:helpers/dummy/amm.py").AMM
 
 
 ############
@@ -28,6 +29,8 @@ EMISSION_FACTOR = Constants.EMISSION_FACTOR
 INITIAL_EMISSION = Constants.INITIAL_EMISSION
 DROP_GRANULARITY = Constants.DROP_GRANULARITY
 VOTE_SHARE_MULTIPLIER = Constants.VOTE_SHARE_MULTIPLIER
+VOTE_WEIGHT_GRANULARITY = Constants.VOTE_WEIGHT_GRANULARITY
+VOTE_RETENTION_EPOCHS = Constants.VOTE_RETENTION_EPOCHS
 
 
 ########
@@ -60,6 +63,52 @@ class Types:
         bribe=sp.TAddress,
     ).layout(("gauge", "bribe"))
 
+    VOTE_WEIGHT = sp.TRecord(
+        amm=sp.TAddress,
+        weight=sp.TNat,
+    ).layout(("amm", "weight"))
+
+    VOTE_WEIGHTS = sp.TList(VOTE_WEIGHT)
+
+    VOTE_ITEM = sp.TRecord(
+        amm=sp.TAddress,
+        votes=sp.TNat,
+    )
+
+    # Votes given to each amm, summed up across tokens
+    VOTE_TOTALS = sp.TRecord(
+        amm_votes=sp.TMap(sp.TAddress, sp.TNat),
+        epoch_votes=sp.TNat,
+    ).layout(("amm_votes", "epoch_votes"))
+
+    STICKY_VOTE = sp.TRecord(
+        owner=sp.TAddress,
+        weights=VOTE_WEIGHTS,
+    ).layout(("owner", "weights"))
+
+    # Either an explicit list of AMMs or a page of the AMM registry
+    AMM_SELECTION = sp.TVariant(
+        amms=sp.TList(sp.TAddress),
+        page=sp.TRecord(
+            offset=sp.TNat,
+            limit=sp.TNat,
+        ).layout(("offset", "limit")),
+    )
+
+    EPOCH_SUMMARY_ITEM = sp.TRecord(
+        amm=sp.TAddress,
+        gauge=sp.TAddress,
+        bribe=sp.TAddress,
+        votes=sp.TNat,
+        share=sp.TNat,
+        recharge_amount=sp.TNat,
+    ).layout(("amm", ("gauge", ("bribe", ("votes", ("share", "recharge_amount"))))))
+
+    EPOCH_SUMMARY = sp.TRecord(
+        total_votes=sp.TNat,
+        amms=sp.TList(EPOCH_SUMMARY_ITEM),
+    ).layout(("total_votes", "amms"))
+
     # Param types
 
     ADD_AMM_PARAMS = sp.TRecord(
@@ -70,14 +119,43 @@ class Types:
 
     VOTE_PARAMS = sp.TRecord(
         token_id=sp.TNat,
-        vote_items=sp.TList(
-            sp.TRecord(
-                amm=sp.TAddress,
-                votes=sp.TNat,
-            )
-        ),
+        vote_items=sp.TList(VOTE_ITEM),
     ).layout(("token_id", "vote_items"))
 
+    VOTE_BY_WEIGHT_PARAMS = sp.TRecord(
+        token_id=sp.TNat,
+        weights=VOTE_WEIGHTS,
+    ).layout(("token_id", "weights"))
+
+    CAST_VOTES_PARAMS = sp.TRecord(
+        token_id=sp.TNat,
+        votes=sp.TVariant(
+            vote_items=sp.TList(VOTE_ITEM),
+            weights=VOTE_WEIGHTS,
+        ),
+        totals=VOTE_TOTALS,
+    ).layout(("token_id", ("votes", "totals")))
+
+    SET_STICKY_VOTE_PARAMS = sp.TRecord(
+        token_id=sp.TNat,
+        weights=VOTE_WEIGHTS,
+    ).layout(("token_id", "weights"))
+
+    RECHARGE_GAUGES_PARAMS = sp.TRecord(
+        epoch=sp.TNat,
+        amms=AMM_SELECTION,
+    ).layout(("epoch", "amms"))
+
+    RECHARGE_GAUGE_EPOCHS_PARAMS = sp.TRecord(
+        amm=sp.TAddress,
+        epochs=sp.TList(sp.TNat),
+    ).layout(("amm", "epochs"))
+
+    PULL_AMM_FEES_PARAMS = sp.TRecord(
+        epoch=sp.TNat,
+        amms=AMM_SELECTION,
+    ).layout(("epoch", "amms"))
+
     CLAIM_BRIBE_PARAMS = sp.TRecord(
         token_id=sp.TNat,
         amm=sp.TAddress,
@@ -85,17 +163,63 @@ class Types:
         bribe_id=sp.TNat,
     ).layout(("token_id", ("amm", ("epoch", "bribe_id"))))
 
+    CLAIM_EPOCH_BRIBES_PARAMS = sp.TRecord(
+        token_id=sp.TNat,
+        amm=sp.TAddress,
+        epoch=sp.TNat,
+    ).layout(("token_id", ("amm", "epoch")))
+
+    CLAIM_BRIBES_PARAMS = sp.TRecord(
+        token_id=sp.TNat,
+        claims=sp.TList(
+            sp.TRecord(
+                amm=sp.TAddress,
+                epoch=sp.TNat,
+                bribe_ids=sp.TList(sp.TNat),
+            ).layout(("amm", ("epoch", "bribe_ids")))
+        ),
+    ).layout(("token_id", "claims"))
+
+    BRIBE_CLAIM_ITEM = sp.TRecord(
+        epoch=sp.TNat,
+        bribe_id=sp.TNat,
+        vote_share=sp.TNat,
+    ).layout(("epoch", ("bribe_id", "vote_share")))
+
+    PRUNE_EPOCH_PARAMS = sp.TRecord(
+        epoch=sp.TNat,
+        token_ids=sp.TList(sp.TNat),
+        amms=sp.TList(sp.TAddress),
+    ).layout(("epoch", ("token_ids", "amms")))
+
+    SWEEP_EXPIRED_EPOCH_PARAMS = sp.TRecord(
+        epoch=sp.TNat,
+        amms=AMM_SELECTION,
+    ).layout(("epoch", "amms"))
+
     CLAIM_FEE_PARAMS = sp.TRecord(
         token_id=sp.TNat,
         amm=sp.TAddress,
         epochs=sp.TList(sp.TNat),
     ).layout(("token_id", ("amm", "epochs")))
 
+    CLAIM_FEES_PARAMS = sp.TRecord(
+        token_id=sp.TNat,
+        amm_epochs=sp.TMap(sp.TAddress, sp.TList(sp.TNat)),
+    ).layout(("token_id", "amm_epochs"))
+
     # Enumeration for voting power readers
     CURRENT = sp.nat(0)
     WHOLE_WEEK = sp.nat(1)
 
 
+# Vote totals before any token has voted
+EMPTY_VOTE_TOTALS = sp.record(
+    amm_votes=sp.map(l={}, tkey=sp.TAddress, tvalue=sp.TNat),
+    epoch_votes=sp.nat(0),
+)
+
+
 ###########
 # Contract
 ###########
@@ -109,11 +233,6 @@ class Voter(sp.Contract):
         ply_address=Addresses.TOKEN,
         ve_address=Addresses.CONTRACT,
         epoch=sp.nat(0),
-        epoch_end=sp.big_map(
-            l={},
-            tkey=sp.TNat,
-            tvalue=sp.TTimestamp,
-        ),
         emission=sp.record(
             base=INITIAL_EMISSION,
             real=sp.nat(0),
@@ -144,6 +263,32 @@ class Voter(sp.Contract):
             tkey=sp.TNat,
             tvalue=sp.TNat,
         ),
+        sticky_votes=sp.big_map(
+            l={},
+            tkey=sp.TNat,
+            tvalue=Types.STICKY_VOTE,
+        ),
+        token_epoch_amms=sp.big_map(
+            l={},
+            tkey=Types.TOTAL_TOKEN_VOTES_KEY,
+            tvalue=sp.TSet(sp.TAddress),
+        ),
+        amm_count=sp.nat(0),
+        amm_registry=sp.big_map(
+            l={},
+            tkey=sp.TNat,
+            tvalue=sp.TAddress,
+        ),
+        amm_registry_index=sp.big_map(
+            l={},
+            tkey=sp.TAddress,
+            tvalue=sp.TNat,
+        ),
+        epoch_emission=sp.big_map(
+            l={},
+            tkey=sp.TNat,
+            tvalue=sp.TNat,
+        ),
     ):
         self.init(
             core_factory=core_factory,
@@ -151,13 +296,18 @@ class Voter(sp.Contract):
             ply_address=ply_address,
             ve_address=ve_address,
             epoch=epoch,
-            epoch_end=epoch_end,
             emission=emission,
             amm_to_gauge_bribe=amm_to_gauge_bribe,
             total_amm_votes=total_amm_votes,
             token_amm_votes=token_amm_votes,
             total_token_votes=total_token_votes,
             total_epoch_votes=total_epoch_votes,
+            sticky_votes=sticky_votes,
+            token_epoch_amms=token_epoch_amms,
+            amm_count=amm_count,
+            amm_registry=amm_registry,
+            amm_registry_index=amm_registry_index,
+            epoch_emission=epoch_emission,
         )
 
         self.init_type(
@@ -167,16 +317,43 @@ class Voter(sp.Contract):
                 ply_address=sp.TAddress,
                 ve_address=sp.TAddress,
                 epoch=sp.TNat,
-                epoch_end=sp.TBigMap(sp.TNat, sp.TTimestamp),
                 emission=sp.TRecord(base=sp.TNat, real=sp.TNat, genesis=sp.TNat),
                 amm_to_gauge_bribe=sp.TBigMap(sp.TAddress, Types.AMM_TO_GAUGE_BRIBE),
                 total_amm_votes=sp.TBigMap(Types.TOTAL_AMM_VOTES_KEY, sp.TNat),
                 token_amm_votes=sp.TBigMap(Types.TOKEN_AMM_VOTES_KEY, sp.TNat),
                 total_token_votes=sp.TBigMap(Types.TOTAL_TOKEN_VOTES_KEY, sp.TNat),
                 total_epoch_votes=sp.TBigMap(sp.TNat, sp.TNat),
+                sticky_votes=sp.TBigMap(sp.TNat, Types.STICKY_VOTE),
+                token_epoch_amms=sp.TBigMap(Types.TOTAL_TOKEN_VOTES_KEY, sp.TSet(sp.TAddress)),
+                amm_count=sp.TNat,
+                amm_registry=sp.TBigMap(sp.TNat, sp.TAddress),
+                amm_registry_index=sp.TBigMap(sp.TAddress, sp.TNat),
+                epoch_emission=sp.TBigMap(sp.TNat, sp.TNat),
             )
         )
 
+    def compute_epoch_end(self, epoch):
+        # Epochs are a week long and the first epoch ends at genesis
+        return sp.timestamp(0).add_seconds(sp.to_int(self.data.emission.genesis) + (sp.to_int(epoch) - 1) * WEEK)
+
+    @sp.private_lambda(with_storage="read-only", wrap_call=True)
+    def resolve_amms(self, selection):
+        sp.set_type(selection, Types.AMM_SELECTION)
+
+        amms = sp.local("amms", sp.list(l=[], t=sp.TAddress))
+
+        with selection.match_cases() as arg:
+            with arg.match("amms") as amms_:
+                amms.value = amms_
+            with arg.match("page") as page:
+                # Clip the page to the size of the registry
+                end = sp.compute(sp.min(page.offset + page.limit, self.data.amm_count))
+                with sp.for_("index", sp.range(page.offset, end)) as index:
+                    amms.value.push(self.data.amm_registry[index])
+                amms.value = amms.value.rev()
+
+        sp.result(amms.value)
+
     @sp.entry_point
     def next_epoch(self):
         # Reject tez
@@ -192,48 +369,85 @@ class Voter(sp.Contract):
             self.data.emission.genesis = ts_
 
             self.data.epoch += 1
-            self.data.epoch_end[self.data.epoch] = sp.timestamp(0).add_seconds(sp.to_int(ts_))
         with sp.else_():
 
             # Verify that previous epoch is over
-            sp.verify(sp.now > self.data.epoch_end[self.data.epoch], Errors.PREVIOUS_EPOCH_YET_TO_END)
-
-            now_ = sp.as_nat(sp.now - sp.timestamp(0))
-            rounded_now = sp.compute((now_ // WEEK) * WEEK)
+            sp.verify(sp.now > self.compute_epoch_end(self.data.epoch), Errors.PREVIOUS_EPOCH_YET_TO_END)
 
             # Fetch total supply of PLY
-            ply_total_supply = sp.compute(
+            ply_total_supply = sp.local(
+                "ply_total_supply",
                 sp.view(
                     "get_total_supply",
                     self.data.ply_address,
                     sp.unit,
                     sp.TNat,
-                ).open_some(Errors.INVALID_VIEW)
+                ).open_some(Errors.INVALID_VIEW),
             )
 
             # Fetch PLY supply locked up in vote escrow
-            ply_locked_supply = sp.compute(
+            ply_locked_supply = sp.local(
+                "ply_locked_supply",
                 sp.view(
                     "get_locked_supply",
                     self.data.ve_address,
                     sp.unit,
                     sp.TNat,
-                ).open_some(Errors.INVALID_VIEW)
+                ).open_some(Errors.INVALID_VIEW),
             )
 
-            # Store as local variable to keep on stack
-            current_emission = sp.compute(self.data.emission)
+            # Store as local variables to keep on stack
+            genesis = sp.compute(self.data.emission.genesis)
+            first_epoch = sp.compute(self.data.epoch)
+            epoch_ = sp.local("epoch_", first_epoch)
+            epoch_end = sp.local("epoch_end", self.compute_epoch_end(first_epoch))
+            base_emission = sp.local("base_emission", self.data.emission.base)
+
+            # Sum of lockers inflation across all the elapsed epochs
+            total_lockers_inflation = sp.local("total_lockers_inflation", sp.nat(0))
+
+            # Record of lockers inflation for each elapsed epoch
+            epoch_inflations = sp.local("epoch_inflations", sp.list(l=[], t=sp.TPair(sp.TNat, sp.TNat)))
+
+            # Advance through every epoch that has ended, in case next_epoch was not called for a few weeks
+            with sp.while_(sp.now > epoch_end.value):
+                # Calculate decrease offset based on locked supply ratio
+                emission_offset = (
+                    (base_emission.value * ply_locked_supply.value) // ply_total_supply.value
+                ) // EMISSION_FACTOR
+
+                # Calculate real emission for the epoch that just ended
+                real_emission = sp.compute(sp.as_nat(base_emission.value - emission_offset))
 
-            # Calculate decrease offset based on locked supply ratio
-            emission_offset = ((current_emission.base * ply_locked_supply) // ply_total_supply) // EMISSION_FACTOR
+                # Only the first epoch could have been voted on, so gauges are recharged using its emission
+                with sp.if_(epoch_.value == first_epoch):
+                    self.data.emission.real = real_emission
+                    self.data.epoch_emission[epoch_.value] = real_emission
 
-            # Calculate real emission for the epoch that just ended
-            real_emission = sp.as_nat(current_emission.base - emission_offset)
-            self.data.emission.real = real_emission
+                # Calculate growth due to the emission
+                growth = (real_emission * PRECISION) // ply_total_supply.value
+                lockers_inflation = sp.compute((growth * ply_locked_supply.value) // (PRECISION * EMISSION_FACTOR))
 
-            # Calculate growth due to the emission
-            growth = (real_emission * PRECISION) // ply_total_supply
-            lockers_inflation = sp.compute((growth * ply_locked_supply) // (PRECISION * EMISSION_FACTOR))
+                epoch_inflations.value.push((epoch_.value, lockers_inflation))
+                total_lockers_inflation.value += lockers_inflation
+
+                # Lockers inflation is minted into vote escrow before the next epoch is evaluated
+                ply_total_supply.value += lockers_inflation
+                ply_locked_supply.value += lockers_inflation
+
+                # Adjust base emission value based on emission drop
+                ts_ = sp.compute(sp.as_nat(epoch_end.value - sp.timestamp(0)))
+                with sp.if_((ts_ - genesis) == (4 * WEEK)):
+                    base_emission.value = (base_emission.value * INITIAL_DROP) // (100 * DROP_GRANULARITY)
+                with sp.if_(((ts_ - genesis) % YEAR) == 0):
+                    base_emission.value = (base_emission.value * YEARLY_DROP) // (100 * DROP_GRANULARITY)
+
+                # Update weekly epoch
+                epoch_.value += 1
+                epoch_end.value = epoch_end.value.add_seconds(WEEK)
+
+            self.data.epoch = epoch_.value
+            self.data.emission.base = base_emission.value
 
             # Mint required number of PLY tokens (lockers inflation) for VoteEscrow
             c = sp.contract(
@@ -242,32 +456,23 @@ class Voter(sp.Contract):
                 "mint",
             ).open_some()
             sp.transfer(
-                sp.record(address=self.data.ve_address, value=lockers_inflation),
+                sp.record(address=self.data.ve_address, value=total_lockers_inflation.value),
                 sp.tez(0),
                 c,
             )
 
-            # Inflate lockers proportionally
+            # Inflate lockers proportionally for each elapsed epoch
             c = sp.contract(
                 sp.TRecord(epoch=sp.TNat, value=sp.TNat).layout(("epoch", "value")),
                 self.data.ve_address,
                 "add_inflation",
             ).open_some()
-            sp.transfer(
-                sp.record(epoch=self.data.epoch, value=lockers_inflation),
-                sp.tez(0),
-                c,
-            )
-
-            # Adjust base emission value based on emission drop
-            with sp.if_((rounded_now - current_emission.genesis) == (4 * WEEK)):
-                self.data.emission.base = (current_emission.base * INITIAL_DROP) // (100 * DROP_GRANULARITY)
-            with sp.if_(((rounded_now - current_emission.genesis) % YEAR) == 0):
-                self.data.emission.base = (current_emission.base * YEARLY_DROP) // (100 * DROP_GRANULARITY)
-
-            # Update weekly epoch
-            self.data.epoch += 1
-            self.data.epoch_end[self.data.epoch] = self.data.epoch_end[sp.as_nat(self.data.epoch - 1)].add_seconds(WEEK)
+            with sp.for_("epoch_inflation", epoch_inflations.value.rev()) as epoch_inflation:
+                sp.transfer(
+                    sp.record(epoch=sp.fst(epoch_inflation), value=sp.snd(epoch_inflation)),
+                    sp.tez(0),
+                    c,
+                )
 
     # NOTE: This is called only once during origination sequence
     @sp.entry_point
@@ -292,6 +497,12 @@ class Voter(sp.Contract):
             bribe=params.bribe,
         )
 
+        # Append to the enumerable registry of AMMs
+        with sp.if_(~self.data.amm_registry_index.contains(params.amm)):
+            self.data.amm_registry[self.data.amm_count] = params.amm
+            self.data.amm_registry_index[params.amm] = self.data.amm_count
+            self.data.amm_count += 1
+
     # NOTE: This is tested in CoreFactory
     @sp.entry_point
     def remove_amm(self, amm):
@@ -303,15 +514,35 @@ class Voter(sp.Contract):
         # Delete AMM from storage
         del self.data.amm_to_gauge_bribe[amm]
 
-    @sp.entry_point
-    def vote(self, params):
-        sp.set_type(params, Types.VOTE_PARAMS)
+        # Remove from the registry by moving the last AMM into the vacated index
+        with sp.if_(self.data.amm_registry_index.contains(amm)):
+            index = sp.compute(self.data.amm_registry_index[amm])
+            last_index = sp.compute(sp.as_nat(self.data.amm_count - 1))
+            last_amm = sp.compute(self.data.amm_registry[last_index])
 
-        # Reject tez
-        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+            self.data.amm_registry[index] = last_amm
+            self.data.amm_registry_index[last_amm] = index
 
-        # Verify that current epoch is not yet over
-        sp.verify(sp.now <= self.data.epoch_end[self.data.epoch], Errors.EPOCH_ENDED)
+            del self.data.amm_registry[last_index]
+            del self.data.amm_registry_index[amm]
+            self.data.amm_count = last_index
+
+    @sp.private_lambda(with_storage="read-only", wrap_call=True)
+    def is_token_owner(self, params):
+        sp.set_type(params, sp.TRecord(address=sp.TAddress, token_id=sp.TNat))
+
+        sp.result(
+            sp.view(
+                "is_owner",
+                self.data.ve_address,
+                params,
+                sp.TBool,
+            ).open_some(Errors.INVALID_VIEW)
+        )
+
+    @sp.private_lambda(with_storage="read-write", wrap_call=True)
+    def cast_votes(self, params):
+        sp.set_type(params, Types.CAST_VOTES_PARAMS)
 
         # nat version of block timestamp
         now_ = sp.as_nat(sp.now - sp.timestamp(0))
@@ -327,54 +558,239 @@ class Voter(sp.Contract):
             sp.TNat,
         ).open_some(Errors.INVALID_VIEW)
 
+        # Calculate available voting power for token i.e max power - used up power
+        token_key = sp.compute(sp.record(token_id=params.token_id, epoch=epoch_))
+        used_power = sp.compute(self.data.total_token_votes.get(token_key, sp.nat(0)))
+        power_available = sp.compute(sp.as_nat(max_token_voting_power - used_power))
+
+        # Local variable to store the votes for each amm
+        vote_items = sp.local("vote_items", sp.list(l=[], t=Types.VOTE_ITEM))
+
+        with params.votes.match_cases() as arg:
+            with arg.match("vote_items") as vote_items_:
+                # Verify that votes are non-zero
+                with sp.for_("vote_item", vote_items_) as vote_item:
+                    sp.verify(vote_item.votes != 0, Errors.ZERO_VOTE_NOT_ALLOWED)
+
+                vote_items.value = vote_items_
+            with arg.match("weights") as weights:
+                total_weight = sp.local("total_weight", sp.nat(0))
+
+                with sp.for_("vote_weight", weights) as vote_weight:
+                    # Verify that weight is non-zero
+                    sp.verify(vote_weight.weight != 0, Errors.ZERO_VOTE_NOT_ALLOWED)
+
+                    total_weight.value += vote_weight.weight
+
+                    # Votes are a share of the available power, rounded down so that it is never overshot
+                    votes = (power_available * vote_weight.weight) // VOTE_WEIGHT_GRANULARITY
+                    vote_items.value.push(sp.record(amm=vote_weight.amm, votes=votes))
+
+                # Verify that the weights do not distribute more than the available voting power
+                sp.verify(total_weight.value <= VOTE_WEIGHT_GRANULARITY, Errors.VOTE_WEIGHTS_EXCEED_TOTAL)
+
+        # Local variables to sum up the votes of the token and add them to the running totals
+        votes_cast = sp.local("votes_cast", sp.nat(0))
+        totals = sp.local("totals", params.totals)
+
+        # Local variable to record the AMMs voted for by the token in the epoch
+        token_amms = sp.local("token_amms", self.data.token_epoch_amms.get(token_key, sp.set(l=[], t=sp.TAddress)))
+
+        with sp.for_("vote_item", vote_items.value) as vote_item:
+
+            # Verify that the amm being voted on exists in voter i.e whitelisted
+            sp.verify(self.data.amm_to_gauge_bribe.contains(vote_item.amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
+
+            # Weights too small to amount to a vote are skipped
+            with sp.if_(vote_item.votes != 0):
+                # Re-votes in the same epoch, or an amm listed more than once, get added up
+                key_ = sp.record(token_id=params.token_id, epoch=epoch_, amm=vote_item.amm)
+                self.data.token_amm_votes[key_] = self.data.token_amm_votes.get(key_, 0) + vote_item.votes
+                token_amms.value.add(vote_item.amm)
+
+                totals.value.amm_votes[vote_item.amm] = totals.value.amm_votes.get(vote_item.amm, 0) + vote_item.votes
+                votes_cast.value += vote_item.votes
+
+        # Verify that available voting power of token has not been overshot
+        sp.verify(votes_cast.value <= power_available, Errors.NOT_ENOUGH_VOTING_POWER_AVAILABLE)
+
+        # Update total epoch votes for token
+        with sp.if_(votes_cast.value != 0):
+            self.data.total_token_votes[token_key] = used_power + votes_cast.value
+            self.data.token_epoch_amms[token_key] = token_amms.value
+
+        totals.value.epoch_votes += votes_cast.value
+
+        sp.result(totals.value)
+
+    @sp.private_lambda(with_storage="read-write", wrap_call=True)
+    def record_vote_totals(self, totals):
+        sp.set_type(totals, Types.VOTE_TOTALS)
+
+        # Store as local variable to keep on stack
+        epoch_ = sp.compute(self.data.epoch)
+
+        # Update total epoch votes for each amm
+        with sp.for_("amm_vote", totals.amm_votes.items()) as amm_vote:
+            key_ = sp.record(amm=amm_vote.key, epoch=epoch_)
+            self.data.total_amm_votes[key_] = self.data.total_amm_votes.get(key_, 0) + amm_vote.value
+
+        # Update total epoch votes as a whole
+        self.data.total_epoch_votes[epoch_] = self.data.total_epoch_votes.get(epoch_, 0) + totals.epoch_votes
+
+    @sp.entry_point
+    def vote(self, params):
+        sp.set_type(params, Types.VOTE_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Verify that current epoch is not yet over
+        sp.verify(sp.now <= self.compute_epoch_end(self.data.epoch), Errors.EPOCH_ENDED)
+
         # Verify that the sender owns the specified token / lock
-        is_owner = sp.view(
-            "is_owner",
-            self.data.ve_address,
-            sp.record(address=sp.sender, token_id=params.token_id),
-            sp.TBool,
-        ).open_some(Errors.INVALID_VIEW)
+        is_owner = self.is_token_owner(sp.record(address=sp.sender, token_id=params.token_id))
         sp.verify(is_owner, Errors.SENDER_DOES_NOT_OWN_LOCK)
 
-        # Calculate available voting power for token i.e max power - used up power
-        used_power = self.data.total_token_votes.get(
-            sp.record(token_id=params.token_id, epoch=self.data.epoch),
-            sp.nat(0),
+        totals = self.cast_votes(
+            sp.record(
+                token_id=params.token_id,
+                votes=sp.variant("vote_items", params.vote_items),
+                totals=EMPTY_VOTE_TOTALS,
+            )
         )
-        power_available = sp.local("power_used", sp.as_nat(max_token_voting_power - used_power))
 
-        with sp.for_("vote_item", params.vote_items) as vote_item:
+        self.record_vote_totals(totals)
 
-            # Verify that the amm being voted on exists in voter i.e whitelisted
-            sp.verify(self.data.amm_to_gauge_bribe.contains(vote_item.amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
+    @sp.entry_point
+    def vote_by_weight(self, params):
+        sp.set_type(params, Types.VOTE_BY_WEIGHT_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Verify that current epoch is not yet over
+        sp.verify(sp.now <= self.compute_epoch_end(self.data.epoch), Errors.EPOCH_ENDED)
+
+        # Verify that the sender owns the specified token / lock
+        is_owner = self.is_token_owner(sp.record(address=sp.sender, token_id=params.token_id))
+        sp.verify(is_owner, Errors.SENDER_DOES_NOT_OWN_LOCK)
+
+        totals = self.cast_votes(
+            sp.record(
+                token_id=params.token_id,
+                votes=sp.variant("weights", params.weights),
+                totals=EMPTY_VOTE_TOTALS,
+            )
+        )
+
+        self.record_vote_totals(totals)
 
-            # Verify that vote is non-zero
-            sp.verify(vote_item.votes != 0, Errors.ZERO_VOTE_NOT_ALLOWED)
+    @sp.entry_point
+    def vote_many(self, params):
+        sp.set_type(params, sp.TList(Types.VOTE_PARAMS))
 
-            # Re-votes in the same epoch gets added up
-            key_ = sp.record(token_id=params.token_id, epoch=epoch_, amm=vote_item.amm)
-            votes_ = self.data.token_amm_votes.get(key_, 0)
-            self.data.token_amm_votes[key_] = votes_ + vote_item.votes
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
 
-            # Update total epoch votes for amm
-            key_ = sp.record(amm=vote_item.amm, epoch=epoch_)
-            votes_ = self.data.total_amm_votes.get(key_, 0)
-            self.data.total_amm_votes[key_] = votes_ + vote_item.votes
+        # Verify that current epoch is not yet over
+        sp.verify(sp.now <= self.compute_epoch_end(self.data.epoch), Errors.EPOCH_ENDED)
 
-            # Update total epoch votes for token
-            key_ = sp.record(token_id=params.token_id, epoch=epoch_)
-            votes_ = self.data.total_token_votes.get(key_, 0)
-            self.data.total_token_votes[key_] = votes_ + vote_item.votes
+        # Local variable to sum up the votes across all tokens
+        totals = sp.local("totals", EMPTY_VOTE_TOTALS)
 
-            # Update total epoch votes as a whole
-            votes_ = self.data.total_epoch_votes.get(epoch_, 0)
-            self.data.total_epoch_votes[epoch_] = votes_ + vote_item.votes
+        with sp.for_("token_vote", params) as token_vote:
+            # Verify that the sender owns the specified token / lock
+            is_owner = self.is_token_owner(sp.record(address=sp.sender, token_id=token_vote.token_id))
+            sp.verify(is_owner, Errors.SENDER_DOES_NOT_OWN_LOCK)
 
-            # Update power used & verify that available voting power of token has not been overshot
-            power_available.value = sp.as_nat(
-                power_available.value - vote_item.votes, Errors.NOT_ENOUGH_VOTING_POWER_AVAILABLE
+            totals.value = self.cast_votes(
+                sp.record(
+                    token_id=token_vote.token_id,
+                    votes=sp.variant("vote_items", token_vote.vote_items),
+                    totals=totals.value,
+                )
             )
 
+        self.record_vote_totals(totals.value)
+
+    @sp.entry_point
+    def set_sticky_vote(self, params):
+        sp.set_type(params, Types.SET_STICKY_VOTE_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Verify that the sender owns the specified token / lock
+        is_owner = self.is_token_owner(sp.record(address=sp.sender, token_id=params.token_id))
+        sp.verify(is_owner, Errors.SENDER_DOES_NOT_OWN_LOCK)
+
+        # An empty list of weights opts the token out of sticky voting
+        with sp.if_(sp.len(params.weights) == 0):
+            del self.data.sticky_votes[params.token_id]
+        with sp.else_():
+            total_weight = sp.local("total_weight", sp.nat(0))
+
+            with sp.for_("vote_weight", params.weights) as vote_weight:
+                # Verify that the amm being voted on exists in voter i.e whitelisted
+                sp.verify(
+                    self.data.amm_to_gauge_bribe.contains(vote_weight.amm),
+                    Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+                )
+
+                # Verify that weight is non-zero
+                sp.verify(vote_weight.weight != 0, Errors.ZERO_VOTE_NOT_ALLOWED)
+
+                total_weight.value += vote_weight.weight
+
+            # Verify that the weights do not distribute more than the whole voting power
+            sp.verify(total_weight.value <= VOTE_WEIGHT_GRANULARITY, Errors.VOTE_WEIGHTS_EXCEED_TOTAL)
+
+            self.data.sticky_votes[params.token_id] = sp.record(owner=sp.sender, weights=params.weights)
+
+    @sp.entry_point
+    def poke(self, token_ids):
+        sp.set_type(token_ids, sp.TList(sp.TNat))
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Verify that current epoch is not yet over
+        sp.verify(sp.now <= self.compute_epoch_end(self.data.epoch), Errors.EPOCH_ENDED)
+
+        # Store as local variable to keep on stack
+        epoch_ = sp.compute(self.data.epoch)
+
+        # Local variable to sum up the votes across all tokens
+        totals = sp.local("totals", EMPTY_VOTE_TOTALS)
+
+        with sp.for_("token_id", token_ids) as token_id:
+            token_key = sp.compute(sp.record(token_id=token_id, epoch=epoch_))
+
+            # Skip tokens without a sticky vote and tokens that have already voted in the epoch
+            with sp.if_(self.data.sticky_votes.contains(token_id) & ~self.data.total_token_votes.contains(token_key)):
+                sticky_vote = sp.compute(self.data.sticky_votes[token_id])
+
+                # Verify that the sticky vote was set by the current owner of the token / lock
+                is_owner = self.is_token_owner(sp.record(address=sticky_vote.owner, token_id=token_id))
+
+                with sp.if_(is_owner):
+                    # AMMs removed since the sticky vote was set are skipped
+                    weights = sp.local("weights", sp.list(l=[], t=Types.VOTE_WEIGHT))
+                    with sp.for_("vote_weight", sticky_vote.weights) as vote_weight:
+                        with sp.if_(self.data.amm_to_gauge_bribe.contains(vote_weight.amm)):
+                            weights.value.push(vote_weight)
+
+                    totals.value = self.cast_votes(
+                        sp.record(
+                            token_id=token_id,
+                            votes=sp.variant("weights", weights.value),
+                            totals=totals.value,
+                        )
+                    )
+
+        self.record_vote_totals(totals.value)
+
     @sp.entry_point
     def claim_bribe(self, params):
         sp.set_type(params, Types.CLAIM_BRIBE_PARAMS)
@@ -384,15 +800,11 @@ class Voter(sp.Contract):
 
         # Sanity checks
         sp.verify(self.data.epoch > params.epoch, Errors.INVALID_EPOCH)
+        sp.verify(params.epoch + VOTE_RETENTION_EPOCHS >= self.data.epoch, Errors.EPOCH_EXPIRED)
         sp.verify(self.data.amm_to_gauge_bribe.contains(params.amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
 
         # Verify that the sender owns the specified token / lock
-        is_owner = sp.view(
-            "is_owner",
-            self.data.ve_address,
-            sp.record(address=sp.sender, token_id=params.token_id),
-            sp.TBool,
-        ).open_some(Errors.INVALID_VIEW)
+        is_owner = self.is_token_owner(sp.record(address=sp.sender, token_id=params.token_id))
         sp.verify(is_owner, Errors.SENDER_DOES_NOT_OWN_LOCK)
 
         # Calculate vote share for the vePLY token
@@ -450,53 +862,181 @@ class Voter(sp.Contract):
             )
 
     @sp.entry_point
-    def claim_fee(self, params):
-        sp.set_type(params, Types.CLAIM_FEE_PARAMS)
+    def claim_epoch_bribes(self, params):
+        sp.set_type(params, Types.CLAIM_EPOCH_BRIBES_PARAMS)
 
         # Reject tez
         sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
 
         # Sanity checks
+        sp.verify(self.data.epoch > params.epoch, Errors.INVALID_EPOCH)
+        sp.verify(params.epoch + VOTE_RETENTION_EPOCHS >= self.data.epoch, Errors.EPOCH_EXPIRED)
         sp.verify(self.data.amm_to_gauge_bribe.contains(params.amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
 
         # Verify that the sender owns the specified token / lock
-        is_owner = sp.view(
-            "is_owner",
-            self.data.ve_address,
-            sp.record(address=sp.sender, token_id=params.token_id),
-            sp.TBool,
-        ).open_some(Errors.INVALID_VIEW)
+        is_owner = self.is_token_owner(sp.record(address=sp.sender, token_id=params.token_id))
         sp.verify(is_owner, Errors.SENDER_DOES_NOT_OWN_LOCK)
 
-        # Local variable to store through the vote share across the epochs
-        epoch_vote_shares = sp.local("epoch_vote_shares", sp.list(l=[], t=sp.TRecord(epoch=sp.TNat, share=sp.TNat)))
-
-        # Iterate through requested epochs
-        with sp.for_("epochs", params.epochs) as epoch:
-            sp.verify(self.data.epoch > epoch, Errors.INVALID_EPOCH)
+        # Calculate vote share for the vePLY token
+        token_votes_for_amm = self.data.token_amm_votes.get(
+            sp.record(token_id=params.token_id, epoch=params.epoch, amm=params.amm),
+            0,
+        )
 
-            # Calculate vote share for the vePLY token
-            token_votes_for_amm = self.data.token_amm_votes[
-                sp.record(token_id=params.token_id, epoch=epoch, amm=params.amm)
-            ]
-            total_votes_for_amm = self.data.total_amm_votes[sp.record(epoch=epoch, amm=params.amm)]
+        total_votes_for_amm = sp.compute(
+            self.data.total_amm_votes.get(
+                sp.record(epoch=params.epoch, amm=params.amm),
+                0,
+            )
+        )
 
+        # Nothing can be claimed if the AMM received no votes. Such bribes are returned through claim_bribe.
+        with sp.if_(total_votes_for_amm > 0):
             token_vote_share = (token_votes_for_amm * VOTE_SHARE_MULTIPLIER) // total_votes_for_amm
 
-            epoch_vote_shares.value.push(sp.record(epoch=epoch, share=token_vote_share))
+            # call the 'claim_epoch' entrypoint in bribe contract
+            param_type = sp.TRecord(
+                token_id=sp.TNat,
+                owner=sp.TAddress,
+                epoch=sp.TNat,
+                vote_share=sp.TNat,
+            ).layout(("token_id", ("owner", ("epoch", "vote_share"))))
 
-        # call the 'claim' entrypoint in Fee Distributor to distribute the fee to the token holder
-        param_type = sp.TRecord(
-            token_id=sp.TNat,
-            owner=sp.TAddress,
-            amm=sp.TAddress,
-            epoch_vote_shares=sp.TList(sp.TRecord(epoch=sp.TNat, share=sp.TNat)),
-        ).layout(("token_id", ("owner", ("amm", "epoch_vote_shares"))))
+            c = sp.contract(param_type, self.data.amm_to_gauge_bribe[params.amm].bribe, "claim_epoch").open_some()
 
-        c = sp.contract(param_type, self.data.fee_distributor, "claim").open_some()
+            sp.transfer(
+                sp.record(
+                    token_id=params.token_id,
+                    owner=sp.sender,
+                    epoch=params.epoch,
+                    vote_share=token_vote_share,
+                ),
+                sp.tez(0),
+                c,
+            )
 
-        sp.transfer(
-            sp.record(
+    @sp.entry_point
+    def claim_bribes(self, params):
+        sp.set_type(params, Types.CLAIM_BRIBES_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Verify that the sender owns the specified token / lock
+        is_owner = self.is_token_owner(sp.record(address=sp.sender, token_id=params.token_id))
+        sp.verify(is_owner, Errors.SENDER_DOES_NOT_OWN_LOCK)
+
+        # Store as local variable to keep on stack
+        epoch_ = sp.compute(self.data.epoch)
+
+        # Bribe claims grouped by the bribe contract they are sent to
+        bribe_claims = sp.local(
+            "bribe_claims",
+            sp.map(l={}, tkey=sp.TAddress, tvalue=sp.TList(Types.BRIBE_CLAIM_ITEM)),
+        )
+
+        with sp.for_("claim", params.claims) as claim:
+            # Sanity checks
+            sp.verify(epoch_ > claim.epoch, Errors.INVALID_EPOCH)
+            sp.verify(claim.epoch + VOTE_RETENTION_EPOCHS >= epoch_, Errors.EPOCH_EXPIRED)
+            sp.verify(self.data.amm_to_gauge_bribe.contains(claim.amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
+
+            bribe = sp.compute(self.data.amm_to_gauge_bribe[claim.amm].bribe)
+
+            # Calculate vote share for the vePLY token
+            token_votes_for_amm = self.data.token_amm_votes.get(
+                sp.record(token_id=params.token_id, epoch=claim.epoch, amm=claim.amm),
+                0,
+            )
+
+            total_votes_for_amm = sp.compute(
+                self.data.total_amm_votes.get(
+                    sp.record(epoch=claim.epoch, amm=claim.amm),
+                    0,
+                )
+            )
+
+            with sp.if_(total_votes_for_amm > 0):
+                token_vote_share = sp.compute((token_votes_for_amm * VOTE_SHARE_MULTIPLIER) // total_votes_for_amm)
+
+                with sp.if_(~bribe_claims.value.contains(bribe)):
+                    bribe_claims.value[bribe] = sp.list([])
+
+                with sp.for_("bribe_id", claim.bribe_ids) as bribe_id:
+                    bribe_claims.value[bribe].push(
+                        sp.record(epoch=claim.epoch, bribe_id=bribe_id, vote_share=token_vote_share)
+                    )
+            with sp.else_():
+                # Return the bribes to the providers if there are no votes for the amm
+                c = sp.contract(
+                    sp.TRecord(epoch=sp.TNat, bribe_id=sp.TNat),
+                    bribe,
+                    "return_bribe",
+                ).open_some()
+                with sp.for_("bribe_id", claim.bribe_ids) as bribe_id:
+                    sp.transfer(sp.record(epoch=claim.epoch, bribe_id=bribe_id), sp.tez(0), c)
+
+        # Call the 'claim_many' entrypoint once in each bribe contract
+        with sp.for_("bribe_claim", bribe_claims.value.items()) as bribe_claim:
+            c = sp.contract(
+                sp.TRecord(
+                    token_id=sp.TNat,
+                    owner=sp.TAddress,
+                    claims=sp.TList(Types.BRIBE_CLAIM_ITEM),
+                ).layout(("token_id", ("owner", "claims"))),
+                bribe_claim.key,
+                "claim_many",
+            ).open_some()
+            sp.transfer(
+                sp.record(token_id=params.token_id, owner=sp.sender, claims=bribe_claim.value.rev()),
+                sp.tez(0),
+                c,
+            )
+
+    @sp.entry_point
+    def claim_fee(self, params):
+        sp.set_type(params, Types.CLAIM_FEE_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Sanity checks
+        sp.verify(self.data.amm_to_gauge_bribe.contains(params.amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
+
+        # Verify that the sender owns the specified token / lock
+        is_owner = self.is_token_owner(sp.record(address=sp.sender, token_id=params.token_id))
+        sp.verify(is_owner, Errors.SENDER_DOES_NOT_OWN_LOCK)
+
+        # Local variable to store through the vote share across the epochs
+        epoch_vote_shares = sp.local("epoch_vote_shares", sp.list(l=[], t=sp.TRecord(epoch=sp.TNat, share=sp.TNat)))
+
+        # Iterate through requested epochs
+        with sp.for_("epochs", params.epochs) as epoch:
+            sp.verify(self.data.epoch > epoch, Errors.INVALID_EPOCH)
+            sp.verify(epoch + VOTE_RETENTION_EPOCHS >= self.data.epoch, Errors.EPOCH_EXPIRED)
+
+            # Calculate vote share for the vePLY token
+            token_votes_for_amm = self.data.token_amm_votes[
+                sp.record(token_id=params.token_id, epoch=epoch, amm=params.amm)
+            ]
+            total_votes_for_amm = self.data.total_amm_votes[sp.record(epoch=epoch, amm=params.amm)]
+
+            token_vote_share = (token_votes_for_amm * VOTE_SHARE_MULTIPLIER) // total_votes_for_amm
+
+            epoch_vote_shares.value.push(sp.record(epoch=epoch, share=token_vote_share))
+
+        # call the 'claim' entrypoint in Fee Distributor to distribute the fee to the token holder
+        param_type = sp.TRecord(
+            token_id=sp.TNat,
+            owner=sp.TAddress,
+            amm=sp.TAddress,
+            epoch_vote_shares=sp.TList(sp.TRecord(epoch=sp.TNat, share=sp.TNat)),
+        ).layout(("token_id", ("owner", ("amm", "epoch_vote_shares"))))
+
+        c = sp.contract(param_type, self.data.fee_distributor, "claim").open_some()
+
+        sp.transfer(
+            sp.record(
                 token_id=params.token_id,
                 owner=sp.sender,
                 amm=params.amm,
@@ -506,6 +1046,71 @@ class Voter(sp.Contract):
             c,
         )
 
+    @sp.entry_point
+    def claim_fees(self, params):
+        sp.set_type(params, Types.CLAIM_FEES_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Verify that the sender owns the specified token / lock
+        is_owner = self.is_token_owner(sp.record(address=sp.sender, token_id=params.token_id))
+        sp.verify(is_owner, Errors.SENDER_DOES_NOT_OWN_LOCK)
+
+        # Store as local variable to keep on stack
+        epoch_ = sp.compute(self.data.epoch)
+
+        # Local variable to store the vote shares across the amms and epochs
+        amm_vote_shares = sp.local(
+            "amm_vote_shares",
+            sp.map(l={}, tkey=sp.TAddress, tvalue=sp.TList(sp.TRecord(epoch=sp.TNat, share=sp.TNat))),
+        )
+
+        with sp.for_("amm_epoch", params.amm_epochs.items()) as amm_epoch:
+            # Sanity checks
+            sp.verify(self.data.amm_to_gauge_bribe.contains(amm_epoch.key), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
+
+            # Local variable to store through the vote share across the epochs
+            epoch_vote_shares = sp.local(
+                "epoch_vote_shares", sp.list(l=[], t=sp.TRecord(epoch=sp.TNat, share=sp.TNat))
+            )
+
+            # Iterate through requested epochs
+            with sp.for_("epoch", amm_epoch.value) as epoch:
+                sp.verify(epoch_ > epoch, Errors.INVALID_EPOCH)
+                sp.verify(epoch + VOTE_RETENTION_EPOCHS >= epoch_, Errors.EPOCH_EXPIRED)
+
+                # Calculate vote share for the vePLY token
+                token_votes_for_amm = self.data.token_amm_votes[
+                    sp.record(token_id=params.token_id, epoch=epoch, amm=amm_epoch.key)
+                ]
+                total_votes_for_amm = self.data.total_amm_votes[sp.record(epoch=epoch, amm=amm_epoch.key)]
+
+                token_vote_share = (token_votes_for_amm * VOTE_SHARE_MULTIPLIER) // total_votes_for_amm
+
+                epoch_vote_shares.value.push(sp.record(epoch=epoch, share=token_vote_share))
+
+            amm_vote_shares.value[amm_epoch.key] = epoch_vote_shares.value
+
+        # call the 'claim_many' entrypoint in Fee Distributor to distribute the fees across all amms in one go
+        param_type = sp.TRecord(
+            token_id=sp.TNat,
+            owner=sp.TAddress,
+            amm_vote_shares=sp.TMap(sp.TAddress, sp.TList(sp.TRecord(epoch=sp.TNat, share=sp.TNat))),
+        ).layout(("token_id", ("owner", "amm_vote_shares")))
+
+        c = sp.contract(param_type, self.data.fee_distributor, "claim_many").open_some()
+
+        sp.transfer(
+            sp.record(
+                token_id=params.token_id,
+                owner=sp.sender,
+                amm_vote_shares=amm_vote_shares.value,
+            ),
+            sp.tez(0),
+            c,
+        )
+
     @sp.entry_point
     def pull_amm_fee(self, params):
         sp.set_type(params, sp.TRecord(amm=sp.TAddress, epoch=sp.TNat).layout(("amm", "epoch")))
@@ -529,6 +1134,36 @@ class Voter(sp.Contract):
             c,
         )
 
+    @sp.entry_point
+    def pull_amm_fees(self, params):
+        sp.set_type(params, Types.PULL_AMM_FEES_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Sanity checks
+        sp.verify(self.data.epoch > params.epoch, Errors.INVALID_EPOCH)
+
+        amms = self.resolve_amms(params.amms)
+
+        # Store as local variable to keep on stack
+        fee_distributor = sp.compute(self.data.fee_distributor)
+
+        with sp.for_("amm", amms) as amm:
+            sp.verify(self.data.amm_to_gauge_bribe.contains(amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
+
+            # Call the 'forwardFee' entrypoint of the amm, passing in fee_distributor & epoch
+            c = sp.contract(
+                sp.TRecord(feeDistributor=sp.TAddress, epoch=sp.TNat),
+                amm,
+                "forwardFee",
+            ).open_some()
+            sp.transfer(
+                sp.record(feeDistributor=fee_distributor, epoch=params.epoch),
+                sp.tez(0),
+                c,
+            )
+
     @sp.entry_point
     def recharge_gauge(self, params):
         sp.set_type(params, sp.TRecord(amm=sp.TAddress, epoch=sp.TNat).layout(("amm", "epoch")))
@@ -538,6 +1173,7 @@ class Voter(sp.Contract):
 
         # Sanity checks
         sp.verify(self.data.epoch > params.epoch, Errors.INVALID_EPOCH)
+        sp.verify(params.epoch + VOTE_RETENTION_EPOCHS >= self.data.epoch, Errors.EPOCH_EXPIRED)
         sp.verify(self.data.amm_to_gauge_bribe.contains(params.amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
 
         # Calculate the vote share for the amm gauge
@@ -545,8 +1181,9 @@ class Voter(sp.Contract):
         total_votes_for_epoch = self.data.total_epoch_votes[params.epoch]
         amm_vote_share = (total_votes_for_amm * VOTE_SHARE_MULTIPLIER) // total_votes_for_epoch
 
-        # Calculate recharge amount based on share
-        recharge_amount = sp.compute((self.data.emission.real * amm_vote_share) // VOTE_SHARE_MULTIPLIER)
+        # Calculate recharge amount based on share of the emission recorded for the epoch
+        real_emission = self.data.epoch_emission.get(params.epoch, message=Errors.INVALID_EPOCH)
+        recharge_amount = sp.compute((real_emission * amm_vote_share) // VOTE_SHARE_MULTIPLIER)
 
         # Mint PLY tokens for the concerned gauge contract
         c = sp.contract(
@@ -572,20 +1209,255 @@ class Voter(sp.Contract):
             c_gauge,
         )
 
+    @sp.entry_point
+    def recharge_gauges(self, params):
+        sp.set_type(params, Types.RECHARGE_GAUGES_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Sanity checks
+        sp.verify(self.data.epoch > params.epoch, Errors.INVALID_EPOCH)
+        sp.verify(params.epoch + VOTE_RETENTION_EPOCHS >= self.data.epoch, Errors.EPOCH_EXPIRED)
+
+        amms = self.resolve_amms(params.amms)
+
+        # Store as local variables to keep on stack
+        total_votes_for_epoch = sp.compute(self.data.total_epoch_votes[params.epoch])
+        real_emission = sp.compute(self.data.epoch_emission.get(params.epoch, message=Errors.INVALID_EPOCH))
+
+        # Local variables to record the recharge of each gauge and the total amount to be minted
+        recharges = sp.local("recharges", sp.list(l=[], t=sp.TRecord(gauge=sp.TAddress, amount=sp.TNat)))
+        total_recharge = sp.local("total_recharge", sp.nat(0))
+
+        with sp.for_("amm", amms) as amm:
+            sp.verify(self.data.amm_to_gauge_bribe.contains(amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
+
+            # AMMs that received no votes in the epoch are skipped
+            total_votes_for_amm = sp.compute(self.data.total_amm_votes.get(sp.record(epoch=params.epoch, amm=amm), 0))
+            with sp.if_(total_votes_for_amm != 0):
+                # Calculate the vote share for the amm gauge
+                amm_vote_share = (total_votes_for_amm * VOTE_SHARE_MULTIPLIER) // total_votes_for_epoch
+
+                # Calculate recharge amount based on share
+                recharge_amount = sp.compute((real_emission * amm_vote_share) // VOTE_SHARE_MULTIPLIER)
+
+                recharges.value.push(
+                    sp.record(gauge=self.data.amm_to_gauge_bribe[amm].gauge, amount=recharge_amount)
+                )
+                total_recharge.value += recharge_amount
+
+        with sp.if_(total_recharge.value != 0):
+            # Mint PLY tokens for all the gauges to Voter in one go
+            c = sp.contract(
+                sp.TRecord(address=sp.TAddress, value=sp.TNat),
+                self.data.ply_address,
+                "mint",
+            ).open_some()
+            sp.transfer(
+                sp.record(address=sp.self_address, value=total_recharge.value),
+                sp.tez(0),
+                c,
+            )
+
+        with sp.for_("recharge", recharges.value.rev()) as recharge:
+            # Transfer the minted PLY tokens to the gauge
+            TokenUtils.transfer_FA12(
+                sp.record(
+                    from_=sp.self_address,
+                    to_=recharge.gauge,
+                    value=recharge.amount,
+                    token_address=self.data.ply_address,
+                )
+            )
+
+            # Call 'recharge' entrypoint in concerned gauge
+            c_gauge = sp.contract(
+                sp.TRecord(amount=sp.TNat, epoch=sp.TNat),
+                recharge.gauge,
+                "recharge",
+            ).open_some()
+            sp.transfer(
+                sp.record(amount=recharge.amount, epoch=params.epoch),
+                sp.tez(0),
+                c_gauge,
+            )
+
+    @sp.entry_point
+    def recharge_gauge_epochs(self, params):
+        sp.set_type(params, Types.RECHARGE_GAUGE_EPOCHS_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Verify that the amm is whitelisted
+        sp.verify(self.data.amm_to_gauge_bribe.contains(params.amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
+
+        # Store as local variable to keep on stack
+        gauge = sp.compute(self.data.amm_to_gauge_bribe[params.amm].gauge)
+
+        # Local variables to record the recharge for each epoch and the total amount to be minted
+        recharges = sp.local("recharges", sp.list(l=[], t=sp.TRecord(amount=sp.TNat, epoch=sp.TNat)))
+        total_recharge = sp.local("total_recharge", sp.nat(0))
+
+        with sp.for_("epoch", params.epochs) as epoch:
+            # Sanity checks
+            sp.verify(self.data.epoch > epoch, Errors.INVALID_EPOCH)
+            sp.verify(epoch + VOTE_RETENTION_EPOCHS >= self.data.epoch, Errors.EPOCH_EXPIRED)
+
+            # Epochs in which the AMM received no votes are skipped
+            total_votes_for_amm = sp.compute(self.data.total_amm_votes.get(sp.record(epoch=epoch, amm=params.amm), 0))
+            with sp.if_(total_votes_for_amm != 0):
+                # Calculate the vote share for the amm gauge
+                amm_vote_share = (total_votes_for_amm * VOTE_SHARE_MULTIPLIER) // self.data.total_epoch_votes[epoch]
+
+                # Calculate recharge amount based on share of the emission recorded for the epoch
+                real_emission = self.data.epoch_emission.get(epoch, message=Errors.INVALID_EPOCH)
+                recharge_amount = sp.compute((real_emission * amm_vote_share) // VOTE_SHARE_MULTIPLIER)
+
+                recharges.value.push(sp.record(amount=recharge_amount, epoch=epoch))
+                total_recharge.value += recharge_amount
+
+        with sp.if_(total_recharge.value != 0):
+            # Mint PLY tokens for all the epochs to the gauge in one go
+            c = sp.contract(
+                sp.TRecord(address=sp.TAddress, value=sp.TNat),
+                self.data.ply_address,
+                "mint",
+            ).open_some()
+            sp.transfer(
+                sp.record(address=gauge, value=total_recharge.value),
+                sp.tez(0),
+                c,
+            )
+
+            # Call 'recharge_many' entrypoint in concerned gauge
+            c_gauge = sp.contract(
+                sp.TList(sp.TRecord(amount=sp.TNat, epoch=sp.TNat)),
+                gauge,
+                "recharge_many",
+            ).open_some()
+            sp.transfer(recharges.value.rev(), sp.tez(0), c_gauge)
+
+    @sp.entry_point
+    def claim_gauge_rewards(self, amms):
+        sp.set_type(amms, sp.TList(sp.TAddress))
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        with sp.for_("amm", amms) as amm:
+            # Verify that the amm is whitelisted
+            sp.verify(self.data.amm_to_gauge_bribe.contains(amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
+
+            # Call 'get_reward_for' entrypoint in concerned gauge to pay out the rewards of the sender
+            c_gauge = sp.contract(
+                sp.TAddress,
+                self.data.amm_to_gauge_bribe[amm].gauge,
+                "get_reward_for",
+            ).open_some()
+            sp.transfer(sp.sender, sp.tez(0), c_gauge)
+
+    @sp.entry_point
+    def sweep_expired_epoch(self, params):
+        sp.set_type(params, Types.SWEEP_EXPIRED_EPOCH_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Verify that the claims for the epoch have expired
+        sp.verify(params.epoch + VOTE_RETENTION_EPOCHS < self.data.epoch, Errors.EPOCH_WITHIN_RETENTION)
+
+        amms = self.resolve_amms(params.amms)
+
+        # Store as local variable to keep on stack
+        fee_distributor = sp.compute(self.data.fee_distributor)
+
+        with sp.for_("amm", amms) as amm:
+            sp.verify(self.data.amm_to_gauge_bribe.contains(amm), Errors.AMM_INVALID_OR_NOT_WHITELISTED)
+
+            # Return the unclaimed bribes of the epoch to their providers
+            c_bribe = sp.contract(
+                sp.TNat,
+                self.data.amm_to_gauge_bribe[amm].bribe,
+                "return_epoch",
+            ).open_some()
+            sp.transfer(params.epoch, sp.tez(0), c_bribe)
+
+            # Sweep the unclaimed fees of the epoch to the treasury
+            c_fee = sp.contract(
+                sp.TRecord(amm=sp.TAddress, epoch=sp.TNat).layout(("amm", "epoch")),
+                fee_distributor,
+                "sweep",
+            ).open_some()
+            sp.transfer(sp.record(amm=amm, epoch=params.epoch), sp.tez(0), c_fee)
+
+    @sp.entry_point
+    def prune_epoch(self, params):
+        sp.set_type(params, Types.PRUNE_EPOCH_PARAMS)
+
+        # Reject tez
+        sp.verify(sp.amount == sp.tez(0), Errors.ENTRYPOINT_DOES_NOT_ACCEPT_TEZ)
+
+        # Verify that the epoch is older than the retention window
+        sp.verify(params.epoch + VOTE_RETENTION_EPOCHS < self.data.epoch, Errors.EPOCH_WITHIN_RETENTION)
+
+        # Delete the votes given by each token, along with its per-amm breakdown. Claims have expired for the epoch.
+        with sp.for_("token_id", params.token_ids) as token_id:
+            token_key = sp.compute(sp.record(token_id=token_id, epoch=params.epoch))
+
+            with sp.for_(
+                "amm", self.data.token_epoch_amms.get(token_key, sp.set(l=[], t=sp.TAddress)).elements()
+            ) as amm:
+                del self.data.token_amm_votes[sp.record(token_id=token_id, epoch=params.epoch, amm=amm)]
+
+            del self.data.token_epoch_amms[token_key]
+            del self.data.total_token_votes[token_key]
+
+        # Delete the votes received by each amm
+        with sp.for_("amm", params.amms) as amm:
+            del self.data.total_amm_votes[sp.record(amm=amm, epoch=params.epoch)]
+
+        # Recharges are not allowed past the retention window, so the epoch totals are no longer needed
+        del self.data.total_epoch_votes[params.epoch]
+        del self.data.epoch_emission[params.epoch]
+
     @sp.onchain_view()
     def get_current_epoch(self):
-        sp.result((self.data.epoch, self.data.epoch_end[self.data.epoch]))
+        # Epoch 0 precedes genesis and has no end
+        with sp.if_(self.data.epoch == 0):
+            sp.result((sp.nat(0), sp.timestamp(0)))
+        with sp.else_():
+            sp.result((self.data.epoch, self.compute_epoch_end(self.data.epoch)))
 
     @sp.onchain_view()
     def get_epoch_end(self, param):
         sp.set_type(param, sp.TNat)
-        sp.result(sp.as_nat(self.data.epoch_end[param] - sp.timestamp(0)))
+
+        # Epoch 0 precedes genesis and has no end
+        with sp.if_(param == 0):
+            sp.result(sp.nat(0))
+        with sp.else_():
+            sp.result(sp.as_nat(self.compute_epoch_end(param) - sp.timestamp(0)))
 
     @sp.onchain_view()
     def get_token_amm_votes(self, params):
         sp.set_type(params, Types.TOKEN_AMM_VOTES_KEY)
         sp.result(self.data.token_amm_votes.get(params, 0))
 
+    @sp.onchain_view()
+    def get_token_votes(self, params):
+        sp.set_type(params, Types.TOTAL_TOKEN_VOTES_KEY)
+
+        # Local variable to collect the votes given to each amm by the token in the epoch
+        votes = sp.local("votes", sp.map(l={}, tkey=sp.TAddress, tvalue=sp.TNat))
+
+        with sp.for_("amm", self.data.token_epoch_amms.get(params, sp.set(l=[], t=sp.TAddress)).elements()) as amm:
+            key_ = sp.record(token_id=params.token_id, epoch=params.epoch, amm=amm)
+            votes.value[amm] = self.data.token_amm_votes.get(key_, 0)
+
+        sp.result(votes.value)
+
     @sp.onchain_view()
     def get_total_amm_votes(self, params):
         sp.set_type(params, Types.TOTAL_AMM_VOTES_KEY)
@@ -596,6 +1468,48 @@ class Voter(sp.Contract):
         sp.set_type(params, Types.TOTAL_TOKEN_VOTES_KEY)
         sp.result(self.data.total_token_votes.get(params, 0))
 
+    @sp.onchain_view()
+    def get_epoch_summary(self, params):
+        sp.set_type(
+            params,
+            sp.TRecord(
+                epoch=sp.TNat,
+                offset=sp.TNat,
+                limit=sp.TNat,
+            ).layout(("epoch", ("offset", "limit"))),
+        )
+
+        # Store as local variables to keep on stack
+        total_votes = sp.compute(self.data.total_epoch_votes.get(params.epoch, 0))
+        real_emission = sp.compute(self.data.epoch_emission.get(params.epoch, 0))
+
+        amms = sp.local("amms", sp.list(l=[], t=Types.EPOCH_SUMMARY_ITEM))
+
+        # Clip the page to the size of the registry
+        end = sp.compute(sp.min(params.offset + params.limit, self.data.amm_count))
+        with sp.for_("index", sp.range(params.offset, end)) as index:
+            amm = sp.compute(self.data.amm_registry[index])
+            gauge_bribe = sp.compute(self.data.amm_to_gauge_bribe[amm])
+            votes = sp.compute(self.data.total_amm_votes.get(sp.record(amm=amm, epoch=params.epoch), 0))
+
+            # Vote share and recharge amount are calculated as in recharge_gauge
+            share = sp.local("share", sp.nat(0))
+            with sp.if_(total_votes != 0):
+                share.value = (votes * VOTE_SHARE_MULTIPLIER) // total_votes
+
+            amms.value.push(
+                sp.record(
+                    amm=amm,
+                    gauge=gauge_bribe.gauge,
+                    bribe=gauge_bribe.bribe,
+                    votes=votes,
+                    share=share.value,
+                    recharge_amount=(real_emission * share.value) // VOTE_SHARE_MULTIPLIER,
+                )
+            )
+
+        sp.result(sp.set_type_expr(sp.record(total_votes=total_votes, amms=amms.value.rev()), Types.EPOCH_SUMMARY))
+
     @sp.onchain_view()
     def get_total_epoch_votes(self, param):
         sp.set_type(param, sp.TNat)
@@ -609,6 +1523,47 @@ if __name__ == "__main__":
         # Check if values are equal after removing precision digits
         return (a // dec) == (b // dec)
 
+    ####################################
+    # add_amm & remove_amm (valid test)
+    ####################################
+
+    @sp.add_test(name="add_amm and remove_amm keep the AMM registry enumerable")
+    def test():
+        scenario = sp.test_scenario()
+
+        voter = Voter(core_factory=Addresses.ADMIN)
+
+        scenario += voter
+
+        # When three AMMs are added by the core factory
+        for amm in [Addresses.AMM_1, Addresses.AMM_2, Addresses.AMM_3]:
+            scenario += voter.add_amm(amm=amm, gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT).run(
+                sender=Addresses.ADMIN
+            )
+
+        # Registry is updated correctly
+        scenario.verify(voter.data.amm_count == 3)
+        scenario.verify(voter.data.amm_registry[2] == Addresses.AMM_3)
+        scenario.verify(voter.data.amm_registry_index[Addresses.AMM_3] == 2)
+
+        # When the first AMM is removed
+        scenario += voter.remove_amm(Addresses.AMM_1).run(sender=Addresses.ADMIN)
+
+        # The last AMM takes its place in the registry
+        scenario.verify(voter.data.amm_count == 2)
+        scenario.verify(voter.data.amm_registry[0] == Addresses.AMM_3)
+        scenario.verify(voter.data.amm_registry[1] == Addresses.AMM_2)
+        scenario.verify(voter.data.amm_registry_index[Addresses.AMM_3] == 0)
+        scenario.verify(~voter.data.amm_registry.contains(2))
+        scenario.verify(~voter.data.amm_registry_index.contains(Addresses.AMM_1))
+
+        # When the last AMM in the registry is removed
+        scenario += voter.remove_amm(Addresses.AMM_2).run(sender=Addresses.ADMIN)
+
+        scenario.verify(voter.data.amm_count == 1)
+        scenario.verify(voter.data.amm_registry[0] == Addresses.AMM_3)
+        scenario.verify(~voter.data.amm_registry.contains(1))
+
     ####################
     # vote (valid test)
     ####################
@@ -623,9 +1578,13 @@ if __name__ == "__main__":
         # Initialize voter with 3 whitelisted AMMs
         voter = Voter(
             epoch=1,
-            epoch_end=sp.big_map(l={1: sp.timestamp(10)}),
-            amm_to_gauge_bribe=sp.big_map(
-                l={
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=10,
+            ),
+            amm_to_gauge_bribe=sp.big_map(
+                l={
                     Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
                     Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
                     Addresses.AMM_3: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
@@ -672,6 +1631,16 @@ if __name__ == "__main__":
         scenario.verify(voter.data.total_token_votes[sp.record(token_id=2, epoch=1)] == 70)
         scenario.verify(voter.data.total_epoch_votes[1] == 120)
 
+        # Vote breakdown of each token is recorded correctly
+        scenario.verify_equal(
+            voter.get_token_votes(sp.record(token_id=1, epoch=1)),
+            {Addresses.AMM_1: 20, Addresses.AMM_2: 30},
+        )
+        scenario.verify_equal(
+            voter.get_token_votes(sp.record(token_id=2, epoch=1)),
+            {Addresses.AMM_2: 30, Addresses.AMM_3: 40},
+        )
+
     @sp.add_test(name="vote allows voting multiple times for the same amm using the same token")
     def test():
         scenario = sp.test_scenario()
@@ -682,7 +1651,11 @@ if __name__ == "__main__":
         # Initialize voter with an AMM
         voter = Voter(
             epoch=1,
-            epoch_end=sp.big_map(l={1: sp.timestamp(10)}),
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=10,
+            ),
             amm_to_gauge_bribe=sp.big_map(
                 l={
                     Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
@@ -728,7 +1701,11 @@ if __name__ == "__main__":
         # Initialize voter with an AMM
         voter = Voter(
             epoch=1,
-            epoch_end=sp.big_map(l={1: sp.timestamp(10)}),
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=10,
+            ),
             amm_to_gauge_bribe=sp.big_map(
                 l={
                     Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
@@ -762,17 +1739,21 @@ if __name__ == "__main__":
             exception=Errors.NOT_ENOUGH_VOTING_POWER_AVAILABLE,
         )
 
-    @sp.add_test(name="vote fails if zero vote is deposited for a certain amm")
+    @sp.add_test(name="vote fails if vote items together exceed the available token voting power")
     def test():
         scenario = sp.test_scenario()
 
         # Initialize dummy vote escrow with two tokens of voting powers 100 & 150
         ve = VE(powers=sp.big_map(l={1: sp.nat(100), 2: sp.nat(150)}))
 
-        # Initialize voter with an AMM
+        # Initialize voter with two AMMs
         voter = Voter(
             epoch=1,
-            epoch_end=sp.big_map(l={1: sp.timestamp(10)}),
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=10,
+            ),
             amm_to_gauge_bribe=sp.big_map(
                 l={
                     Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
@@ -785,20 +1766,22 @@ if __name__ == "__main__":
         scenario += ve
         scenario += voter
 
-        # When ALICE puts zero vote for AMM_1, the txn fails
+        # When ALICE splits more than her voting power across AMM_1 and AMM_2, the txn fails
         scenario += voter.vote(
             sp.record(
                 token_id=1,
-                vote_items=sp.list([sp.record(amm=Addresses.AMM_1, votes=0)]),
+                vote_items=sp.list(
+                    [sp.record(amm=Addresses.AMM_1, votes=60), sp.record(amm=Addresses.AMM_2, votes=50)]
+                ),
             )
         ).run(
             sender=Addresses.ALICE,
             now=sp.timestamp(5),
             valid=False,
-            exception=Errors.ZERO_VOTE_NOT_ALLOWED,
+            exception=Errors.NOT_ENOUGH_VOTING_POWER_AVAILABLE,
         )
 
-    @sp.add_test(name="vote fails if epoch has already ended")
+    @sp.add_test(name="vote fails if zero vote is deposited for a certain amm")
     def test():
         scenario = sp.test_scenario()
 
@@ -808,7 +1791,11 @@ if __name__ == "__main__":
         # Initialize voter with an AMM
         voter = Voter(
             epoch=1,
-            epoch_end=sp.big_map(l={1: sp.timestamp(10)}),
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=10,
+            ),
             amm_to_gauge_bribe=sp.big_map(
                 l={
                     Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
@@ -821,7 +1808,7 @@ if __name__ == "__main__":
         scenario += ve
         scenario += voter
 
-        # When ALICE votes after the epoch has ended, txn fails
+        # When ALICE puts zero vote for AMM_1, the txn fails
         scenario += voter.vote(
             sp.record(
                 token_id=1,
@@ -829,451 +1816,1895 @@ if __name__ == "__main__":
             )
         ).run(
             sender=Addresses.ALICE,
-            now=sp.timestamp(11),
+            now=sp.timestamp(5),
             valid=False,
-            exception=Errors.EPOCH_ENDED,
+            exception=Errors.ZERO_VOTE_NOT_ALLOWED,
         )
 
-    ##########################
-    # next_epoch (valid test)
-    ##########################
-
-    @sp.add_test(name="next_epoch correctly updates first epoch")
-    def test():
-        scenario = sp.test_scenario()
-
-        voter = Voter()
-
-        scenario += voter
-
-        # When next_epoch is called for the first time
-        scenario += voter.next_epoch().run(now=sp.timestamp(8 * DAY))
-
-        # Storage is updated correctly
-        scenario.verify(voter.data.epoch == 1)
-        scenario.verify(voter.data.epoch_end[1] == sp.timestamp(2 * WEEK))
-        scenario.verify(voter.data.emission.genesis == 2 * WEEK)
-
-    @sp.add_test(name="next_epoch correctly updates epoch during first emission drop")
+    @sp.add_test(name="vote fails if epoch has already ended")
     def test():
         scenario = sp.test_scenario()
 
-        # Initialize vote escrow with locked supply of 1,00,000 tokens
-        ve = VE(locked_supply=sp.nat(1_000_000 * DECIMALS))
-
-        # Initialize Ply token with total supply 4,00,000 tokens
-        ply = Ply(total_supply=sp.nat(4_000_000 * DECIMALS))
+        # Initialize dummy vote escrow with two tokens of voting powers 100 & 150
+        ve = VE(powers=sp.big_map(l={1: sp.nat(100), 2: sp.nat(150)}))
 
+        # Initialize voter with an AMM
         voter = Voter(
-            epoch=5,
-            epoch_end=sp.big_map(l={5: sp.timestamp(6 * WEEK)}),
+            epoch=1,
             emission=sp.record(
                 base=INITIAL_EMISSION,
                 real=sp.nat(0),
-                genesis=2 * WEEK,
+                genesis=10,
+            ),
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                    Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
             ),
             ve_address=ve.address,
-            ply_address=ply.address,
         )
 
         scenario += ve
-        scenario += ply
         scenario += voter
 
-        # When next_epoch is called at the end of 4 weeks of emission
-        scenario += voter.next_epoch().run(now=sp.timestamp(6 * WEEK + 124))  # random offset for testing
-
-        # Epoch is updated correctly
-        scenario.verify(voter.data.epoch == 6)
-        scenario.verify(voter.data.epoch_end[6] == sp.timestamp(7 * WEEK))
-
-        # Predicted values
-        emission_offset = 375_000 * DECIMALS
-        real_emission = 2_625_000 * DECIMALS
-        base_emission = 2_000_000 * DECIMALS
-
-        # Emission values are updated correctly
-        scenario.verify(precision_equal(voter.data.emission.base, base_emission, DECIMALS))
-        scenario.verify(precision_equal(voter.data.emission.real, real_emission, DECIMALS))
-
-        # Predicted locker inflation
-        locker_inflation = 328_125 * DECIMALS
-
-        # Correct inflation is record
-        scenario.verify(precision_equal(ve.data.inflation, locker_inflation, DECIMALS))
-
-        # When next epoch is called again at the end of 7 Weeks
-        scenario += voter.next_epoch().run(now=sp.timestamp(7 * WEEK + 73))
-
-        # Epoch is updated correctly
-        scenario.verify(voter.data.epoch == 7)
-        scenario.verify(voter.data.epoch_end[7] == sp.timestamp(8 * WEEK))
-
-        # Predicted values
-        emission_offset = 250_000 * DECIMALS
-        real_emission = 1_750_000 * DECIMALS
-
-        # Emission values are updated correctly
-        scenario.verify(precision_equal(voter.data.emission.base, base_emission, DECIMALS))
-        scenario.verify(precision_equal(voter.data.emission.real, real_emission, DECIMALS))
-
-        # Predicted locker inflation
-        locker_inflation = 218_750 * DECIMALS
+        # When ALICE votes after the epoch has ended, txn fails
+        scenario += voter.vote(
+            sp.record(
+                token_id=1,
+                vote_items=sp.list([sp.record(amm=Addresses.AMM_1, votes=0)]),
+            )
+        ).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(11),
+            valid=False,
+            exception=Errors.EPOCH_ENDED,
+        )
 
-        # Correct inflation is record
-        scenario.verify(precision_equal(ve.data.inflation, locker_inflation, DECIMALS))
+    ##############################
+    # vote_by_weight (valid test)
+    ##############################
 
-    @sp.add_test(name="next_epoch correctly updates epoch during yearly emission drop")
+    @sp.add_test(name="vote_by_weight splits the available voting power based on weights")
     def test():
         scenario = sp.test_scenario()
 
-        # Initialize vote escrow with locked supply of 1,00,000 tokens
-        ve = VE(locked_supply=sp.nat(1_000_000 * DECIMALS))
-
-        # Initialize Ply token with total supply 4,00,000 tokens
-        ply = Ply(total_supply=sp.nat(4_000_000 * DECIMALS))
+        # Initialize dummy vote escrow with a token of voting power 1000
+        ve = VE(powers=sp.big_map(l={1: sp.nat(1000)}))
 
+        # Initialize voter with 2 whitelisted AMMs and 200 votes already used by token-1
         voter = Voter(
-            epoch=53,
-            epoch_end=sp.big_map(l={53: sp.timestamp(54 * WEEK)}),
+            epoch=1,
             emission=sp.record(
-                base=2_000_000 * DECIMALS,
+                base=INITIAL_EMISSION,
                 real=sp.nat(0),
-                genesis=2 * WEEK,
+                genesis=10,
+            ),
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                    Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            token_amm_votes=sp.big_map(
+                l={
+                    sp.record(token_id=1, amm=Addresses.AMM_1, epoch=1): 200,
+                }
+            ),
+            total_amm_votes=sp.big_map(
+                l={
+                    sp.record(amm=Addresses.AMM_1, epoch=1): 200,
+                }
             ),
+            total_token_votes=sp.big_map(l={sp.record(token_id=1, epoch=1): 200}),
+            token_epoch_amms=sp.big_map(l={sp.record(token_id=1, epoch=1): sp.set([Addresses.AMM_1])}),
+            total_epoch_votes=sp.big_map(l={1: 200}),
             ve_address=ve.address,
-            ply_address=ply.address,
         )
 
         scenario += ve
-        scenario += ply
         scenario += voter
 
-        # When next epoch is called at the end of 1st complete year
-        scenario += voter.next_epoch().run(now=sp.timestamp(54 * WEEK + 24))
-
-        # Epoch is updated correctly
-        scenario.verify(voter.data.epoch == 54)
-        scenario.verify(voter.data.epoch_end[54] == sp.timestamp(55 * WEEK))
-
-        # Predicted values
-        emission_offset = 250_000 * DECIMALS
-        real_emission = 1_750_000 * DECIMALS
-        base_emission = 1_414_213 * DECIMALS
-
-        # Emission values are updated correctly
-        scenario.verify(precision_equal(voter.data.emission.base, base_emission, DECIMALS))
-        scenario.verify(precision_equal(voter.data.emission.real, real_emission, DECIMALS))
-
-        # Predicted locker inflation
-        locker_inflation = 218_750 * DECIMALS
+        # When ALICE votes 1/3rd & 2/3rd of the remaining power for AMM_1 & AMM_2
+        scenario += voter.vote_by_weight(
+            token_id=1,
+            weights=sp.list(
+                [
+                    sp.record(amm=Addresses.AMM_1, weight=3_333),
+                    sp.record(amm=Addresses.AMM_2, weight=6_667),
+                ]
+            ),
+        ).run(sender=Addresses.ALICE, now=sp.timestamp(5))
 
-        # Correct inflation is record
-        scenario.verify(precision_equal(ve.data.inflation, locker_inflation, DECIMALS))
+        # Storage is updated correctly with votes rounded down
+        scenario.verify(voter.data.token_amm_votes[sp.record(token_id=1, amm=Addresses.AMM_1, epoch=1)] == 466)
+        scenario.verify(voter.data.token_amm_votes[sp.record(token_id=1, amm=Addresses.AMM_2, epoch=1)] == 533)
+        scenario.verify(voter.data.total_amm_votes[sp.record(amm=Addresses.AMM_1, epoch=1)] == 466)
+        scenario.verify(voter.data.total_amm_votes[sp.record(amm=Addresses.AMM_2, epoch=1)] == 533)
+        scenario.verify(voter.data.total_token_votes[sp.record(token_id=1, epoch=1)] == 999)
+        scenario.verify(voter.data.total_epoch_votes[1] == 999)
+        scenario.verify(
+            voter.data.token_epoch_amms[sp.record(token_id=1, epoch=1)] == sp.set([Addresses.AMM_1, Addresses.AMM_2])
+        )
 
-    ############################
-    # next_epoch (failure test)
-    ############################
+    ################################
+    # vote_by_weight (failure test)
+    ################################
 
-    @sp.add_test(name="next_epoch fails if called before current epoch is over")
+    @sp.add_test(name="vote_by_weight fails if weights exceed the whole voting power or amm is not whitelisted")
     def test():
         scenario = sp.test_scenario()
 
+        # Initialize dummy vote escrow with a token of voting power 1000
+        ve = VE(powers=sp.big_map(l={1: sp.nat(1000)}))
+
+        # Initialize voter with an AMM
         voter = Voter(
-            epoch_end=sp.big_map(
+            epoch=1,
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=10,
+            ),
+            amm_to_gauge_bribe=sp.big_map(
                 l={
-                    1: sp.timestamp(5),
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
                 }
             ),
-            epoch=sp.nat(1),
+            ve_address=ve.address,
         )
 
+        scenario += ve
         scenario += voter
 
-        # When next_epoch is called before the current epoch is over, the txn fails
-        scenario += voter.next_epoch().run(
-            now=sp.timestamp(4),
+        # When ALICE uses weights summing over 100%, txn fails
+        scenario += voter.vote_by_weight(
+            token_id=1,
+            weights=sp.list([sp.record(amm=Addresses.AMM_1, weight=10_001)]),
+        ).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(5),
             valid=False,
-            exception=Errors.PREVIOUS_EPOCH_YET_TO_END,
+            exception=Errors.VOTE_WEIGHTS_EXCEED_TOTAL,
         )
 
-    ##########################
-    # claim_fee (valid test)
-    ##########################
+        # When ALICE votes for a non-whitelisted amm, txn fails
+        scenario += voter.vote_by_weight(
+            token_id=1,
+            weights=sp.list([sp.record(amm=Addresses.AMM_2, weight=5_000)]),
+        ).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(5),
+            valid=False,
+            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+        )
 
-    @sp.add_test(name="claim_fee correctly calculates the vote share for one epoch")
+        # When ALICE votes after the epoch has ended, txn fails
+        scenario += voter.vote_by_weight(
+            token_id=1,
+            weights=sp.list([sp.record(amm=Addresses.AMM_1, weight=5_000)]),
+        ).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(11),
+            valid=False,
+            exception=Errors.EPOCH_ENDED,
+        )
+
+    #########################
+    # vote_many (valid test)
+    #########################
+
+    @sp.add_test(name="vote_many allows voting with multiple tokens across multiple whitelisted AMMs")
     def test():
         scenario = sp.test_scenario()
 
-        # Initialize dummy vote escrow for ownership checks
-        ve = VE()
-
-        # Initialize a dummy fee distributor contract
-        fee_dist = FeeDist()
+        # Initialize dummy vote escrow with two tokens of voting powers 100 & 150
+        ve = VE(powers=sp.big_map(l={1: sp.nat(100), 2: sp.nat(150)}))
 
-        # Initialize with some votes for epoch 1
+        # Initialize voter with 3 whitelisted AMMs
         voter = Voter(
-            epoch=2,
-            epoch_end=sp.big_map(l={2: sp.timestamp(10)}),
+            epoch=1,
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=10,
+            ),
             amm_to_gauge_bribe=sp.big_map(
                 l={
                     Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
-                }
-            ),
-            token_amm_votes=sp.big_map(
-                l={
-                    sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1): 150,
+                    Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                    Addresses.AMM_3: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
                 }
             ),
             total_amm_votes=sp.big_map(
                 l={
-                    sp.record(epoch=1, amm=Addresses.AMM_1): 250,
+                    sp.record(amm=Addresses.AMM_2, epoch=1): 10,
                 }
             ),
-            fee_distributor=fee_dist.address,
+            total_epoch_votes=sp.big_map(l={1: 10}),
             ve_address=ve.address,
         )
 
         scenario += ve
-        scenario += fee_dist
         scenario += voter
 
-        # When ALICE calls claim_fee for epoch 1 votes
+        # When ALICE votes using both token-1 and token-2 in one call
+        scenario += voter.vote_many(
+            [
+                sp.record(
+                    token_id=1,
+                    vote_items=sp.list(
+                        [sp.record(amm=Addresses.AMM_1, votes=20), sp.record(amm=Addresses.AMM_2, votes=30)]
+                    ),
+                ),
+                sp.record(
+                    token_id=2,
+                    vote_items=sp.list(
+                        [sp.record(amm=Addresses.AMM_2, votes=30), sp.record(amm=Addresses.AMM_3, votes=40)]
+                    ),
+                ),
+            ]
+        ).run(sender=Addresses.ALICE, now=sp.timestamp(5))
+
+        # Storage is updated correctly
+        scenario.verify(voter.data.token_amm_votes[sp.record(token_id=1, amm=Addresses.AMM_1, epoch=1)] == 20)
+        scenario.verify(voter.data.token_amm_votes[sp.record(token_id=1, amm=Addresses.AMM_2, epoch=1)] == 30)
+        scenario.verify(voter.data.token_amm_votes[sp.record(token_id=2, amm=Addresses.AMM_2, epoch=1)] == 30)
+        scenario.verify(voter.data.token_amm_votes[sp.record(token_id=2, amm=Addresses.AMM_3, epoch=1)] == 40)
+        scenario.verify(voter.data.total_amm_votes[sp.record(amm=Addresses.AMM_1, epoch=1)] == 20)
+        scenario.verify(voter.data.total_amm_votes[sp.record(amm=Addresses.AMM_2, epoch=1)] == 70)
+        scenario.verify(voter.data.total_amm_votes[sp.record(amm=Addresses.AMM_3, epoch=1)] == 40)
+        scenario.verify(voter.data.total_token_votes[sp.record(token_id=1, epoch=1)] == 50)
+        scenario.verify(voter.data.total_token_votes[sp.record(token_id=2, epoch=1)] == 70)
+        scenario.verify(voter.data.total_epoch_votes[1] == 130)
+        scenario.verify(
+            voter.data.token_epoch_amms[sp.record(token_id=2, epoch=1)] == sp.set([Addresses.AMM_2, Addresses.AMM_3])
+        )
+
+    ###########################
+    # vote_many (failure test)
+    ###########################
+
+    @sp.add_test(name="vote_many fails if any token uses more than its available voting power")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow with two tokens of voting powers 100 & 150
+        ve = VE(powers=sp.big_map(l={1: sp.nat(100), 2: sp.nat(150)}))
+
+        # Initialize voter with an AMM
+        voter = Voter(
+            epoch=1,
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=10,
+            ),
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += voter
+
+        # When ALICE votes with token-2 within its power but overshoots with token-1, the txn fails
+        scenario += voter.vote_many(
+            [
+                sp.record(token_id=2, vote_items=sp.list([sp.record(amm=Addresses.AMM_1, votes=150)])),
+                sp.record(token_id=1, vote_items=sp.list([sp.record(amm=Addresses.AMM_1, votes=101)])),
+            ]
+        ).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(5),
+            valid=False,
+            exception=Errors.NOT_ENOUGH_VOTING_POWER_AVAILABLE,
+        )
+
+        # When ALICE votes after the epoch has ended, txn fails
+        scenario += voter.vote_many(
+            [sp.record(token_id=1, vote_items=sp.list([sp.record(amm=Addresses.AMM_1, votes=10)]))]
+        ).run(
+            sender=Addresses.ALICE,
+            now=sp.timestamp(11),
+            valid=False,
+            exception=Errors.EPOCH_ENDED,
+        )
+
+    ###############################
+    # set_sticky_vote (valid test)
+    ###############################
+
+    @sp.add_test(name="set_sticky_vote stores and clears the sticky vote of a token")
+    def test():
+        scenario = sp.test_scenario()
+
+        ve = VE()
+
+        # Initialize voter with 2 whitelisted AMMs
+        voter = Voter(
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                    Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += voter
+
+        # When ALICE sets a sticky vote for token-1
+        weights = sp.list([sp.record(amm=Addresses.AMM_1, weight=4_000), sp.record(amm=Addresses.AMM_2, weight=6_000)])
+        scenario += voter.set_sticky_vote(token_id=1, weights=weights).run(sender=Addresses.ALICE)
+
+        # Storage is updated correctly
+        scenario.verify_equal(voter.data.sticky_votes[1], sp.record(owner=Addresses.ALICE, weights=weights))
+
+        # When ALICE sets an empty list of weights
+        scenario += voter.set_sticky_vote(token_id=1, weights=sp.list([])).run(sender=Addresses.ALICE)
+
+        # Sticky vote is removed
+        scenario.verify(~voter.data.sticky_votes.contains(1))
+
+    #################################
+    # set_sticky_vote (failure test)
+    #################################
+
+    @sp.add_test(name="set_sticky_vote fails for invalid weights or non-whitelisted AMMs")
+    def test():
+        scenario = sp.test_scenario()
+
+        ve = VE()
+
+        # Initialize voter with an AMM
+        voter = Voter(
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += voter
+
+        # When ALICE sets weights above the whole voting power, txn fails
+        scenario += voter.set_sticky_vote(
+            token_id=1, weights=sp.list([sp.record(amm=Addresses.AMM_1, weight=10_001)])
+        ).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.VOTE_WEIGHTS_EXCEED_TOTAL,
+        )
+
+        # When ALICE sets a zero weight, txn fails
+        scenario += voter.set_sticky_vote(token_id=1, weights=sp.list([sp.record(amm=Addresses.AMM_1, weight=0)])).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.ZERO_VOTE_NOT_ALLOWED,
+        )
+
+        # When ALICE sets a weight for a non-whitelisted amm, txn fails
+        scenario += voter.set_sticky_vote(
+            token_id=1, weights=sp.list([sp.record(amm=Addresses.AMM_2, weight=100)])
+        ).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+        )
+
+    ####################
+    # poke (valid test)
+    ####################
+
+    @sp.add_test(name="poke casts sticky votes for tokens that have not voted in the epoch")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow with three tokens
+        ve = VE(powers=sp.big_map(l={1: sp.nat(100), 2: sp.nat(150), 3: sp.nat(200)}))
+
+        # Initialize voter with 2 whitelisted AMMs, sticky votes for token 1 & 2 and token 2 already voted
+        voter = Voter(
+            epoch=2,
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=10,
+            ),
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                    Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            total_amm_votes=sp.big_map(
+                l={
+                    sp.record(amm=Addresses.AMM_1, epoch=2): 150,
+                }
+            ),
+            total_token_votes=sp.big_map(
+                l={
+                    sp.record(token_id=2, epoch=2): 150,
+                }
+            ),
+            total_epoch_votes=sp.big_map(l={2: 150}),
+            sticky_votes=sp.big_map(
+                l={
+                    1: sp.record(
+                        owner=Addresses.ALICE,
+                        weights=sp.list(
+                            [
+                                sp.record(amm=Addresses.AMM_1, weight=2_500),
+                                sp.record(amm=Addresses.AMM_2, weight=5_000),
+                            ]
+                        ),
+                    ),
+                    2: sp.record(
+                        owner=Addresses.BOB,
+                        weights=sp.list([sp.record(amm=Addresses.AMM_2, weight=10_000)]),
+                    ),
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += voter
+
+        # When anyone pokes token 1, 2 & 3
+        scenario += voter.poke([1, 2, 3]).run(sender=Addresses.JOHN, now=sp.timestamp(5))
+
+        # Only token-1 casts its sticky vote
+        scenario.verify(voter.data.token_amm_votes[sp.record(token_id=1, amm=Addresses.AMM_1, epoch=2)] == 25)
+        scenario.verify(voter.data.token_amm_votes[sp.record(token_id=1, amm=Addresses.AMM_2, epoch=2)] == 50)
+        scenario.verify(~voter.data.token_amm_votes.contains(sp.record(token_id=2, amm=Addresses.AMM_2, epoch=2)))
+        scenario.verify(voter.data.total_amm_votes[sp.record(amm=Addresses.AMM_1, epoch=2)] == 175)
+        scenario.verify(voter.data.total_amm_votes[sp.record(amm=Addresses.AMM_2, epoch=2)] == 50)
+        scenario.verify(voter.data.total_token_votes[sp.record(token_id=1, epoch=2)] == 75)
+        scenario.verify(voter.data.total_token_votes[sp.record(token_id=2, epoch=2)] == 150)
+        scenario.verify(~voter.data.total_token_votes.contains(sp.record(token_id=3, epoch=2)))
+        scenario.verify(voter.data.total_epoch_votes[2] == 225)
+        scenario.verify(
+            voter.data.token_epoch_amms[sp.record(token_id=1, epoch=2)] == sp.set([Addresses.AMM_1, Addresses.AMM_2])
+        )
+
+        # When token-1 is poked again in the same epoch, nothing changes
+        scenario += voter.poke([1]).run(sender=Addresses.JOHN, now=sp.timestamp(6))
+
+        scenario.verify(voter.data.total_token_votes[sp.record(token_id=1, epoch=2)] == 75)
+        scenario.verify(voter.data.total_epoch_votes[2] == 225)
+
+    @sp.add_test(name="poke adds up the votes of an AMM listed more than once in a sticky vote")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow with a token of voting power 100
+        ve = VE(powers=sp.big_map(l={1: sp.nat(100)}))
+
+        voter = Voter(
+            epoch=2,
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=10,
+            ),
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                    Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += voter
+
+        # When ALICE sets a sticky vote that lists AMM_1 twice
+        weights = sp.list(
+            [
+                sp.record(amm=Addresses.AMM_1, weight=3_000),
+                sp.record(amm=Addresses.AMM_2, weight=2_000),
+                sp.record(amm=Addresses.AMM_1, weight=5_000),
+            ]
+        )
+        scenario += voter.set_sticky_vote(token_id=1, weights=weights).run(sender=Addresses.ALICE)
+
+        # and anyone pokes token-1
+        scenario += voter.poke([1]).run(sender=Addresses.JOHN, now=sp.timestamp(5))
+
+        # Votes of the token for AMM_1 match its share of the AMM's total votes
+        scenario.verify(voter.data.token_amm_votes[sp.record(token_id=1, amm=Addresses.AMM_1, epoch=2)] == 80)
+        scenario.verify(voter.data.token_amm_votes[sp.record(token_id=1, amm=Addresses.AMM_2, epoch=2)] == 20)
+        scenario.verify(voter.data.total_amm_votes[sp.record(amm=Addresses.AMM_1, epoch=2)] == 80)
+        scenario.verify(voter.data.total_amm_votes[sp.record(amm=Addresses.AMM_2, epoch=2)] == 20)
+        scenario.verify(voter.data.total_token_votes[sp.record(token_id=1, epoch=2)] == 100)
+        scenario.verify(voter.data.total_epoch_votes[2] == 100)
+
+    ######################
+    # poke (failure test)
+    ######################
+
+    @sp.add_test(name="poke fails if epoch has already ended")
+    def test():
+        scenario = sp.test_scenario()
+
+        ve = VE()
+
+        voter = Voter(
+            epoch=1,
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=10,
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += voter
+
+        # When poke is called after the epoch has ended, txn fails
+        scenario += voter.poke([1]).run(
+            sender=Addresses.JOHN,
+            now=sp.timestamp(11),
+            valid=False,
+            exception=Errors.EPOCH_ENDED,
+        )
+
+    ##########################
+    # next_epoch (valid test)
+    ##########################
+
+    @sp.add_test(name="next_epoch correctly updates first epoch")
+    def test():
+        scenario = sp.test_scenario()
+
+        voter = Voter()
+
+        scenario += voter
+
+        # When next_epoch is called for the first time
+        scenario += voter.next_epoch().run(now=sp.timestamp(8 * DAY))
+
+        # Storage is updated correctly
+        scenario.verify(voter.data.epoch == 1)
+        scenario.verify(voter.get_current_epoch() == (1, sp.timestamp(2 * WEEK)))
+        scenario.verify(voter.data.emission.genesis == 2 * WEEK)
+
+    @sp.add_test(name="next_epoch correctly updates epoch during first emission drop")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize vote escrow with locked supply of 1,00,000 tokens
+        ve = VE(locked_supply=sp.nat(1_000_000 * DECIMALS))
+
+        # Initialize Ply token with total supply 4,00,000 tokens
+        ply = Ply(total_supply=sp.nat(4_000_000 * DECIMALS))
+
+        voter = Voter(
+            epoch=5,
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=2 * WEEK,
+            ),
+            ve_address=ve.address,
+            ply_address=ply.address,
+        )
+
+        scenario += ve
+        scenario += ply
+        scenario += voter
+
+        # When next_epoch is called at the end of 4 weeks of emission
+        scenario += voter.next_epoch().run(now=sp.timestamp(6 * WEEK + 124))  # random offset for testing
+
+        # Epoch is updated correctly
+        scenario.verify(voter.data.epoch == 6)
+        scenario.verify(voter.get_current_epoch() == (6, sp.timestamp(7 * WEEK)))
+
+        # Predicted values
+        emission_offset = 375_000 * DECIMALS
+        real_emission = 2_625_000 * DECIMALS
+        base_emission = 2_000_000 * DECIMALS
+
+        # Emission values are updated correctly
+        scenario.verify(precision_equal(voter.data.emission.base, base_emission, DECIMALS))
+        scenario.verify(precision_equal(voter.data.emission.real, real_emission, DECIMALS))
+        scenario.verify(precision_equal(voter.data.epoch_emission[5], real_emission, DECIMALS))
+
+        # Predicted locker inflation
+        locker_inflation = 328_125 * DECIMALS
+
+        # Correct inflation is record
+        scenario.verify(precision_equal(ve.data.inflation, locker_inflation, DECIMALS))
+
+        # When next epoch is called again at the end of 7 Weeks
+        scenario += voter.next_epoch().run(now=sp.timestamp(7 * WEEK + 73))
+
+        # Epoch is updated correctly
+        scenario.verify(voter.data.epoch == 7)
+        scenario.verify(voter.get_current_epoch() == (7, sp.timestamp(8 * WEEK)))
+
+        # Predicted values
+        emission_offset = 250_000 * DECIMALS
+        real_emission = 1_750_000 * DECIMALS
+
+        # Emission values are updated correctly
+        scenario.verify(precision_equal(voter.data.emission.base, base_emission, DECIMALS))
+        scenario.verify(precision_equal(voter.data.emission.real, real_emission, DECIMALS))
+        scenario.verify(precision_equal(voter.data.epoch_emission[6], real_emission, DECIMALS))
+
+        # Emission recorded for the previous epoch is left unchanged
+        scenario.verify(precision_equal(voter.data.epoch_emission[5], 2_625_000 * DECIMALS, DECIMALS))
+
+        # Predicted locker inflation
+        locker_inflation = 218_750 * DECIMALS
+
+        # Correct inflation is record
+        scenario.verify(precision_equal(ve.data.inflation, locker_inflation, DECIMALS))
+
+    @sp.add_test(name="next_epoch correctly updates epoch during yearly emission drop")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize vote escrow with locked supply of 1,00,000 tokens
+        ve = VE(locked_supply=sp.nat(1_000_000 * DECIMALS))
+
+        # Initialize Ply token with total supply 4,00,000 tokens
+        ply = Ply(total_supply=sp.nat(4_000_000 * DECIMALS))
+
+        voter = Voter(
+            epoch=53,
+            emission=sp.record(
+                base=2_000_000 * DECIMALS,
+                real=sp.nat(0),
+                genesis=2 * WEEK,
+            ),
+            ve_address=ve.address,
+            ply_address=ply.address,
+        )
+
+        scenario += ve
+        scenario += ply
+        scenario += voter
+
+        # When next epoch is called at the end of 1st complete year
+        scenario += voter.next_epoch().run(now=sp.timestamp(54 * WEEK + 24))
+
+        # Epoch is updated correctly
+        scenario.verify(voter.data.epoch == 54)
+        scenario.verify(voter.get_current_epoch() == (54, sp.timestamp(55 * WEEK)))
+
+        # Predicted values
+        emission_offset = 250_000 * DECIMALS
+        real_emission = 1_750_000 * DECIMALS
+        base_emission = 1_414_213 * DECIMALS
+
+        # Emission values are updated correctly
+        scenario.verify(precision_equal(voter.data.emission.base, base_emission, DECIMALS))
+        scenario.verify(precision_equal(voter.data.emission.real, real_emission, DECIMALS))
+        scenario.verify(precision_equal(voter.data.epoch_emission[53], real_emission, DECIMALS))
+
+        # Predicted locker inflation
+        locker_inflation = 218_750 * DECIMALS
+
+        # Correct inflation is record
+        scenario.verify(precision_equal(ve.data.inflation, locker_inflation, DECIMALS))
+
+    @sp.add_test(name="next_epoch correctly advances through multiple elapsed epochs")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize vote escrow with locked supply of 1,00,000 tokens
+        ve = VE(locked_supply=sp.nat(1_000_000 * DECIMALS))
+
+        # Initialize Ply token with total supply 4,00,000 tokens
+        ply = Ply(total_supply=sp.nat(4_000_000 * DECIMALS))
+
+        voter = Voter(
+            epoch=5,
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=2 * WEEK,
+            ),
+            ve_address=ve.address,
+            ply_address=ply.address,
+        )
+
+        scenario += ve
+        scenario += ply
+        scenario += voter
+
+        # When next_epoch is called two weeks after epoch 5 has ended
+        scenario += voter.next_epoch().run(now=sp.timestamp(8 * WEEK + 124))
+
+        # Epochs 5, 6 & 7 are all advanced through
+        scenario.verify(voter.data.epoch == 8)
+        scenario.verify(voter.get_epoch_end(6) == 7 * WEEK)
+        scenario.verify(voter.get_epoch_end(7) == 8 * WEEK)
+        scenario.verify(voter.get_current_epoch() == (8, sp.timestamp(9 * WEEK)))
+
+        # Predicted values
+        real_emission = 2_625_000 * DECIMALS
+        base_emission = 2_000_000 * DECIMALS
+
+        # Real emission is that of the voted epoch and the first emission drop is applied
+        scenario.verify(precision_equal(voter.data.emission.base, base_emission, DECIMALS))
+        scenario.verify(precision_equal(voter.data.emission.real, real_emission, DECIMALS))
+        scenario.verify(precision_equal(voter.data.epoch_emission[5], real_emission, DECIMALS))
+        scenario.verify(~voter.data.epoch_emission.contains(6))
+
+        # Predicted locker inflation for epoch 7 and across epochs 5, 6 & 7
+        locker_inflation = 286_211 * DECIMALS
+        total_locker_inflation = 874_114 * DECIMALS
+
+        # Lockers inflation is minted once and the last epoch's inflation is recorded
+        scenario.verify(precision_equal(ply.data.minted, total_locker_inflation, DECIMALS))
+        scenario.verify(precision_equal(ve.data.inflation, locker_inflation, DECIMALS))
+
+    ############################
+    # next_epoch (failure test)
+    ############################
+
+    @sp.add_test(name="next_epoch fails if called before current epoch is over")
+    def test():
+        scenario = sp.test_scenario()
+
+        voter = Voter(
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=sp.nat(0),
+                genesis=5,
+            ),
+            epoch=sp.nat(1),
+        )
+
+        scenario += voter
+
+        # When next_epoch is called before the current epoch is over, the txn fails
+        scenario += voter.next_epoch().run(
+            now=sp.timestamp(4),
+            valid=False,
+            exception=Errors.PREVIOUS_EPOCH_YET_TO_END,
+        )
+
+    ##########################
+    # claim_fee (valid test)
+    ##########################
+
+    @sp.add_test(name="claim_fee correctly calculates the vote share for one epoch")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow for ownership checks
+        ve = VE()
+
+        # Initialize a dummy fee distributor contract
+        fee_dist = FeeDist()
+
+        # Initialize with some votes for epoch 1
+        voter = Voter(
+            epoch=2,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            token_amm_votes=sp.big_map(
+                l={
+                    sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1): 150,
+                }
+            ),
+            total_amm_votes=sp.big_map(
+                l={
+                    sp.record(epoch=1, amm=Addresses.AMM_1): 250,
+                }
+            ),
+            fee_distributor=fee_dist.address,
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += fee_dist
+        scenario += voter
+
+        # When ALICE calls claim_fee for epoch 1 votes
+        scenario += voter.claim_fee(
+            sp.record(
+                token_id=1,
+                epochs=[1],
+                amm=Addresses.AMM_1,
+            )
+        ).run(sender=Addresses.ALICE)
+
+        # Vote share is calculated correctly and FeeDistributor contract is called with correct values
+        scenario.verify_equal(
+            fee_dist.data.claim_val.open_some(),
+            sp.record(
+                token_id=1,
+                amm=Addresses.AMM_1,
+                owner=Addresses.ALICE,
+                epoch_vote_shares=[sp.record(epoch=1, share=int(0.6 * VOTE_SHARE_MULTIPLIER))],
+            ),
+        )
+
+    @sp.add_test(name="claim_fee correctly calculates the vote share for multiple epochs")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow for ownership checks
+        ve = VE()
+
+        # Initialize a dummy fee distributor contract
+        fee_dist = FeeDist()
+
+        # Initialize with some votes for epoch 1
+        voter = Voter(
+            epoch=4,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            token_amm_votes=sp.big_map(
+                l={
+                    sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1): 150,
+                    sp.record(token_id=1, epoch=2, amm=Addresses.AMM_1): 250,
+                    sp.record(token_id=1, epoch=3, amm=Addresses.AMM_1): 350,
+                }
+            ),
+            total_amm_votes=sp.big_map(
+                l={
+                    sp.record(epoch=1, amm=Addresses.AMM_1): 250,
+                    sp.record(epoch=2, amm=Addresses.AMM_1): 500,
+                    sp.record(epoch=3, amm=Addresses.AMM_1): 700,
+                }
+            ),
+            fee_distributor=fee_dist.address,
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += fee_dist
+        scenario += voter
+
+        # When ALICE calls claim_fee for votes of epochs 1, 2, 3
         scenario += voter.claim_fee(
             sp.record(
-                token_id=1,
-                epochs=[1],
+                token_id=1,
+                epochs=[1, 2, 3],
+                amm=Addresses.AMM_1,
+            )
+        ).run(sender=Addresses.ALICE)
+
+        # Vote share is calculated correctly and FeeDistributor contract is called with correct values
+        scenario.verify_equal(
+            fee_dist.data.claim_val.open_some(),
+            sp.record(
+                token_id=1,
+                amm=Addresses.AMM_1,
+                owner=Addresses.ALICE,
+                epoch_vote_shares=[
+                    sp.record(epoch=3, share=int(0.5 * VOTE_SHARE_MULTIPLIER)),
+                    sp.record(epoch=2, share=int(0.5 * VOTE_SHARE_MULTIPLIER)),
+                    sp.record(epoch=1, share=int(0.6 * VOTE_SHARE_MULTIPLIER)),
+                ],
+            ),
+        )
+
+    ############################
+    # claim_fee (failure test)
+    ############################
+
+    @sp.add_test(name="claim_fee fails if epoch is in the future or amm is not whitelisted")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow for ownership checks
+        ve = VE()
+
+        voter = Voter(
+            epoch=1,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += voter
+
+        # When ALICE tries to call claim_fee for future epoch 2, txn fails
+        scenario += voter.claim_fee(sp.record(token_id=1, epochs=[1, 2], amm=Addresses.AMM_1)).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.INVALID_EPOCH,
+        )
+
+        # When ALICE tries to call claim_fee for non-whitelisted AMM, txn fails
+        scenario += voter.claim_fee(sp.record(token_id=1, epochs=[1], amm=Addresses.AMM_2)).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+        )
+
+    ##########################
+    # claim_fees (valid test)
+    ##########################
+
+    @sp.add_test(name="claim_fees calculates the vote shares across amms and calls FeeDistributor once")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow for ownership checks
+        ve = VE()
+
+        # Initialize a dummy fee distributor contract
+        fee_dist = FeeDist()
+
+        # Initialize with some votes for epoch 1 & 2 across two AMMs
+        voter = Voter(
+            epoch=3,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                    Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            token_amm_votes=sp.big_map(
+                l={
+                    sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1): 150,
+                    sp.record(token_id=1, epoch=2, amm=Addresses.AMM_1): 100,
+                    sp.record(token_id=1, epoch=2, amm=Addresses.AMM_2): 50,
+                }
+            ),
+            total_amm_votes=sp.big_map(
+                l={
+                    sp.record(epoch=1, amm=Addresses.AMM_1): 250,
+                    sp.record(epoch=2, amm=Addresses.AMM_1): 400,
+                    sp.record(epoch=2, amm=Addresses.AMM_2): 250,
+                }
+            ),
+            fee_distributor=fee_dist.address,
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += fee_dist
+        scenario += voter
+
+        # When ALICE calls claim_fees for both AMMs
+        scenario += voter.claim_fees(
+            token_id=1,
+            amm_epochs={
+                Addresses.AMM_1: [1, 2],
+                Addresses.AMM_2: [2],
+            },
+        ).run(sender=Addresses.ALICE)
+
+        # Vote shares are calculated correctly and FeeDistributor contract is called with correct values
+        scenario.verify_equal(
+            fee_dist.data.claim_many_val.open_some(),
+            sp.record(
+                token_id=1,
+                owner=Addresses.ALICE,
+                amm_vote_shares={
+                    Addresses.AMM_1: [
+                        sp.record(epoch=2, share=int(0.25 * VOTE_SHARE_MULTIPLIER)),
+                        sp.record(epoch=1, share=int(0.6 * VOTE_SHARE_MULTIPLIER)),
+                    ],
+                    Addresses.AMM_2: [sp.record(epoch=2, share=int(0.2 * VOTE_SHARE_MULTIPLIER))],
+                },
+            ),
+        )
+
+    ############################
+    # claim_fees (failure test)
+    ############################
+
+    @sp.add_test(name="claim_fees fails if any epoch is in the future or amm is not whitelisted")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow for ownership checks
+        ve = VE()
+
+        voter = Voter(
+            epoch=2,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += voter
+
+        # When ALICE tries to claim fees for current epoch 2, txn fails
+        scenario += voter.claim_fees(token_id=1, amm_epochs={Addresses.AMM_1: [2]}).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.INVALID_EPOCH,
+        )
+
+        # When ALICE tries to claim fees for a non-whitelisted AMM, txn fails
+        scenario += voter.claim_fees(token_id=1, amm_epochs={Addresses.AMM_2: [1]}).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+        )
+
+    ###########################
+    # claim_bribe (valid test)
+    ###########################
+
+    @sp.add_test(name="claim_bribe correctly calculates the vote share")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow for ownership checks
+        ve = VE()
+
+        # Initialize a dummy bribe contract and set it in the voter for AMM_1
+        bribe = GaugeBribe()
+
+        # Initialize with some votes for epoch 1
+        voter = Voter(
+            epoch=2,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=bribe.address),
+                }
+            ),
+            token_amm_votes=sp.big_map(
+                l={
+                    sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1): 150,
+                }
+            ),
+            total_amm_votes=sp.big_map(
+                l={
+                    sp.record(epoch=1, amm=Addresses.AMM_1): 250,
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += bribe
+        scenario += voter
+
+        # When ALICE calls claim_bribe for epoch 1 votes
+        scenario += voter.claim_bribe(
+            sp.record(
+                token_id=1,
+                epoch=1,
+                amm=Addresses.AMM_1,
+                bribe_id=1,
+            )
+        ).run(sender=Addresses.ALICE)
+
+        # Vote share is calculated correctly and bribe contract is called with correct values
+        scenario.verify(
+            bribe.data.claim_val.open_some()
+            == sp.record(
+                token_id=1,
+                epoch=1,
+                owner=Addresses.ALICE,
+                bribe_id=1,
+                vote_share=int(0.6 * VOTE_SHARE_MULTIPLIER),
+            )
+        )
+
+    @sp.add_test(name="claim_bribe calls return_bribe when total votes for the amm is zero")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow for ownership checks
+        ve = VE()
+
+        # Initialize a dummy bribe contract and set it in the voter for AMM_1
+        bribe = GaugeBribe()
+
+        # Initialize with no votes for epoch 1
+        voter = Voter(
+            epoch=2,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=bribe.address),
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += bribe
+        scenario += voter
+
+        # When ALICE calls claim_bribe for epoch 1 votes
+        scenario += voter.claim_bribe(
+            sp.record(
+                token_id=1,
+                epoch=1,
+                amm=Addresses.AMM_1,
+                bribe_id=1,
+            )
+        ).run(sender=Addresses.ALICE)
+
+        # return_bribe is executed in the bribe contract
+        scenario.verify(bribe.data.return_val.open_some() == sp.record(epoch=1, bribe_id=1))
+
+    #############################
+    # claim_bribe (failure test)
+    #############################
+
+    @sp.add_test(name="claim_bribe fails if epoch is in the future or amm is not whitelisted")
+    def test():
+        scenario = sp.test_scenario()
+
+        voter = Voter(
+            epoch=1,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+        )
+
+        scenario += voter
+
+        # When ALICE tries to claim bribe for future epoch 2, txn fails
+        scenario += voter.claim_bribe(token_id=1, epoch=2, amm=Addresses.AMM_1, bribe_id=1).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.INVALID_EPOCH,
+        )
+
+        # When ALICE tries to claim bribe for non-whitelisted AMM, txn fails
+        scenario += voter.claim_bribe(token_id=1, epoch=0, amm=Addresses.AMM_2, bribe_id=1).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+        )
+
+    ##################################
+    # claim_epoch_bribes (valid test)
+    ##################################
+
+    @sp.add_test(name="claim_epoch_bribes correctly calculates the vote share")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow for ownership checks
+        ve = VE()
+
+        # Initialize a dummy bribe contract and set it in the voter for AMM_1
+        bribe = GaugeBribe()
+
+        # Initialize with some votes for epoch 1
+        voter = Voter(
+            epoch=2,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=bribe.address),
+                }
+            ),
+            token_amm_votes=sp.big_map(
+                l={
+                    sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1): 150,
+                }
+            ),
+            total_amm_votes=sp.big_map(
+                l={
+                    sp.record(epoch=1, amm=Addresses.AMM_1): 250,
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += bribe
+        scenario += voter
+
+        # When ALICE calls claim_epoch_bribes for epoch 1 votes
+        scenario += voter.claim_epoch_bribes(token_id=1, epoch=1, amm=Addresses.AMM_1).run(sender=Addresses.ALICE)
+
+        # Vote share is calculated correctly and bribe contract is called with correct values
+        scenario.verify(
+            bribe.data.claim_epoch_val.open_some()
+            == sp.record(
+                token_id=1,
+                owner=Addresses.ALICE,
+                epoch=1,
+                vote_share=int(0.6 * VOTE_SHARE_MULTIPLIER),
+            )
+        )
+
+    ####################################
+    # claim_epoch_bribes (failure test)
+    ####################################
+
+    @sp.add_test(name="claim_epoch_bribes fails if epoch is not over or amm is not whitelisted")
+    def test():
+        scenario = sp.test_scenario()
+
+        voter = Voter(
+            epoch=2,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+        )
+
+        scenario += voter
+
+        # When ALICE tries to claim for the ongoing epoch 2, txn fails
+        scenario += voter.claim_epoch_bribes(token_id=1, epoch=2, amm=Addresses.AMM_1).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.INVALID_EPOCH,
+        )
+
+        # When ALICE tries to claim for a non-whitelisted AMM, txn fails
+        scenario += voter.claim_epoch_bribes(token_id=1, epoch=1, amm=Addresses.AMM_2).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+        )
+
+    ############################
+    # claim_bribes (valid test)
+    ############################
+
+    @sp.add_test(name="claim_bribes sends one claim_many per bribe contract and returns unvoted bribes")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow for ownership checks
+        ve = VE()
+
+        # Initialize dummy bribe contracts. AMM_1 & AMM_2 share bribe_1 for testing.
+        bribe_1 = GaugeBribe()
+        bribe_2 = GaugeBribe()
+
+        # Initialize with votes for AMM_1 & AMM_2 in epoch 1, and none for AMM_3
+        voter = Voter(
+            epoch=2,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=bribe_1.address),
+                    Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=bribe_1.address),
+                    Addresses.AMM_3: sp.record(gauge=Addresses.CONTRACT, bribe=bribe_2.address),
+                }
+            ),
+            token_amm_votes=sp.big_map(
+                l={
+                    sp.record(token_id=1, amm=Addresses.AMM_1, epoch=1): 25,
+                    sp.record(token_id=1, amm=Addresses.AMM_2, epoch=1): 50,
+                }
+            ),
+            total_amm_votes=sp.big_map(
+                l={
+                    sp.record(amm=Addresses.AMM_1, epoch=1): 100,
+                    sp.record(amm=Addresses.AMM_2, epoch=1): 250,
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += bribe_1
+        scenario += bribe_2
+        scenario += voter
+
+        # When ALICE claims bribes across the three AMMs
+        scenario += voter.claim_bribes(
+            token_id=1,
+            claims=[
+                sp.record(amm=Addresses.AMM_1, epoch=1, bribe_ids=[1, 2]),
+                sp.record(amm=Addresses.AMM_2, epoch=1, bribe_ids=[3]),
+                sp.record(amm=Addresses.AMM_3, epoch=1, bribe_ids=[4]),
+            ],
+        ).run(sender=Addresses.ALICE)
+
+        # bribe_1 receives all the claims with the correct vote shares in a single call
+        scenario.verify_equal(
+            bribe_1.data.claim_many_val.open_some(),
+            sp.record(
+                token_id=1,
+                owner=Addresses.ALICE,
+                claims=[
+                    sp.record(epoch=1, bribe_id=1, vote_share=int(0.25 * VOTE_SHARE_MULTIPLIER)),
+                    sp.record(epoch=1, bribe_id=2, vote_share=int(0.25 * VOTE_SHARE_MULTIPLIER)),
+                    sp.record(epoch=1, bribe_id=3, vote_share=int(0.2 * VOTE_SHARE_MULTIPLIER)),
+                ],
+            ),
+        )
+
+        # return_bribe is executed in bribe_2 since AMM_3 has no votes
+        scenario.verify(bribe_2.data.return_val.open_some() == sp.record(epoch=1, bribe_id=4))
+        scenario.verify(bribe_2.data.claim_many_val.is_none())
+
+    ##############################
+    # claim_bribes (failure test)
+    ##############################
+
+    @sp.add_test(name="claim_bribes fails if any epoch is in the future or amm is not whitelisted")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy vote escrow for ownership checks
+        ve = VE()
+
+        voter = Voter(
+            epoch=2,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            ve_address=ve.address,
+        )
+
+        scenario += ve
+        scenario += voter
+
+        # When ALICE tries to claim bribes for current epoch 2, txn fails
+        scenario += voter.claim_bribes(
+            token_id=1,
+            claims=[sp.record(amm=Addresses.AMM_1, epoch=2, bribe_ids=[1])],
+        ).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.INVALID_EPOCH,
+        )
+
+        # When ALICE tries to claim bribes for a non-whitelisted AMM, txn fails
+        scenario += voter.claim_bribes(
+            token_id=1,
+            claims=[sp.record(amm=Addresses.AMM_2, epoch=1, bribe_ids=[1])],
+        ).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+        )
+
+    ##############################
+    # recharge_gauge (valid test)
+    ##############################
+
+    @sp.add_test(name="recharge_gauge correctly calculates the amm vote share and recharges the gauge")
+    def test():
+        scenario = sp.test_scenario()
+
+        ply_token = FA12(Addresses.ADMIN)
+
+        # Initialize a dummy gauge contract and set it in the voter for AMM_1
+        gauge = GaugeBribe()
+
+        # Initialize with some votes for epoch 1
+        voter = Voter(
+            epoch=2,
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=1_000_000 * DECIMALS,
+                genesis=2 * WEEK,
+            ),
+            epoch_emission=sp.big_map(l={1: INITIAL_EMISSION}),
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=gauge.address, bribe=Addresses.CONTRACT),
+                }
+            ),
+            total_amm_votes=sp.big_map(
+                l={
+                    sp.record(epoch=1, amm=Addresses.AMM_1): 250,
+                }
+            ),
+            total_epoch_votes=sp.big_map(l={1: 500}),
+            ply_address=ply_token.address,
+        )
+
+        scenario += gauge
+        scenario += voter
+        scenario += ply_token
+
+        # Make voter contract a mint admin
+        scenario += ply_token.addMintAdmin(voter.address).run(sender=Addresses.ADMIN)
+
+        # When gauge is recharged for epoch 1
+        scenario += voter.recharge_gauge(
+            sp.record(
+                epoch=1,
                 amm=Addresses.AMM_1,
             )
         ).run(sender=Addresses.ALICE)
 
-        # Vote share is calculated correctly and FeeDistributor contract is called with correct values
-        scenario.verify_equal(
-            fee_dist.data.claim_val.open_some(),
-            sp.record(
-                token_id=1,
-                amm=Addresses.AMM_1,
-                owner=Addresses.ALICE,
-                epoch_vote_shares=[sp.record(epoch=1, share=int(0.6 * VOTE_SHARE_MULTIPLIER))],
+        # AMM's vote share is calculated correctly and gauge contract is called with correct amount value
+        scenario.verify(
+            gauge.data.recharge_val.open_some() == sp.record(amount=1_500_000 * DECIMALS, epoch=1)
+        )  # 0.5 of the real emission
+
+        # PLY tokens are minted correctly for gauge
+        scenario.verify(ply_token.data.balances[gauge.address].balance == 1_500_000 * DECIMALS)
+
+    ################################
+    # recharge_gauge (failure test)
+    ################################
+
+    @sp.add_test(name="recharge_gauge fails if epoch is in the future or amm is not whitelisted")
+    def test():
+        scenario = sp.test_scenario()
+
+        voter = Voter(
+            epoch=1,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
             ),
         )
 
-    @sp.add_test(name="claim_fee correctly calculates the vote share for multiple epochs")
+        scenario += voter
+
+        # When ALICE tries to call recharge_gauge for future epoch 2, txn fails
+        scenario += voter.recharge_gauge(epoch=2, amm=Addresses.AMM_1).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.INVALID_EPOCH,
+        )
+
+        # When ALICE tries to call recharge_gauge for non-whitelisted AMM, txn fails
+        scenario += voter.recharge_gauge(epoch=0, amm=Addresses.AMM_2).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+        )
+
+    ###############################
+    # recharge_gauges (valid test)
+    ###############################
+
+    @sp.add_test(name="recharge_gauges mints once and recharges every voted gauge in the registry")
     def test():
         scenario = sp.test_scenario()
 
-        # Initialize dummy vote escrow for ownership checks
-        ve = VE()
+        ply_token = FA12(Addresses.ADMIN)
 
-        # Initialize a dummy fee distributor contract
-        fee_dist = FeeDist()
+        # Initialize dummy gauge contracts for AMM_1 & AMM_2
+        gauge_1 = GaugeBribe()
+        gauge_2 = GaugeBribe()
 
-        # Initialize with some votes for epoch 1
+        # Initialize with 3 registered AMMs and some votes for epoch 1. AMM_3 has no votes.
         voter = Voter(
-            epoch=4,
-            epoch_end=sp.big_map(l={4: sp.timestamp(10)}),
+            epoch=2,
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=1_000_000 * DECIMALS,
+                genesis=2 * WEEK,
+            ),
+            epoch_emission=sp.big_map(l={1: INITIAL_EMISSION}),
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=gauge_1.address, bribe=Addresses.CONTRACT),
+                    Addresses.AMM_2: sp.record(gauge=gauge_2.address, bribe=Addresses.CONTRACT),
+                    Addresses.AMM_3: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            total_amm_votes=sp.big_map(
+                l={
+                    sp.record(epoch=1, amm=Addresses.AMM_1): 100,
+                    sp.record(epoch=1, amm=Addresses.AMM_2): 400,
+                }
+            ),
+            total_epoch_votes=sp.big_map(l={1: 500}),
+            amm_count=3,
+            amm_registry=sp.big_map(l={0: Addresses.AMM_1, 1: Addresses.AMM_2, 2: Addresses.AMM_3}),
+            amm_registry_index=sp.big_map(l={Addresses.AMM_1: 0, Addresses.AMM_2: 1, Addresses.AMM_3: 2}),
+            ply_address=ply_token.address,
+        )
+
+        scenario += gauge_1
+        scenario += gauge_2
+        scenario += voter
+        scenario += ply_token
+
+        # Make voter contract a mint admin
+        scenario += ply_token.addMintAdmin(voter.address).run(sender=Addresses.ADMIN)
+
+        # When all the gauges are recharged for epoch 1 using a page larger than the registry
+        scenario += voter.recharge_gauges(epoch=1, amms=sp.variant("page", sp.record(offset=0, limit=10))).run(
+            sender=Addresses.ALICE
+        )
+
+        # Gauge contracts are called with correct amount values
+        scenario.verify(
+            gauge_1.data.recharge_val.open_some() == sp.record(amount=600_000 * DECIMALS, epoch=1)
+        )  # 0.2 of the real emission
+        scenario.verify(
+            gauge_2.data.recharge_val.open_some() == sp.record(amount=2_400_000 * DECIMALS, epoch=1)
+        )  # 0.8 of the real emission
+
+        # PLY tokens are minted and transferred correctly
+        scenario.verify(ply_token.data.balances[gauge_1.address].balance == 600_000 * DECIMALS)
+        scenario.verify(ply_token.data.balances[gauge_2.address].balance == 2_400_000 * DECIMALS)
+        scenario.verify(ply_token.data.balances[voter.address].balance == 0)
+        scenario.verify(ply_token.data.totalSupply == 3_000_000 * DECIMALS)
+
+    @sp.add_test(name="recharge_gauges does not mint when none of the listed amms received votes")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize with AMM_1 having no votes for epoch 1. PLY address points to no contract.
+        voter = Voter(
+            epoch=2,
+            epoch_emission=sp.big_map(l={1: INITIAL_EMISSION}),
             amm_to_gauge_bribe=sp.big_map(
                 l={
                     Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
                 }
             ),
-            token_amm_votes=sp.big_map(
+            total_epoch_votes=sp.big_map(l={1: 500}),
+        )
+
+        scenario += voter
+
+        # When ALICE recharges AMM_1 for epoch 1, txn goes through without calling mint on PLY
+        scenario += voter.recharge_gauges(epoch=1, amms=sp.variant("amms", [Addresses.AMM_1])).run(
+            sender=Addresses.ALICE
+        )
+
+    #################################
+    # recharge_gauges (failure test)
+    #################################
+
+    @sp.add_test(name="recharge_gauges fails if epoch is in the future or amm is not whitelisted")
+    def test():
+        scenario = sp.test_scenario()
+
+        voter = Voter(
+            epoch=2,
+            amm_to_gauge_bribe=sp.big_map(
                 l={
-                    sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1): 150,
-                    sp.record(token_id=1, epoch=2, amm=Addresses.AMM_1): 250,
-                    sp.record(token_id=1, epoch=3, amm=Addresses.AMM_1): 350,
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            total_epoch_votes=sp.big_map(l={1: 500}),
+        )
+
+        scenario += voter
+
+        # When ALICE tries to call recharge_gauges for current epoch 2, txn fails
+        scenario += voter.recharge_gauges(epoch=2, amms=sp.variant("amms", [Addresses.AMM_1])).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.INVALID_EPOCH,
+        )
+
+        # When ALICE tries to call recharge_gauges with a non-whitelisted AMM, txn fails
+        scenario += voter.recharge_gauges(epoch=1, amms=sp.variant("amms", [Addresses.AMM_2])).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+        )
+
+    #####################################
+    # recharge_gauge_epochs (valid test)
+    #####################################
+
+    @sp.add_test(name="recharge_gauge_epochs recharges a gauge for multiple missed epochs in one call")
+    def test():
+        scenario = sp.test_scenario()
+
+        ply_token = FA12(Addresses.ADMIN)
+
+        # Initialize a dummy gauge contract and set it in the voter for AMM_1
+        gauge = GaugeBribe()
+
+        # Initialize with some votes for epochs 1 & 2, none for AMM_1 in epoch 3 and a lower emission in epoch 2
+        voter = Voter(
+            epoch=4,
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=1_000_000 * DECIMALS,
+                genesis=2 * WEEK,
+            ),
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=gauge.address, bribe=Addresses.CONTRACT),
                 }
             ),
             total_amm_votes=sp.big_map(
                 l={
                     sp.record(epoch=1, amm=Addresses.AMM_1): 250,
-                    sp.record(epoch=2, amm=Addresses.AMM_1): 500,
-                    sp.record(epoch=3, amm=Addresses.AMM_1): 700,
+                    sp.record(epoch=2, amm=Addresses.AMM_1): 100,
                 }
             ),
-            fee_distributor=fee_dist.address,
-            ve_address=ve.address,
+            total_epoch_votes=sp.big_map(l={1: 500, 2: 500, 3: 500}),
+            epoch_emission=sp.big_map(
+                l={
+                    1: INITIAL_EMISSION,
+                    2: 2_000_000 * DECIMALS,
+                    3: 1_000_000 * DECIMALS,
+                }
+            ),
+            ply_address=ply_token.address,
         )
 
-        scenario += ve
-        scenario += fee_dist
+        scenario += gauge
         scenario += voter
+        scenario += ply_token
 
-        # When ALICE calls claim_fee for votes of epochs 1, 2, 3
-        scenario += voter.claim_fee(
-            sp.record(
-                token_id=1,
-                epochs=[1, 2, 3],
-                amm=Addresses.AMM_1,
-            )
-        ).run(sender=Addresses.ALICE)
+        # Make voter contract a mint admin
+        scenario += ply_token.addMintAdmin(voter.address).run(sender=Addresses.ADMIN)
 
-        # Vote share is calculated correctly and FeeDistributor contract is called with correct values
+        # When gauge is recharged for epochs 1, 2 & 3
+        scenario += voter.recharge_gauge_epochs(amm=Addresses.AMM_1, epochs=[1, 2, 3]).run(sender=Addresses.ALICE)
+
+        # Gauge is called once with the amounts of the epochs in which AMM_1 received votes,
+        # each based on the emission recorded for its epoch
         scenario.verify_equal(
-            fee_dist.data.claim_val.open_some(),
-            sp.record(
-                token_id=1,
-                amm=Addresses.AMM_1,
-                owner=Addresses.ALICE,
-                epoch_vote_shares=[
-                    sp.record(epoch=3, share=int(0.5 * VOTE_SHARE_MULTIPLIER)),
-                    sp.record(epoch=2, share=int(0.5 * VOTE_SHARE_MULTIPLIER)),
-                    sp.record(epoch=1, share=int(0.6 * VOTE_SHARE_MULTIPLIER)),
-                ],
+            gauge.data.recharge_many_val.open_some(),
+            [
+                sp.record(amount=1_500_000 * DECIMALS, epoch=1),
+                sp.record(amount=400_000 * DECIMALS, epoch=2),
+            ],
+        )
+
+        # PLY tokens are minted once for the gauge
+        scenario.verify(ply_token.data.balances[gauge.address].balance == 1_900_000 * DECIMALS)
+
+    #######################################
+    # recharge_gauge_epochs (failure test)
+    #######################################
+
+    @sp.add_test(name="recharge_gauge_epochs fails if an epoch is in the future or amm is not whitelisted")
+    def test():
+        scenario = sp.test_scenario()
+
+        voter = Voter(
+            epoch=2,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
             ),
         )
 
-    ############################
-    # claim_fee (failure test)
-    ############################
+        scenario += voter
+
+        # When ALICE tries to recharge for epochs including the ongoing epoch 2, txn fails
+        scenario += voter.recharge_gauge_epochs(amm=Addresses.AMM_1, epochs=[1, 2]).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.INVALID_EPOCH,
+        )
+
+        # When ALICE tries to recharge for non-whitelisted AMM, txn fails
+        scenario += voter.recharge_gauge_epochs(amm=Addresses.AMM_2, epochs=[1]).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+        )
+
+    @sp.add_test(name="gauges cannot be recharged past the retention window and the unminted emission is lost")
+    def test():
+        scenario = sp.test_scenario()
+
+        ply_token = FA12(Addresses.ADMIN)
+
+        # Initialize with the votes of epoch 1 still in storage, but the epoch past the retention window
+        voter = Voter(
+            epoch=VOTE_RETENTION_EPOCHS + 2,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            total_amm_votes=sp.big_map(l={sp.record(epoch=1, amm=Addresses.AMM_1): 250}),
+            total_epoch_votes=sp.big_map(l={1: 500}),
+            epoch_emission=sp.big_map(l={1: INITIAL_EMISSION}),
+            ply_address=ply_token.address,
+        )
+
+        scenario += voter
+        scenario += ply_token
+
+        # Make voter contract a mint admin
+        scenario += ply_token.addMintAdmin(voter.address).run(sender=Addresses.ADMIN)
+
+        # When ALICE tries to recharge AMM_1 for epoch 1 through any of the recharge entrypoints, txn fails
+        scenario += voter.recharge_gauge(epoch=1, amm=Addresses.AMM_1).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.EPOCH_EXPIRED,
+        )
+        scenario += voter.recharge_gauges(epoch=1, amms=sp.variant("amms", [Addresses.AMM_1])).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.EPOCH_EXPIRED,
+        )
+        scenario += voter.recharge_gauge_epochs(amm=Addresses.AMM_1, epochs=[1]).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.EPOCH_EXPIRED,
+        )
+
+        # The share of the epoch 1 emission due to AMM_1 is never minted
+        scenario.verify(ply_token.data.totalSupply == 0)
+
+    ###################################
+    # claim_gauge_rewards (valid test)
+    ###################################
+
+    @sp.add_test(name="claim_gauge_rewards calls get_reward_for in the gauges of all the amms")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize dummy gauge contracts and set them in the voter for AMM_1 & AMM_2
+        gauge_1 = GaugeBribe()
+        gauge_2 = GaugeBribe()
+
+        voter = Voter(
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=gauge_1.address, bribe=Addresses.CONTRACT),
+                    Addresses.AMM_2: sp.record(gauge=gauge_2.address, bribe=Addresses.CONTRACT),
+                }
+            ),
+        )
+
+        scenario += gauge_1
+        scenario += gauge_2
+        scenario += voter
+
+        # When ALICE claims her rewards from the gauges of AMM_1 & AMM_2
+        scenario += voter.claim_gauge_rewards([Addresses.AMM_1, Addresses.AMM_2]).run(sender=Addresses.ALICE)
 
-    @sp.add_test(name="claim_fee fails if epoch is in the future or amm is not whitelisted")
+        # Both gauges are called with ALICE as the owner
+        scenario.verify(gauge_1.data.reward_for_val.open_some() == Addresses.ALICE)
+        scenario.verify(gauge_2.data.reward_for_val.open_some() == Addresses.ALICE)
+
+    #####################################
+    # claim_gauge_rewards (failure test)
+    #####################################
+
+    @sp.add_test(name="claim_gauge_rewards fails if an amm is not whitelisted")
     def test():
         scenario = sp.test_scenario()
 
-        # Initialize dummy vote escrow for ownership checks
-        ve = VE()
-
         voter = Voter(
-            epoch=1,
-            epoch_end=sp.big_map(l={1: sp.timestamp(10)}),
             amm_to_gauge_bribe=sp.big_map(
                 l={
                     Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
                 }
             ),
-            ve_address=ve.address,
         )
 
-        scenario += ve
         scenario += voter
 
-        # When ALICE tries to call claim_fee for future epoch 2, txn fails
-        scenario += voter.claim_fee(sp.record(token_id=1, epochs=[1, 2], amm=Addresses.AMM_1)).run(
-            sender=Addresses.ALICE,
-            valid=False,
-            exception=Errors.INVALID_EPOCH,
-        )
-
-        # When ALICE tries to call claim_fee for non-whitelisted AMM, txn fails
-        scenario += voter.claim_fee(sp.record(token_id=1, epochs=[1], amm=Addresses.AMM_2)).run(
+        # When ALICE claims rewards for non-whitelisted AMM_2, txn fails
+        scenario += voter.claim_gauge_rewards([Addresses.AMM_1, Addresses.AMM_2]).run(
             sender=Addresses.ALICE,
             valid=False,
             exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
         )
 
-    ###########################
-    # claim_bribe (valid test)
-    ###########################
+    ##############################
+    # pull_amm_fee (failure test)
+    ##############################
 
-    @sp.add_test(name="claim_bribe correctly calculates the vote share")
+    @sp.add_test(name="pull_amm_fee fails if epoch is in the future or amm is not whitelisted")
     def test():
         scenario = sp.test_scenario()
 
-        # Initialize dummy vote escrow for ownership checks
-        ve = VE()
-
-        # Initialize a dummy bribe contract and set it in the voter for AMM_1
-        bribe = GaugeBribe()
-
-        # Initialize with some votes for epoch 1
         voter = Voter(
-            epoch=2,
-            epoch_end=sp.big_map(l={2: sp.timestamp(10)}),
+            epoch=1,
             amm_to_gauge_bribe=sp.big_map(
                 l={
-                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=bribe.address),
-                }
-            ),
-            token_amm_votes=sp.big_map(
-                l={
-                    sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1): 150,
-                }
-            ),
-            total_amm_votes=sp.big_map(
-                l={
-                    sp.record(epoch=1, amm=Addresses.AMM_1): 250,
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
                 }
             ),
-            ve_address=ve.address,
         )
 
-        scenario += ve
-        scenario += bribe
         scenario += voter
 
-        # When ALICE calls claim_bribe for epoch 1 votes
-        scenario += voter.claim_bribe(
-            sp.record(
-                token_id=1,
-                epoch=1,
-                amm=Addresses.AMM_1,
-                bribe_id=1,
-            )
-        ).run(sender=Addresses.ALICE)
+        # When ALICE tries to call pull_amm_fee for future epoch 2, txn fails
+        scenario += voter.pull_amm_fee(epoch=2, amm=Addresses.AMM_1).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.INVALID_EPOCH,
+        )
 
-        # Vote share is calculated correctly and bribe contract is called with correct values
-        scenario.verify(
-            bribe.data.claim_val.open_some()
-            == sp.record(
-                token_id=1,
-                epoch=1,
-                owner=Addresses.ALICE,
-                bribe_id=1,
-                vote_share=int(0.6 * VOTE_SHARE_MULTIPLIER),
-            )
+        # When ALICE tries to call pull_amm_fee for non-whitelisted AMM, txn fails
+        scenario += voter.pull_amm_fee(epoch=0, amm=Addresses.AMM_2).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
         )
 
-    @sp.add_test(name="claim_bribe calls return_bribe when total votes for the amm is zero")
+    #############################
+    # pull_amm_fees (valid test)
+    #############################
+
+    @sp.add_test(name="pull_amm_fees calls forwardFee once on each selected amm")
     def test():
         scenario = sp.test_scenario()
 
-        # Initialize dummy vote escrow for ownership checks
-        ve = VE()
-
-        # Initialize a dummy bribe contract and set it in the voter for AMM_1
-        bribe = GaugeBribe()
+        # Initialize dummy AMMs
+        amm_1 = AMM()
+        amm_2 = AMM()
+        amm_3 = AMM()
 
-        # Initialize with no votes for epoch 1
+        # Initialize with the three AMMs whitelisted and registered
         voter = Voter(
-            epoch=2,
-            epoch_end=sp.big_map(l={2: sp.timestamp(10)}),
+            epoch=3,
+            fee_distributor=Addresses.CONTRACT,
             amm_to_gauge_bribe=sp.big_map(
                 l={
-                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=bribe.address),
+                    amm_1.address: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                    amm_2.address: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                    amm_3.address: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
                 }
             ),
-            ve_address=ve.address,
+            amm_count=3,
+            amm_registry=sp.big_map(l={0: amm_1.address, 1: amm_2.address, 2: amm_3.address}),
+            amm_registry_index=sp.big_map(l={amm_1.address: 0, amm_2.address: 1, amm_3.address: 2}),
         )
 
-        scenario += ve
-        scenario += bribe
+        scenario += amm_1
+        scenario += amm_2
+        scenario += amm_3
         scenario += voter
 
-        # When ALICE calls claim_bribe for epoch 1 votes
-        scenario += voter.claim_bribe(
-            sp.record(
-                token_id=1,
-                epoch=1,
-                amm=Addresses.AMM_1,
-                bribe_id=1,
-            )
-        ).run(sender=Addresses.ALICE)
+        # When ALICE pulls the fees of amm_1 & amm_3 for epoch 1
+        scenario += voter.pull_amm_fees(epoch=1, amms=sp.variant("amms", [amm_1.address, amm_3.address])).run(
+            sender=Addresses.ALICE
+        )
 
-        # return_bribe is executed in the bribe contract
-        scenario.verify(bribe.data.return_val.open_some() == sp.record(epoch=1, bribe_id=1))
+        # forwardFee is called once on amm_1 & amm_3 only
+        scenario.verify(amm_1.data.forward_fee_val.open_some() == sp.record(feeDistributor=Addresses.CONTRACT, epoch=1))
+        scenario.verify(amm_3.data.forward_fee_val.open_some() == sp.record(feeDistributor=Addresses.CONTRACT, epoch=1))
+        scenario.verify(amm_1.data.forward_fee_count == 1)
+        scenario.verify(amm_2.data.forward_fee_count == 0)
+        scenario.verify(amm_3.data.forward_fee_count == 1)
 
-    #############################
-    # claim_bribe (failure test)
-    #############################
+        # When ALICE pulls the fees for epoch 2 using a page covering the last two AMMs of the registry
+        scenario += voter.pull_amm_fees(epoch=2, amms=sp.variant("page", sp.record(offset=1, limit=5))).run(
+            sender=Addresses.ALICE
+        )
 
-    @sp.add_test(name="claim_bribe fails if epoch is in the future or amm is not whitelisted")
+        # forwardFee is called once on amm_2 & amm_3 only
+        scenario.verify(amm_2.data.forward_fee_val.open_some() == sp.record(feeDistributor=Addresses.CONTRACT, epoch=2))
+        scenario.verify(amm_3.data.forward_fee_val.open_some() == sp.record(feeDistributor=Addresses.CONTRACT, epoch=2))
+        scenario.verify(amm_1.data.forward_fee_count == 1)
+        scenario.verify(amm_2.data.forward_fee_count == 1)
+        scenario.verify(amm_3.data.forward_fee_count == 2)
+
+    ###############################
+    # pull_amm_fees (failure test)
+    ###############################
+
+    @sp.add_test(name="pull_amm_fees fails if epoch is in the future or amm is not whitelisted")
     def test():
         scenario = sp.test_scenario()
 
         voter = Voter(
             epoch=1,
-            epoch_end=sp.big_map(l={1: sp.timestamp(10)}),
             amm_to_gauge_bribe=sp.big_map(
                 l={
                     Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
@@ -1283,90 +3714,81 @@ if __name__ == "__main__":
 
         scenario += voter
 
-        # When ALICE tries to claim bribe for future epoch 2, txn fails
-        scenario += voter.claim_bribe(token_id=1, epoch=2, amm=Addresses.AMM_1, bribe_id=1).run(
+        # When ALICE tries to call pull_amm_fees for future epoch 2, txn fails
+        scenario += voter.pull_amm_fees(epoch=2, amms=sp.variant("amms", [Addresses.AMM_1])).run(
             sender=Addresses.ALICE,
             valid=False,
             exception=Errors.INVALID_EPOCH,
         )
 
-        # When ALICE tries to claim bribe for non-whitelisted AMM, txn fails
-        scenario += voter.claim_bribe(token_id=1, epoch=0, amm=Addresses.AMM_2, bribe_id=1).run(
+        # When ALICE tries to call pull_amm_fees with a non-whitelisted AMM, txn fails
+        scenario += voter.pull_amm_fees(epoch=0, amms=sp.variant("amms", [Addresses.AMM_1, Addresses.AMM_2])).run(
             sender=Addresses.ALICE,
             valid=False,
             exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
         )
 
-    ##############################
-    # recharge_gauge (valid test)
-    ##############################
+    ###################################
+    # sweep_expired_epoch (valid test)
+    ###################################
 
-    @sp.add_test(name="recharge_gauge correctly calculates the amm vote share and recharges the gauge")
+    @sp.add_test(name="sweep_expired_epoch returns the bribes and sweeps the fees of each selected amm")
     def test():
         scenario = sp.test_scenario()
 
-        ply_token = FA12(Addresses.ADMIN)
-
-        # Initialize a dummy gauge contract and set it in the voter for AMM_1
-        gauge = GaugeBribe()
+        # Initialize dummy bribe contracts and fee distributor
+        bribe_1 = GaugeBribe()
+        bribe_2 = GaugeBribe()
+        fee_dist = FeeDist()
 
-        # Initialize with some votes for epoch 1
         voter = Voter(
-            epoch=2,
-            epoch_end=sp.big_map(l={2: sp.timestamp(10)}),
-            emission=sp.record(
-                base=INITIAL_EMISSION,
-                real=INITIAL_EMISSION,
-                genesis=2 * WEEK,
-            ),
+            epoch=VOTE_RETENTION_EPOCHS + 2,
+            fee_distributor=fee_dist.address,
             amm_to_gauge_bribe=sp.big_map(
                 l={
-                    Addresses.AMM_1: sp.record(gauge=gauge.address, bribe=Addresses.CONTRACT),
-                }
-            ),
-            total_amm_votes=sp.big_map(
-                l={
-                    sp.record(epoch=1, amm=Addresses.AMM_1): 250,
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=bribe_1.address),
+                    Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=bribe_2.address),
                 }
             ),
-            total_epoch_votes=sp.big_map(l={1: 500}),
-            ply_address=ply_token.address,
+            amm_count=2,
+            amm_registry=sp.big_map(l={0: Addresses.AMM_1, 1: Addresses.AMM_2}),
+            amm_registry_index=sp.big_map(l={Addresses.AMM_1: 0, Addresses.AMM_2: 1}),
         )
 
-        scenario += gauge
+        scenario += bribe_1
+        scenario += bribe_2
+        scenario += fee_dist
         scenario += voter
-        scenario += ply_token
 
-        # Make voter contract a mint admin
-        scenario += ply_token.addMintAdmin(voter.address).run(sender=Addresses.ADMIN)
+        # When JOHN sweeps epoch 1 for AMM_1
+        scenario += voter.sweep_expired_epoch(epoch=1, amms=sp.variant("amms", [Addresses.AMM_1])).run(
+            sender=Addresses.JOHN
+        )
 
-        # When gauge is recharged for epoch 1
-        scenario += voter.recharge_gauge(
-            sp.record(
-                epoch=1,
-                amm=Addresses.AMM_1,
-            )
-        ).run(sender=Addresses.ALICE)
+        # The bribes of AMM_1 are returned and its fees swept
+        scenario.verify(bribe_1.data.return_epoch_val.open_some() == 1)
+        scenario.verify(bribe_2.data.return_epoch_val.is_none())
+        scenario.verify(fee_dist.data.sweep_val.open_some() == sp.record(amm=Addresses.AMM_1, epoch=1))
 
-        # AMM's vote share is calculated correctly and gauge contract is called with correct amount value
-        scenario.verify(
-            gauge.data.recharge_val.open_some() == sp.record(amount=1_500_000 * DECIMALS, epoch=1)
-        )  # 0.5 of the real emission
+        # When JOHN sweeps epoch 1 for the second page of amms
+        scenario += voter.sweep_expired_epoch(epoch=1, amms=sp.variant("page", sp.record(offset=1, limit=1))).run(
+            sender=Addresses.JOHN
+        )
 
-        # PLY tokens are minted correctly for gauge
-        scenario.verify(ply_token.data.balances[gauge.address].balance == 1_500_000 * DECIMALS)
+        # The bribes of AMM_2 are returned and its fees swept
+        scenario.verify(bribe_2.data.return_epoch_val.open_some() == 1)
+        scenario.verify(fee_dist.data.sweep_val.open_some() == sp.record(amm=Addresses.AMM_2, epoch=1))
 
-    ################################
-    # recharge_gauge (failure test)
-    ################################
+    #####################################
+    # sweep_expired_epoch (failure test)
+    #####################################
 
-    @sp.add_test(name="recharge_gauge fails if epoch is in the future or amm is not whitelisted")
+    @sp.add_test(name="sweep_expired_epoch fails within the retention window or for an amm not whitelisted")
     def test():
         scenario = sp.test_scenario()
 
         voter = Voter(
-            epoch=1,
-            epoch_end=sp.big_map(l={1: sp.timestamp(10)}),
+            epoch=VOTE_RETENTION_EPOCHS + 2,
             amm_to_gauge_bribe=sp.big_map(
                 l={
                     Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
@@ -1376,52 +3798,157 @@ if __name__ == "__main__":
 
         scenario += voter
 
-        # When ALICE tries to call recharge_gauge for future epoch 2, txn fails
-        scenario += voter.recharge_gauge(epoch=2, amm=Addresses.AMM_1).run(
-            sender=Addresses.ALICE,
+        # When JOHN tries to sweep an epoch whose claims have not expired, txn fails
+        scenario += voter.sweep_expired_epoch(epoch=2, amms=sp.variant("amms", [Addresses.AMM_1])).run(
+            sender=Addresses.JOHN,
             valid=False,
-            exception=Errors.INVALID_EPOCH,
+            exception=Errors.EPOCH_WITHIN_RETENTION,
         )
 
-        # When ALICE tries to call recharge_gauge for non-whitelisted AMM, txn fails
-        scenario += voter.recharge_gauge(epoch=0, amm=Addresses.AMM_2).run(
-            sender=Addresses.ALICE,
+        # When JOHN tries to sweep an amm that is not whitelisted, txn fails
+        scenario += voter.sweep_expired_epoch(epoch=1, amms=sp.variant("amms", [Addresses.AMM_2])).run(
+            sender=Addresses.JOHN,
             valid=False,
             exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
         )
 
-    ##############################
-    # pull_amm_fee (failure test)
-    ##############################
+    ###########################
+    # prune_epoch (valid test)
+    ###########################
 
-    @sp.add_test(name="pull_amm_fee fails if epoch is in the future or amm is not whitelisted")
+    @sp.add_test(name="prune_epoch deletes the vote entries of an epoch older than the retention window")
     def test():
         scenario = sp.test_scenario()
 
+        # Initialize dummy vote escrow for ownership checks
+        ve = VE()
+
+        # Initialize with votes of token 1 & 2 across two AMMs in epoch 1
         voter = Voter(
-            epoch=1,
-            epoch_end=sp.big_map(l={1: sp.timestamp(10)}),
+            epoch=VOTE_RETENTION_EPOCHS + 2,
             amm_to_gauge_bribe=sp.big_map(
                 l={
                     Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                    Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+            token_amm_votes=sp.big_map(
+                l={
+                    sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1): 100,
+                    sp.record(token_id=1, epoch=1, amm=Addresses.AMM_2): 50,
+                    sp.record(token_id=2, epoch=1, amm=Addresses.AMM_2): 150,
+                }
+            ),
+            total_amm_votes=sp.big_map(
+                l={
+                    sp.record(epoch=1, amm=Addresses.AMM_1): 100,
+                    sp.record(epoch=1, amm=Addresses.AMM_2): 200,
+                }
+            ),
+            total_token_votes=sp.big_map(
+                l={
+                    sp.record(token_id=1, epoch=1): 150,
+                    sp.record(token_id=2, epoch=1): 150,
                 }
             ),
+            token_epoch_amms=sp.big_map(
+                l={
+                    sp.record(token_id=1, epoch=1): sp.set([Addresses.AMM_1, Addresses.AMM_2]),
+                    sp.record(token_id=2, epoch=1): sp.set([Addresses.AMM_2]),
+                }
+            ),
+            total_epoch_votes=sp.big_map(l={1: 300}),
+            epoch_emission=sp.big_map(l={1: INITIAL_EMISSION}),
+            ve_address=ve.address,
         )
 
+        scenario += ve
         scenario += voter
 
-        # When ALICE tries to call pull_amm_fee for future epoch 2, txn fails
-        scenario += voter.pull_amm_fee(epoch=2, amm=Addresses.AMM_1).run(
+        # When JOHN prunes token-1 and AMM_1 entries for epoch 1
+        scenario += voter.prune_epoch(epoch=1, token_ids=[1], amms=[Addresses.AMM_1]).run(sender=Addresses.JOHN)
+
+        # Only the requested entries and the epoch totals are deleted
+        scenario.verify(~voter.data.token_amm_votes.contains(sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1)))
+        scenario.verify(~voter.data.token_amm_votes.contains(sp.record(token_id=1, epoch=1, amm=Addresses.AMM_2)))
+        scenario.verify(~voter.data.token_epoch_amms.contains(sp.record(token_id=1, epoch=1)))
+        scenario.verify(~voter.data.total_token_votes.contains(sp.record(token_id=1, epoch=1)))
+        scenario.verify(~voter.data.total_amm_votes.contains(sp.record(epoch=1, amm=Addresses.AMM_1)))
+        scenario.verify(~voter.data.total_epoch_votes.contains(1))
+        scenario.verify(~voter.data.epoch_emission.contains(1))
+        scenario.verify(voter.data.token_amm_votes[sp.record(token_id=2, epoch=1, amm=Addresses.AMM_2)] == 150)
+        scenario.verify(voter.data.total_amm_votes[sp.record(epoch=1, amm=Addresses.AMM_2)] == 200)
+
+        # When JOHN prunes the remaining entries
+        scenario += voter.prune_epoch(epoch=1, token_ids=[2], amms=[Addresses.AMM_2]).run(sender=Addresses.JOHN)
+
+        # No vote entries remain for the epoch
+        scenario.verify(~voter.data.token_amm_votes.contains(sp.record(token_id=2, epoch=1, amm=Addresses.AMM_2)))
+        scenario.verify(~voter.data.token_epoch_amms.contains(sp.record(token_id=2, epoch=1)))
+        scenario.verify(~voter.data.total_token_votes.contains(sp.record(token_id=2, epoch=1)))
+        scenario.verify(~voter.data.total_amm_votes.contains(sp.record(epoch=1, amm=Addresses.AMM_2)))
+
+        # When ALICE claims bribes or fees for token 1 in the pruned epoch, txn fails
+        scenario += voter.claim_bribe(token_id=1, epoch=1, amm=Addresses.AMM_2, bribe_id=1).run(
             sender=Addresses.ALICE,
             valid=False,
-            exception=Errors.INVALID_EPOCH,
+            exception=Errors.EPOCH_EXPIRED,
+        )
+        scenario += voter.claim_epoch_bribes(token_id=1, epoch=1, amm=Addresses.AMM_2).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.EPOCH_EXPIRED,
+        )
+        scenario += voter.claim_bribes(
+            token_id=1,
+            claims=[sp.record(amm=Addresses.AMM_2, epoch=1, bribe_ids=[1])],
+        ).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.EPOCH_EXPIRED,
+        )
+        scenario += voter.claim_fee(token_id=1, amm=Addresses.AMM_1, epochs=[1]).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.EPOCH_EXPIRED,
+        )
+        scenario += voter.claim_fees(token_id=1, amm_epochs={Addresses.AMM_1: [1]}).run(
+            sender=Addresses.ALICE,
+            valid=False,
+            exception=Errors.EPOCH_EXPIRED,
         )
 
-        # When ALICE tries to call pull_amm_fee for non-whitelisted AMM, txn fails
-        scenario += voter.pull_amm_fee(epoch=0, amm=Addresses.AMM_2).run(
+    #############################
+    # prune_epoch (failure test)
+    #############################
+
+    @sp.add_test(name="prune_epoch fails within the retention window and expired epochs cannot be recharged")
+    def test():
+        scenario = sp.test_scenario()
+
+        voter = Voter(
+            epoch=VOTE_RETENTION_EPOCHS + 2,
+            amm_to_gauge_bribe=sp.big_map(
+                l={
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.CONTRACT),
+                }
+            ),
+        )
+
+        scenario += voter
+
+        # When JOHN tries to prune an epoch within the retention window, txn fails
+        scenario += voter.prune_epoch(epoch=2, token_ids=[1], amms=[Addresses.AMM_1]).run(
+            sender=Addresses.JOHN,
+            valid=False,
+            exception=Errors.EPOCH_WITHIN_RETENTION,
+        )
+
+        # When ALICE tries to recharge a gauge for an epoch older than the retention window, txn fails
+        scenario += voter.recharge_gauge(epoch=1, amm=Addresses.AMM_1).run(
             sender=Addresses.ALICE,
             valid=False,
-            exception=Errors.AMM_INVALID_OR_NOT_WHITELISTED,
+            exception=Errors.EPOCH_EXPIRED,
         )
 
     ####################
@@ -1434,11 +3961,21 @@ if __name__ == "__main__":
 
         voter = Voter(
             epoch=sp.nat(2),
-            epoch_end=sp.big_map(
+            emission=sp.record(
+                base=INITIAL_EMISSION,
+                real=1_000_000 * DECIMALS,
+                genesis=5,
+            ),
+            epoch_emission=sp.big_map(l={1: INITIAL_EMISSION}),
+            amm_to_gauge_bribe=sp.big_map(
                 l={
-                    2: sp.timestamp(5),
+                    Addresses.AMM_1: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.TOKEN_1),
+                    Addresses.AMM_2: sp.record(gauge=Addresses.CONTRACT, bribe=Addresses.TOKEN_2),
                 }
             ),
+            amm_count=2,
+            amm_registry=sp.big_map(l={0: Addresses.AMM_1, 1: Addresses.AMM_2}),
+            amm_registry_index=sp.big_map(l={Addresses.AMM_1: 0, Addresses.AMM_2: 1}),
             token_amm_votes=sp.big_map(
                 l={
                     sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1): 150,
@@ -1450,6 +3987,7 @@ if __name__ == "__main__":
                 }
             ),
             total_token_votes=sp.big_map(l={sp.record(epoch=1, token_id=1): 300}),
+            token_epoch_amms=sp.big_map(l={sp.record(epoch=1, token_id=1): sp.set([Addresses.AMM_1])}),
             total_epoch_votes=sp.big_map(
                 l={
                     1: 500,
@@ -1460,10 +3998,50 @@ if __name__ == "__main__":
         scenario += voter
 
         # All views return correct values
-        scenario.verify(voter.get_current_epoch() == (2, sp.timestamp(5)))
+        scenario.verify(voter.get_current_epoch() == (2, sp.timestamp(5 + WEEK)))
+        scenario.verify(voter.get_epoch_end(1) == 5)
         scenario.verify(voter.get_token_amm_votes(sp.record(token_id=1, epoch=1, amm=Addresses.AMM_1)) == 150)
         scenario.verify(voter.get_total_amm_votes(sp.record(epoch=1, amm=Addresses.AMM_1)) == 250)
         scenario.verify(voter.get_total_token_votes(sp.record(epoch=1, token_id=1)) == 300)
+        scenario.verify_equal(voter.get_token_votes(sp.record(epoch=1, token_id=1)), {Addresses.AMM_1: 150})
         scenario.verify(voter.get_total_epoch_votes(1) == 500)
+        scenario.verify_equal(
+            voter.get_epoch_summary(sp.record(epoch=1, offset=0, limit=10)),
+            sp.record(
+                total_votes=500,
+                amms=[
+                    sp.record(
+                        amm=Addresses.AMM_1,
+                        gauge=Addresses.CONTRACT,
+                        bribe=Addresses.TOKEN_1,
+                        votes=250,
+                        share=int(0.5 * VOTE_SHARE_MULTIPLIER),
+                        recharge_amount=1_500_000 * DECIMALS,
+                    ),
+                    sp.record(
+                        amm=Addresses.AMM_2,
+                        gauge=Addresses.CONTRACT,
+                        bribe=Addresses.TOKEN_2,
+                        votes=0,
+                        share=0,
+                        recharge_amount=0,
+                    ),
+                ],
+            ),
+        )
+        scenario.verify(sp.len(voter.get_epoch_summary(sp.record(epoch=1, offset=1, limit=10)).amms) == 1)
+
+    @sp.add_test(name="epoch views return a zero epoch end before the first epoch")
+    def test():
+        scenario = sp.test_scenario()
+
+        # Initialize before next_epoch is called for the first time
+        voter = Voter()
+
+        scenario += voter
+
+        # Epoch 0 has no end
+        scenario.verify(voter.get_current_epoch() == (0, sp.timestamp(0)))
+        scenario.verify(voter.get_epoch_end(0) == 0)
 
     sp.add_compilation_target("voter", Voter())